@@ -1,14 +1,34 @@
 # coding: utf-8
 from __future__ import annotations
 
-from typing import Any, List, Optional
+from typing import Any, Callable, List, Optional, Tuple
 
 
-def quicksort(unsorted_list: List[Any], low: Optional[int] = None, high: Optional[int] = None) -> None:
-    """ Sorts a list in-place using the quicksort algorithm.
+_INSERTION_SORT_CUTOFF = 16
+_NINTHER_THRESHOLD = 128
+
+
+def quicksort(unsorted_list: List[Any],
+              low: Optional[int] = None,
+              high: Optional[int] = None,
+              key: Optional[Callable[[Any], Any]] = None,
+              reverse: bool = False) -> None:
+    """ Sorts a list in-place using introsort, a quicksort that can not degrade to O(n^2).
+
+        Pivots are the median of three elements, or of three medians of three on large ranges, and every
+        partition splits the range three ways so runs of equal elements are settled in one pass. Ranges of
+        at most 16 elements are finished with insertion sort, and a range still being partitioned past a
+        depth of 2 * log2(n) is heapsorted instead, so the sort takes O(n log n) on any input. Ranges are
+        kept on an explicit stack, so no input can hit the recursion limit. Like sorted(), elements are
+        only compared with `<`. The sort is not stable.
 
         Args:
             unsorted_list (List[Any]): The list to sort.
+            low (Optional[int]): The index of the first element to sort, None for the start of the list.
+            high (Optional[int]): The index of the last element to sort, None for the end of the list.
+            key (Optional[Callable[[Any], Any]]): Computes the value to sort each element by, called once per
+                element, None to sort by the elements themselves.
+            reverse (bool): Whether or not to sort in descending order.
     """
     if low is None:
         low = 0
@@ -16,38 +36,261 @@ def quicksort(unsorted_list: List[Any], low: Optional[int] = None, high: Optiona
     if high is None:
         high = len(unsorted_list) - 1
 
-    if low < high:
-        pivot_landing_index = _partition(unsorted_list, low, high)
-        
-        quicksort(unsorted_list, low, pivot_landing_index - 1)
-        quicksort(unsorted_list, pivot_landing_index + 1, high)
+    if low >= high:
+        return
+
+    values = unsorted_list[low:high + 1]
+    keys = [key(value) for value in values] if key is not None else values
+    _introsort(keys, values if key is not None else None)
+
+    if reverse:
+        values.reverse()
+
+    unsorted_list[low:high + 1] = values
+
 
+def _introsort(keys: List[Any], values: Optional[List[Any]]) -> None:
+    """ Sorts keys in-place with introsort, moving values along with them.
+
+        Args:
+            keys (List[Any]): The keys to sort.
+            values (Optional[List[Any]]): The values to move along with their keys, None if there are none.
+    """
+    stack = [(0, len(keys), 2 * (len(keys).bit_length() - 1))]
+    while stack:
+        low, high, depth = stack.pop()
+
+        while high - low > _INSERTION_SORT_CUTOFF:
+            if depth == 0:
+                _heapsort(keys, values, low, high)
+                break
+            depth -= 1
+
+            less, greater = _partition_three_way(keys, values, low, high, _choose_pivot(keys, low, high))
+
+            # Loop on the smaller side, so the stack holds at most log2(n) ranges.
+            if less - low < high - greater:
+                stack.append((greater, high, depth))
+                high = less
+            else:
+                stack.append((low, less, depth))
+                low = greater
+        else:
+            _insertion_sort_range(keys, values, low, high)
 
-def _partition(unsorted_list: List[Any], low: int, high: int) -> int:
-    """ Partitions the list around a pivot value, and returns the index of the pivot value.
+
+def _median_of_three(a: Any, b: Any, c: Any) -> Any:
+    """ Returns the median of three keys.
 
         Args:
-            unsorted_list (List[Any]): The list to partition.
-            low (int): The lower bound of the list to partition.
-            high (int): The upper bound of the list to partition.
+            a (Any): The first key.
+            b (Any): The second key.
+            c (Any): The third key.
 
         Returns:
-            (int) The index of the pivot value.
+            (Any) The median key.
     """
-    pivot = unsorted_list[high]
-    j = low - 1
-    for i in range(low, high):
-        if unsorted_list[i] <= pivot:
-            j += 1
-            temp = unsorted_list[i]
-            unsorted_list[i] = unsorted_list[j]
-            unsorted_list[j] = temp
+    if b < a:
+        a, b = b, a
+    if c < b:
+        b = c
+        if b < a:
+            b = a
+
+    return b
+
+
+def _choose_pivot(keys: List[Any], low: int, high: int) -> Any:
+    """ Chooses a pivot key for a range, the median of its first, middle and last keys, or on large ranges
+        Tukey's ninther, the median of the medians of three spread out groups of three.
+
+        Args:
+            keys (List[Any]): The keys being sorted.
+            low (int): The index of the first key of the range.
+            high (int): The index after the last key of the range.
+
+        Returns:
+            (Any) The pivot key.
+    """
+    last = high - 1
+    middle = (low + last) // 2
+    if high - low <= _NINTHER_THRESHOLD:
+        return _median_of_three(keys[low], keys[middle], keys[last])
+
+    step = (high - low) // 8
+    return _median_of_three(
+        _median_of_three(keys[low], keys[low + step], keys[low + 2 * step]),
+        _median_of_three(keys[middle - step], keys[middle], keys[middle + step]),
+        _median_of_three(keys[last - 2 * step], keys[last - step], keys[last]),
+    )
+
+
+def _partition_three_way(keys: List[Any],
+                         values: Optional[List[Any]],
+                         low: int,
+                         high: int,
+                         pivot: Any) -> Tuple[int, int]:
+    """ Partitions a range into keys less than, equal to and greater than the pivot.
+
+        Uses the Bentley-McIlroy scheme: two Hoare scans swap misplaced keys across the range, parking keys
+        equal to the pivot at both ends as they are met, and the parked keys are swapped into the middle at the
+        end. Distinct keys cost a single comparison on the side they belong to, and about half as many swaps
+        as scanning the range from one end.
+
+        Args:
+            keys (List[Any]): The keys being sorted.
+            values (Optional[List[Any]]): The values to move along with their keys, None if there are none.
+            low (int): The index of the first key of the range.
+            high (int): The index after the last key of the range.
+            pivot (Any): The key to partition around.
+
+        Returns:
+            (Tuple[int, int]) The index of the first key equal to the pivot and the index after the last one.
+    """
+    i = low
+    j = high - 1
+    left_equal = low
+    right_equal = high - 1
+
+    while True:
+        while i <= j:
+            current = keys[i]
+            if pivot < current:
+                break
+            if not current < pivot:
+                keys[i] = keys[left_equal]
+                keys[left_equal] = current
+                if values is not None:
+                    values[i], values[left_equal] = values[left_equal], values[i]
+                left_equal += 1
+            i += 1
+
+        while i <= j:
+            current = keys[j]
+            if current < pivot:
+                break
+            if not pivot < current:
+                keys[j] = keys[right_equal]
+                keys[right_equal] = current
+                if values is not None:
+                    values[j], values[right_equal] = values[right_equal], values[j]
+                right_equal -= 1
+            j -= 1
+
+        if i > j:
+            break
+
+        keys[i], keys[j] = keys[j], keys[i]
+        if values is not None:
+            values[i], values[j] = values[j], values[i]
+        i += 1
+        j -= 1
+
+    # The range is now [equal | less | greater | equal], with i at the first greater key.
+    equal_left = left_equal - low
+    equal_right = high - 1 - right_equal
+    count = min(equal_left, i - left_equal)
+    _swap_blocks(keys, values, low, i - count, count)
+    count = min(equal_right, right_equal - j)
+    _swap_blocks(keys, values, i, high - count, count)
+
+    return i - equal_left, i + equal_right
+
+
+def _swap_blocks(keys: List[Any], values: Optional[List[Any]], first: int, second: int, count: int) -> None:
+    """ Swaps two non-overlapping blocks of the same size with slice assignments.
+
+        Args:
+            keys (List[Any]): The keys being sorted.
+            values (Optional[List[Any]]): The values to move along with their keys, None if there are none.
+            first (int): The index of the first block.
+            second (int): The index of the second block.
+            count (int): The size of the blocks.
+    """
+    if count == 0:
+        return
+
+    keys[first:first + count], keys[second:second + count] = (
+        keys[second:second + count], keys[first:first + count])
+    if values is not None:
+        values[first:first + count], values[second:second + count] = (
+            values[second:second + count], values[first:first + count])
+
+
+def _insertion_sort_range(keys: List[Any], values: Optional[List[Any]], low: int, high: int) -> None:
+    """ Sorts a small range in-place with insertion sort.
+
+        Args:
+            keys (List[Any]): The keys being sorted.
+            values (Optional[List[Any]]): The values to move along with their keys, None if there are none.
+            low (int): The index of the first key of the range.
+            high (int): The index after the last key of the range.
+    """
+    for i in range(low + 1, high):
+        current = keys[i]
+        if not current < keys[i - 1]:
+            continue
+
+        current_value = values[i] if values is not None else None
+        j = i - 1
+        while j >= low and current < keys[j]:
+            keys[j + 1] = keys[j]
+            if values is not None:
+                values[j + 1] = values[j]
+            j -= 1
+
+        keys[j + 1] = current
+        if values is not None:
+            values[j + 1] = current_value
+
+
+def _heapsort(keys: List[Any], values: Optional[List[Any]], low: int, high: int) -> None:
+    """ Sorts a range in-place with heapsort, in O(n log n) whatever the order of the keys.
+
+        Args:
+            keys (List[Any]): The keys being sorted.
+            values (Optional[List[Any]]): The values to move along with their keys, None if there are none.
+            low (int): The index of the first key of the range.
+            high (int): The index after the last key of the range.
+    """
+    size = high - low
+    for start in reversed(range(size // 2)):
+        _sift_down(keys, values, low, start, size)
+
+    for end in range(size - 1, 0, -1):
+        keys[low], keys[low + end] = keys[low + end], keys[low]
+        if values is not None:
+            values[low], values[low + end] = values[low + end], values[low]
+        _sift_down(keys, values, low, 0, end)
+
+
+def _sift_down(keys: List[Any], values: Optional[List[Any]], offset: int, index: int, size: int) -> None:
+    """ Moves a key down a max heap stored at offset until it is not less than its children.
+
+        Args:
+            keys (List[Any]): The keys being sorted.
+            values (Optional[List[Any]]): The values to move along with their keys, None if there are none.
+            offset (int): The index of the root of the heap.
+            index (int): The index in the heap of the key to move.
+            size (int): The size of the heap.
+    """
+    while True:
+        child = 2 * index + 1
+        if child >= size:
+            return
+
+        if child + 1 < size and keys[offset + child] < keys[offset + child + 1]:
+            child += 1
+
+        if not keys[offset + index] < keys[offset + child]:
+            return
 
-    j += 1
-    unsorted_list[high] = unsorted_list[j]
-    unsorted_list[j] = pivot
+        parent, child = offset + index, offset + child
+        keys[parent], keys[child] = keys[child], keys[parent]
+        if values is not None:
+            values[parent], values[child] = values[child], values[parent]
 
-    return j
+        index = child - offset
 
 
 def mergesort(unsorted_list: List[Any]) -> List[Any]:
@@ -1,10 +1,45 @@
 # coding: utf-8
-from .binary_tree import BinaryTree
+from .binary_tree import AVLTree, BinaryTree, RedBlackTree
+from .compact_binary_tree import CompactBinaryTree
+from .compact_trie import FrozenTrie, RadixTrie
 from .dynamic_array import DynamicArray
-from .queue import FrontMiddleBackQueue
-from .linked_list import SinglyLinkedList
-from .stack import MaxStack, MinStack
-from .trie import Trie
+from .heap import DaryHeap, HeapHandle, IndexedMaxHeap, IndexedMinHeap, MaxHeap, MinHeap, PairingHeap
+from .queue import (AsyncFrontMiddleBackQueue, ConcurrentFrontMiddleBackQueue, FrontMiddleBackQueue, MinMaxQueue,
+                    RingBufferQueue, sliding_window_extrema)
+from .linked_list import DoublyLinkedList, SinglyLinkedList, UnrolledLinkedList
+from .skip_list import SkipList
+from .stack import MaxStack, MinMaxStack, MinStack
+from .trie import AhoCorasick, Trie
 
 
-__all__ = ['BinaryTree', 'DynamicArray', 'FrontMiddleBackQueue', 'SinglyLinkedList', 'MaxStack', 'MinStack', 'Trie']
+__all__ = [
+    'AVLTree',
+    'AhoCorasick',
+    'AsyncFrontMiddleBackQueue',
+    'BinaryTree',
+    'CompactBinaryTree',
+    'ConcurrentFrontMiddleBackQueue',
+    'DaryHeap',
+    'DoublyLinkedList',
+    'DynamicArray',
+    'FrontMiddleBackQueue',
+    'FrozenTrie',
+    'HeapHandle',
+    'IndexedMaxHeap',
+    'IndexedMinHeap',
+    'MaxHeap',
+    'MaxStack',
+    'MinHeap',
+    'MinMaxQueue',
+    'MinMaxStack',
+    'MinStack',
+    'PairingHeap',
+    'RadixTrie',
+    'RedBlackTree',
+    'RingBufferQueue',
+    'SinglyLinkedList',
+    'SkipList',
+    'Trie',
+    'UnrolledLinkedList',
+    'sliding_window_extrema',
+]
@@ -1,99 +1,337 @@
 from __future__ import annotations
 
-from typing import Generic, List, Optional, Set, TypeVar
+from abc import ABC, abstractmethod
+from collections import deque
+from operator import attrgetter
+from typing import Any, Callable, Deque, Generic, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+
+__all__ = [
+    'AVLTree',
+    'BinaryTree',
+    'RedBlackTree',
+]
 
 
 T = TypeVar('T')
 
 
-class BinaryTree(Generic[T]):
-    """ Binary tree implementation.
-    
+class _BinaryTreeBase(ABC, Generic[T]):
+    """ Queries and traversals shared by the binary search trees, written once over a node access interface.
+
+        Subclasses decide how nodes are stored, as node objects or as indices into parallel columns, and
+        expose them through `_accessors` and `_node_repr`. A missing node must be falsy and every node
+        truthy, so walks test nodes directly. The accessors are returned as one tuple so every walk binds
+        them to locals once, and are expected to be C level callables such as `operator.attrgetter` or a
+        bound `__getitem__`, which cost no python frame per call, though still more than reading a field
+        inline.
+
         Attributes:
-            _root (Optional[BinaryTree.Node]): Root node of tree.
+            _root (Any): Root node of tree, or a falsy missing node if tree is empty.
+            _size (int): Number of values in tree.
     """
 
-    class Node:
-        """ Node class for BinaryTree.
-
-            Attributes:
-                value (T): Value of node.
-                left (Optional[BinaryTree.Node]): Left node of current node.
-                right (Optional[BinaryTree.Node]): Right node of current node.
-        """
-        value: T
-        left: Optional[BinaryTree.Node]
-        right: Optional[BinaryTree.Node]
+    _root: Any
+    _size: int
 
-        def __init__(self, value: BinaryTree.Node) -> None:
-            self.value = value
-            self.left = None
-            self.right = None
+    @abstractmethod
+    def _accessors(self) -> Tuple[Callable[[Any], T], Callable[[Any], Any], Callable[[Any], Any], Callable[[Any], int]]:
+        """ Functions reading the fields of a node.
 
-        def __repr__(self) -> str:
-            """ String representation of node. """
-            left = self.left.value if self.left else None
-            right = self.right.value if self.right else None
-            return f'<Node value={self.value} left={left} right={right}>'       
+            Returns:
+                Tuple[Callable, Callable, Callable, Callable]: Functions returning the value, left child, right
+                    child and subtree size of a node.
+        """
 
-    _root: Optional[Node]
+    @abstractmethod
+    def _node_repr(self, node: Any) -> str:
+        """ String representation of node.
 
-    def __init__(self):
-        self._root = None
+            Args:
+                node (Any): Node to represent.
+        """
 
     def __str__(self) -> str:
-        """ String representation of BinaryTree. """
-        return f'BinaryTree ({self.__repr__()})'
+        """ String representation of tree. """
+        return f'{type(self).__name__} ({self.__repr__()})'
 
     def __repr__(self) -> str:
-        """ String representation of BinaryTree. """
+        """ String representation of tree. """
         return str(self.in_order_traversal())
 
-    def _insert(self, value: T, node: BinaryTree.Node) -> None:
-        """ Insert value into tree helper function.
-        
+    def __len__(self) -> int:
+        """ Number of values in tree. """
+        return self._size
+
+    def __iter__(self) -> Iterator[T]:
+        """ Iterator over tree in order. """
+        return self.iter_in_order()
+
+    def __contains__(self, value: T) -> bool:
+        """ Whether or not value is in tree. """
+        return self.search(value)
+
+    def _find(self, value: T) -> Any:
+        """ Find a node holding value.
+
             Args:
-                value (T): Value to insert into tree.
-                node (BinaryTree.Node): Node to insert value into.
+                value (T): Value to find.
+
+            Returns:
+                Any: Node holding value, or a falsy missing node if value is not in tree.
         """
-        if node.value >= value:
-            if node.left is None:
-                node.left = BinaryTree.Node(value)
+        get_value, get_left, get_right, _ = self._accessors()
+
+        node = self._root
+        while node:
+            node_value = get_value(node)
+            if value < node_value:
+                node = get_left(node)
+            elif value > node_value:
+                node = get_right(node)
             else:
-                self._insert(value, node=node.left)
-        else:
-            if node.right is None:
-                node.right = BinaryTree.Node(value)
+                return node
+
+        return node
+
+    def search(self, value: T) -> bool:
+        """ Search for value in tree.
+
+            Args:
+                value (T): Value to search for.
+
+            Returns:
+                bool: Whether or not value is in tree.
+        """
+        return bool(self._find(value))
+
+    def min(self) -> T:
+        """ Smallest value in tree.
+
+            Raises:
+                IndexError: If tree is empty.
+
+            Returns:
+                T: Smallest value in tree.
+        """
+        return self._extreme(leftmost=True)
+
+    def max(self) -> T:
+        """ Largest value in tree.
+
+            Raises:
+                IndexError: If tree is empty.
+
+            Returns:
+                T: Largest value in tree.
+        """
+        return self._extreme(leftmost=False)
+
+    def _extreme(self, leftmost: bool) -> T:
+        """ Value of the leftmost or rightmost node of tree.
+
+            Args:
+                leftmost (bool): Whether to follow left children, or right children.
+
+            Raises:
+                IndexError: If tree is empty.
+        """
+        if not self._root:
+            raise IndexError('Tree is empty.')
+
+        get_value, get_left, get_right, _ = self._accessors()
+        get_child = get_left if leftmost else get_right
+
+        node = self._root
+        child = get_child(node)
+        while child:
+            node = child
+            child = get_child(node)
+
+        return get_value(node)
+
+    def floor(self, value: T) -> Optional[T]:
+        """ Largest value in tree less than or equal to value.
+
+            Args:
+                value (T): Value to find the floor of.
+
+            Returns:
+                Optional[T]: Floor of value, or None if every value in tree is larger.
+        """
+        get_value, get_left, get_right, _ = self._accessors()
+        floor: Optional[T] = None
+
+        node = self._root
+        while node:
+            node_value = get_value(node)
+            if node_value == value:
+                return node_value
+            elif node_value < value:
+                floor = node_value
+                node = get_right(node)
             else:
-                self._insert(value, node=node.right)
+                node = get_left(node)
+
+        return floor
+
+    def ceiling(self, value: T) -> Optional[T]:
+        """ Smallest value in tree greater than or equal to value.
 
-    def insert(self, value: T) -> None:
-        """ Insert value into tree.
-        
             Args:
-                value (T): Value to insert into tree.
+                value (T): Value to find the ceiling of.
+
+            Returns:
+                Optional[T]: Ceiling of value, or None if every value in tree is smaller.
         """
-        if self._root is None:
-            self._root = BinaryTree.Node(value)
-        else:
-            self._insert(value, self._root)
+        get_value, get_left, get_right, _ = self._accessors()
+        ceiling: Optional[T] = None
+
+        node = self._root
+        while node:
+            node_value = get_value(node)
+            if node_value == value:
+                return node_value
+            elif node_value > value:
+                ceiling = node_value
+                node = get_left(node)
+            else:
+                node = get_right(node)
+
+        return ceiling
+
+    def select(self, k: int) -> T:
+        """ The k-th smallest value in tree, counting from 0.
+
+            Runs in O(height), which is O(log n) for `AVLTree` and `RedBlackTree`.
 
-    def _in_order_traversal(self, node: Optional[BinaryTree.Node]) -> List[T]:
-        """ In order traversal helper function.
-        
             Args:
-                node (Optional[BinaryTree.Node]): Node to traverse from.
+                k (int): Number of values in tree smaller than the value to select.
+
+            Raises:
+                IndexError: If k is out of bounds.
+
+            Returns:
+                T: The k-th smallest value in tree.
         """
-        if node is None:
-            return []
+        if not 0 <= k < self._size:
+            raise IndexError('Index not accessible')
 
-        traversed_tree = []
+        get_value, get_left, get_right, get_size = self._accessors()
 
-        traversed_tree.extend(self._in_order_traversal(node.left))
-        traversed_tree.append(node.value)
-        traversed_tree.extend(self._in_order_traversal(node.right))
+        node = self._root
+        while True:
+            left = get_left(node)
+            left_size = get_size(left) if left else 0
+            if k < left_size:
+                node = left
+            elif k > left_size:
+                k -= left_size + 1
+                node = get_right(node)
+            else:
+                return get_value(node)
 
-        return traversed_tree
+    def _rank(self, value: T, inclusive: bool) -> int:
+        """ Number of values in tree less than value, or less than or equal to value if inclusive.
+
+            Args:
+                value (T): Value to rank.
+                inclusive (bool): Whether or not to count values equal to value.
+        """
+        get_value, get_left, get_right, get_size = self._accessors()
+        rank = 0
+
+        node = self._root
+        while node:
+            node_value = get_value(node)
+            if node_value < value or (inclusive and node_value == value):
+                left = get_left(node)
+                rank += (get_size(left) if left else 0) + 1
+                node = get_right(node)
+            else:
+                node = get_left(node)
+
+        return rank
+
+    def rank(self, value: T) -> int:
+        """ Number of values in tree strictly less than value, in O(height).
+
+            Args:
+                value (T): Value to rank, which does not have to be in tree.
+
+            Returns:
+                int: Rank of value, so `select(rank(value)) == value` when value is in tree.
+        """
+        return self._rank(value, inclusive=False)
+
+    def count_range(self, low: T, high: T) -> int:
+        """ Number of values in tree between low and high inclusive, in O(height).
+
+            Args:
+                low (T): Lower bound of range.
+                high (T): Upper bound of range.
+
+            Returns:
+                int: Number of values in range.
+        """
+        if high < low:
+            return 0
+
+        return self._rank(high, inclusive=True) - self._rank(low, inclusive=False)
+
+    def range(self, low: T, high: T) -> Iterator[T]:
+        """ Lazily iterate in order over values between low and high inclusive.
+
+            Subtrees outside of the range are skipped, so the walk costs O(height + output).
+
+            Args:
+                low (T): Lower bound of range.
+                high (T): Upper bound of range.
+
+            Yields:
+                T: Values in range in sorted order.
+        """
+        get_value, get_left, get_right, _ = self._accessors()
+        stack: List[Any] = []
+
+        node = self._root
+        while True:
+            while node:
+                if get_value(node) < low:
+                    node = get_right(node)
+                else:
+                    stack.append(node)
+                    node = get_left(node)
+
+            if not stack:
+                return
+
+            node = stack.pop()
+            node_value = get_value(node)
+            if node_value > high:
+                return
+
+            yield node_value
+            node = get_right(node)
+
+    def iter_in_order(self) -> Iterator[T]:
+        """ Lazily iterate over tree in order, using O(height) memory.
+
+            Yields:
+                T: Values of tree in sorted order.
+        """
+        get_value, get_left, get_right, _ = self._accessors()
+        stack: List[Any] = []
+
+        node = self._root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = get_left(node)
+
+            node = stack.pop()
+            yield get_value(node)
+            node = get_right(node)
 
     def in_order_traversal(self) -> List[T]:
         """ In order traversal of tree.
@@ -113,22 +351,29 @@ class BinaryTree(Generic[T]):
             Returns:
                 List[T]: In order traversal of tree.
         """
-        return self._in_order_traversal(self._root)
+        return list(self.iter_in_order())
 
-    def _pre_order_traversal(self, node: Optional[BinaryTree.Node]) -> List[T]:
-        """ Pre order traversal helper function.
+    def iter_pre_order(self) -> Iterator[T]:
+        """ Lazily iterate over tree in pre order, using O(height) memory.
 
-            Args:
-                node (Optional[BinaryTree.Node]): Node to traverse from.
+            Yields:
+                T: Values of tree, each node before its children.
         """
-        if node is None:
-            return []
+        get_value, get_left, get_right, _ = self._accessors()
+        stack: List[Any] = []
+        if self._root:
+            stack.append(self._root)
 
-        traversed_tree = [node.value]
-        traversed_tree.extend(self._pre_order_traversal(node.left))
-        traversed_tree.extend(self._pre_order_traversal(node.right))
+        while stack:
+            node = stack.pop()
+            yield get_value(node)
 
-        return traversed_tree
+            right = get_right(node)
+            if right:
+                stack.append(right)
+            left = get_left(node)
+            if left:
+                stack.append(left)
 
     def pre_order_traversal(self) -> List[T]:
         """ Pre order traversal of tree.
@@ -148,24 +393,33 @@ class BinaryTree(Generic[T]):
             Returns:
                 List[T]: Pre order traversal of tree.    
         """
-        return self._pre_order_traversal(self._root)
+        return list(self.iter_pre_order())
 
-    def _post_order_traversal(self, node: Optional[BinaryTree.Node]) -> List[T]:
-        """ Post order traversal helper function.
-        
-            Args:
-                node (Optional[BinaryTree.Node]): Node to traverse from.
-        """
-        if node is None:
-            return []
+    def iter_post_order(self) -> Iterator[T]:
+        """ Lazily iterate over tree in post order, using O(height) memory.
 
-        traversed_tree = []
+            Yields:
+                T: Values of tree, each node after its children.
+        """
+        get_value, get_left, get_right, _ = self._accessors()
+        stack: List[Any] = []
+        last_visited = None
 
-        traversed_tree.extend(self._post_order_traversal(node.left))
-        traversed_tree.extend(self._post_order_traversal(node.right))
-        traversed_tree.append(node.value)
+        node = self._root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = get_left(node)
 
-        return traversed_tree
+            top = stack[-1]
+            right = get_right(top)
+            # Right subtree still has to be walked before the node itself
+            if right and right != last_visited:
+                node = right
+            else:
+                stack.pop()
+                yield get_value(top)
+                last_visited = top
 
     def post_order_traversal(self) -> List[T]:    
         """ Post order traversal of tree.
@@ -181,8 +435,11 @@ class BinaryTree(Generic[T]):
                 >>> tree.insert(8)
                 >>> tree.post_order_traversal()
                 [2, 4, 3, 6, 8, 7, 5]
+
+            Returns:
+                List[T]: Post order traversal of tree.
         """
-        return self._post_order_traversal(self._root)
+        return list(self.iter_post_order())
 
     def breadth_first_search(self, log_visit_step: bool = False) -> List[T]:
         """ Breadth first search of tree.
@@ -205,24 +462,29 @@ class BinaryTree(Generic[T]):
             Returns:
                 List[T]: Breadth first search of tree.
         """
-        visited: Set[BinaryTree.Node] = set()
-        queue: List[BinaryTree.Node] = []
+        get_value, get_left, get_right, _ = self._accessors()
+        traversed_tree: List[T] = []
+        queue: Deque[Any] = deque()
+        if self._root:
+            queue.append(self._root)
 
-        queue.append(self._root)
-        while len(queue) > 0:
-            current_location = queue.pop(0)
-            visited.add(current_location)
+        # Every node has exactly one parent, so no visited set is needed to avoid revisiting nodes
+        while queue:
+            current_location = queue.popleft()
+            traversed_tree.append(get_value(current_location))
 
             if log_visit_step:
-                print('Currently At: ', current_location)
+                print('Currently At: ', self._node_repr(current_location))
 
-            if current_location.left is not None and current_location.left not in visited and current_location.left not in queue:
-                queue.append(current_location.left)
-            
-            if current_location.right is not None and current_location.right not in visited and current_location.right not in queue:
-                queue.append(current_location.right)
+            left = get_left(current_location)
+            if left:
+                queue.append(left)
 
-        return [node.value for node in visited]
+            right = get_right(current_location)
+            if right:
+                queue.append(right)
+
+        return traversed_tree
 
     def depth_first_search(self, log_visit_step: bool = False) -> List[T]:
         """ Depth first search of tree.
@@ -237,7 +499,7 @@ class BinaryTree(Generic[T]):
                 >>> tree.insert(6)
                 >>> tree.insert(8)
                 >>> tree.depth_first_search()
-                [5, 3, 7, 2, 4, 6, 8]
+                [5, 3, 2, 4, 7, 6, 8]
 
             Args:
                 log_visit_step (bool): Whether or not to log the current node being visited.
@@ -245,21 +507,1088 @@ class BinaryTree(Generic[T]):
             Returns:
                 List[T]: Depth first search of tree.
         """
-        visited: Set[BinaryTree.Node] = set()
-        stack: List[BinaryTree.Node] = []
+        get_value, get_left, get_right, _ = self._accessors()
+        traversed_tree: List[T] = []
+        stack: List[Any] = []
+        if self._root:
+            stack.append(self._root)
 
-        stack.append(self._root)
-        while len(stack) > 0:
-            current_location = stack.pop(-1)
-            visited.add(current_location)
+        while stack:
+            current_location = stack.pop()
+            traversed_tree.append(get_value(current_location))
 
             if log_visit_step:
-                print('Currently At: ', current_location)
+                print('Currently At: ', self._node_repr(current_location))
 
-            if current_location.left is not None and current_location.left not in visited and current_location.left not in stack:
-                stack.append(current_location.left)
-            
-            if current_location.right is not None and current_location.right not in visited and current_location.right not in stack:
-                stack.append(current_location.right)
+            # Right is pushed first so the left subtree is explored first
+            right = get_right(current_location)
+            if right:
+                stack.append(right)
+
+            left = get_left(current_location)
+            if left:
+                stack.append(left)
+
+        return traversed_tree
+
+    def iter_levels(self) -> Iterator[List[T]]:
+        """ Lazily iterate over tree one level at a time.
+
+            Yields:
+                List[T]: Values of each level of tree, from left to right.
+        """
+        get_value = self._accessors()[0]
+        for level in self._iter_node_levels():
+            yield list(map(get_value, level))
+
+    def _iter_node_levels(self) -> Iterator[Deque[Any]]:
+        """ Iterate over the nodes of tree one level at a time.
+
+            Yields:
+                Deque[Any]: Nodes of each level. The same deque is refilled with the next level, so it has to
+                    be consumed before advancing.
+        """
+        _, get_left, get_right, _ = self._accessors()
+        level: Deque[Any] = deque()
+        if self._root:
+            level.append(self._root)
+
+        while level:
+            yield level
+
+            for _ in range(len(level)):
+                node = level.popleft()
+                left = get_left(node)
+                if left:
+                    level.append(left)
+                right = get_right(node)
+                if right:
+                    level.append(right)
+
+
+class BinaryTree(_BinaryTreeBase[T]):
+    """ Binary tree implementation.
+
+        The lookups, order statistics and traversals of `_BinaryTreeBase` are overridden to read node fields
+        directly, which is about twice as fast as going through the accessors.
+    
+        Attributes:
+            _root (Optional[BinaryTree.Node]): Root node of tree.
+            _size (int): Number of values in tree.
+    """
+
+    class Node:
+        """ Node class for BinaryTree.
+
+            Attributes:
+                value (T): Value of node.
+                left (Optional[BinaryTree.Node]): Left node of current node.
+                right (Optional[BinaryTree.Node]): Right node of current node.
+                size (int): Number of nodes in the subtree rooted at the node.
+        """
+        __slots__ = ('value', 'left', 'right', 'size')
+
+        value: T
+        left: Optional[BinaryTree.Node]
+        right: Optional[BinaryTree.Node]
+        size: int
+
+        def __init__(self, value: BinaryTree.Node) -> None:
+            self.value = value
+            self.left = None
+            self.right = None
+            self.size = 1
+
+        def __repr__(self) -> str:
+            """ String representation of node. """
+            left = self.left.value if self.left else None
+            right = self.right.value if self.right else None
+            return f'<Node value={self.value} left={left} right={right}>'       
+
+    _root: Optional[Node]
+    _size: int
+
+    _NODE_ACCESSORS = (attrgetter('value'), attrgetter('left'), attrgetter('right'), attrgetter('size'))
+
+    def __init__(self):
+        self._root = None
+        self._size = 0
+
+    @classmethod
+    def from_iterable(cls, values: Iterable[T], presorted: bool = False) -> BinaryTree[T]:
+        """ Build a perfectly balanced tree from values in O(n) after sorting.
+
+            Much faster than inserting the values one at a time, since no value is compared
+            against the tree while it is built.
+
+            Example:
+                >>> tree = BinaryTree.from_iterable([2, 8, 4, 6, 3, 5, 7])
+                >>> tree.pre_order_traversal()
+                [5, 3, 2, 4, 7, 6, 8]
+
+            Args:
+                values (Iterable[T]): Values to build tree from.
+                presorted (bool): Whether or not values are already in sorted order, which skips sorting.
+                    A presorted sequence is read in place instead of copied.
+
+            Returns:
+                BinaryTree[T]: Tree holding values.
+        """
+        if presorted and isinstance(values, Sequence):
+            ordered = values
+        else:
+            ordered = list(values)
+            if not presorted:
+                ordered.sort()
+
+        tree = cls()
+        tree._root = tree._build(ordered, 0, len(ordered) - 1)
+        tree._size = len(ordered)
+
+        return tree
+
+    def _build(self, values: Sequence[T], low: int, high: int) -> Optional[BinaryTree.Node]:
+        """ Build balanced subtree from sorted values helper function.
+
+            Args:
+                values (Sequence[T]): Sorted values to build subtree from.
+                low (int): Index of smallest value of subtree.
+                high (int): Index of largest value of subtree.
+
+            Returns:
+                Optional[BinaryTree.Node]: Root of subtree.
+        """
+        if low > high:
+            return None
+
+        middle = low + (high - low) // 2
+
+        node = self.Node(values[middle])
+        node.left = self._build(values, low, middle - 1)
+        node.right = self._build(values, middle + 1, high)
+        self._update(node)
+
+        return node
+
+    def insert(self, value: T) -> None:
+        """ Insert value into tree.
+
+            The tree is not rebalanced, so sorted input degrades it into a linked list. Use
+            `AVLTree` or `RedBlackTree` when the insertion order is not random.
+        
+            Args:
+                value (T): Value to insert into tree.
+        """
+        new_node = BinaryTree.Node(value)
+        self._size += 1
+
+        if self._root is None:
+            self._root = new_node
+            return
+
+        node = self._root
+        while True:
+            node.size += 1
+            if node.value >= value:
+                if node.left is None:
+                    node.left = new_node
+                    return
+                node = node.left
+            else:
+                if node.right is None:
+                    node.right = new_node
+                    return
+                node = node.right
+
+    def delete(self, value: T) -> None:
+        """ Delete one occurrence of value from tree.
+
+            Args:
+                value (T): Value to delete from tree.
+
+            Raises:
+                IndexError: If value is not in tree.
+        """
+        path: List[BinaryTree.Node] = []
+        node = self._root
+        while node is not None and node.value != value:
+            path.append(node)
+            node = node.left if value < node.value else node.right
+
+        if node is None:
+            raise IndexError(f'No element of value {value}')
+
+        # Node with two children takes the value of its in order successor, which is then removed instead
+        if node.left is not None and node.right is not None:
+            path.append(node)
+            successor = node.right
+            while successor.left is not None:
+                path.append(successor)
+                successor = successor.left
+
+            node.value = successor.value
+            node = successor
+
+        for ancestor in path:
+            ancestor.size -= 1
+
+        parent = path[-1] if path else None
+        child = node.left if node.left is not None else node.right
+        if parent is None:
+            self._root = child
+        elif parent.left is node:
+            parent.left = child
+        else:
+            parent.right = child
+
+        self._size -= 1
+
+    @staticmethod
+    def _subtree_size(node: Optional[BinaryTree.Node]) -> int:
+        """ Number of nodes in subtree, where an empty subtree has size 0.
+
+            Args:
+                node (Optional[BinaryTree.Node]): Root of subtree.
+        """
+        return node.size if node is not None else 0
+
+    def _update(self, node: BinaryTree.Node) -> None:
+        """ Recompute the cached size of node from its children.
+
+            Args:
+                node (BinaryTree.Node): Node to update.
+        """
+        node.size = 1 + self._subtree_size(node.left) + self._subtree_size(node.right)
+
+    def _accessors(self) -> Tuple[Callable[[Any], T], Callable[[Any], Any], Callable[[Any], Any], Callable[[Any], int]]:
+        """ Functions reading the value, left child, right child and subtree size of a node. """
+        return self._NODE_ACCESSORS
+
+    def _find(self, value: T) -> Optional[BinaryTree.Node]:
+        """ Find a node holding value.
+
+            Args:
+                value (T): Value to find.
+
+            Returns:
+                Optional[BinaryTree.Node]: Node holding value, or None if value is not in tree.
+        """
+        node = self._root
+        while node is not None:
+            if value < node.value:
+                node = node.left
+            elif value > node.value:
+                node = node.right
+            else:
+                return node
+
+        return None
+
+    def floor(self, value: T) -> Optional[T]:
+        """ Largest value in tree less than or equal to value.
+
+            Args:
+                value (T): Value to find the floor of.
+
+            Returns:
+                Optional[T]: Floor of value, or None if every value in tree is larger.
+        """
+        floor: Optional[T] = None
+
+        node = self._root
+        while node is not None:
+            if node.value == value:
+                return node.value
+            elif node.value < value:
+                floor = node.value
+                node = node.right
+            else:
+                node = node.left
+
+        return floor
+
+    def ceiling(self, value: T) -> Optional[T]:
+        """ Smallest value in tree greater than or equal to value.
+
+            Args:
+                value (T): Value to find the ceiling of.
+
+            Returns:
+                Optional[T]: Ceiling of value, or None if every value in tree is smaller.
+        """
+        ceiling: Optional[T] = None
+
+        node = self._root
+        while node is not None:
+            if node.value == value:
+                return node.value
+            elif node.value > value:
+                ceiling = node.value
+                node = node.left
+            else:
+                node = node.right
+
+        return ceiling
+
+    def select(self, k: int) -> T:
+        """ The k-th smallest value in tree, counting from 0.
+
+            Runs in O(height), which is O(log n) for `AVLTree` and `RedBlackTree`.
+
+            Args:
+                k (int): Number of values in tree smaller than the value to select.
+
+            Raises:
+                IndexError: If k is out of bounds.
+
+            Returns:
+                T: The k-th smallest value in tree.
+        """
+        if not 0 <= k < self._size:
+            raise IndexError('Index not accessible')
+
+        node = self._root
+        while True:
+            left_size = self._subtree_size(node.left)
+            if k < left_size:
+                node = node.left
+            elif k > left_size:
+                k -= left_size + 1
+                node = node.right
+            else:
+                return node.value
+
+    def _rank(self, value: T, inclusive: bool) -> int:
+        """ Number of values in tree less than value, or less than or equal to value if inclusive.
+
+            Args:
+                value (T): Value to rank.
+                inclusive (bool): Whether or not to count values equal to value.
+        """
+        rank = 0
+
+        node = self._root
+        while node is not None:
+            if node.value < value or (inclusive and node.value == value):
+                rank += self._subtree_size(node.left) + 1
+                node = node.right
+            else:
+                node = node.left
+
+        return rank
+
+    def range(self, low: T, high: T) -> Iterator[T]:
+        """ Lazily iterate in order over values between low and high inclusive.
+
+            Subtrees outside of the range are skipped, so the walk costs O(height + output).
+
+            Example:
+                >>> tree = BinaryTree()
+                >>> for value in [5, 3, 7, 2, 4, 6, 8]:
+                ...     tree.insert(value)
+                >>> list(tree.range(3, 6))
+                [3, 4, 5, 6]
+
+            Args:
+                low (T): Lower bound of range.
+                high (T): Upper bound of range.
+
+            Yields:
+                T: Values in range in sorted order.
+        """
+        stack: List[BinaryTree.Node] = []
+
+        node = self._root
+        while True:
+            while node is not None:
+                if node.value < low:
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+
+            if not stack:
+                return
+
+            node = stack.pop()
+            if node.value > high:
+                return
+
+            yield node.value
+            node = node.right
+
+    def iter_in_order(self) -> Iterator[T]:
+        """ Lazily iterate over tree in order, using O(height) memory.
+
+            Example:
+                >>> tree = BinaryTree()
+                >>> tree.insert(5)
+                >>> tree.insert(3)
+                >>> tree.insert(7)
+                >>> tree.insert(2)
+                >>> tree.insert(4)
+                >>> tree.insert(6)
+                >>> tree.insert(8)
+                >>> next(tree.iter_in_order())
+                2
+
+            Yields:
+                T: Values of tree in sorted order.
+        """
+        stack: List[BinaryTree.Node] = []
+
+        node = self._root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+
+            node = stack.pop()
+            yield node.value
+            node = node.right
+
+    def iter_pre_order(self) -> Iterator[T]:
+        """ Lazily iterate over tree in pre order, using O(height) memory.
+
+            Yields:
+                T: Values of tree, each node before its children.
+        """
+        stack: List[BinaryTree.Node] = []
+        if self._root is not None:
+            stack.append(self._root)
+
+        while stack:
+            node = stack.pop()
+            yield node.value
+
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
+
+    def iter_post_order(self) -> Iterator[T]:
+        """ Lazily iterate over tree in post order, using O(height) memory.
+
+            Yields:
+                T: Values of tree, each node after its children.
+        """
+        stack: List[BinaryTree.Node] = []
+        last_visited: Optional[BinaryTree.Node] = None
+
+        node = self._root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+
+            top = stack[-1]
+            # Right subtree still has to be walked before the node itself
+            if top.right is not None and top.right is not last_visited:
+                node = top.right
+            else:
+                stack.pop()
+                yield top.value
+                last_visited = top
+
+    def breadth_first_search(self, log_visit_step: bool = False) -> List[T]:
+        """ Breadth first search of tree.
+
+            Example:
+                >>> tree = BinaryTree()
+                >>> tree.insert(5)
+                >>> tree.insert(3)
+                >>> tree.insert(7)
+                >>> tree.insert(2)
+                >>> tree.insert(4)
+                >>> tree.insert(6)
+                >>> tree.insert(8)
+                >>> tree.breadth_first_search()
+                [5, 3, 7, 2, 4, 6, 8]
+            
+            Args:
+                log_visit_step (bool): Whether or not to log the current node being visited.
+            
+            Returns:
+                List[T]: Breadth first search of tree.
+        """
+        traversed_tree: List[T] = []
+        queue: Deque[BinaryTree.Node] = deque()
+        if self._root is not None:
+            queue.append(self._root)
+
+        # Every node has exactly one parent, so no visited set is needed to avoid revisiting nodes
+        while queue:
+            current_location = queue.popleft()
+            traversed_tree.append(current_location.value)
+
+            if log_visit_step:
+                print('Currently At: ', current_location)
+
+            if current_location.left is not None:
+                queue.append(current_location.left)
+            
+            if current_location.right is not None:
+                queue.append(current_location.right)
+
+        return traversed_tree
+
+    def depth_first_search(self, log_visit_step: bool = False) -> List[T]:
+        """ Depth first search of tree.
+
+            Example:
+                >>> tree = BinaryTree()
+                >>> tree.insert(5)
+                >>> tree.insert(3)
+                >>> tree.insert(7)
+                >>> tree.insert(2)
+                >>> tree.insert(4)
+                >>> tree.insert(6)
+                >>> tree.insert(8)
+                >>> tree.depth_first_search()
+                [5, 3, 2, 4, 7, 6, 8]
+
+            Args:
+                log_visit_step (bool): Whether or not to log the current node being visited.
+                
+            Returns:
+                List[T]: Depth first search of tree.
+        """
+        traversed_tree: List[T] = []
+        stack: Deque[BinaryTree.Node] = deque()
+        if self._root is not None:
+            stack.append(self._root)
+
+        while stack:
+            current_location = stack.pop()
+            traversed_tree.append(current_location.value)
+
+            if log_visit_step:
+                print('Currently At: ', current_location)
+
+            # Right is pushed first so the left subtree is explored first
+            if current_location.right is not None:
+                stack.append(current_location.right)
+
+            if current_location.left is not None:
+                stack.append(current_location.left)
+
+        return traversed_tree
+
+    def iter_levels(self) -> Iterator[List[T]]:
+        """ Lazily iterate over tree one level at a time.
+
+            Example:
+                >>> tree = BinaryTree()
+                >>> tree.insert(5)
+                >>> tree.insert(3)
+                >>> tree.insert(7)
+                >>> tree.insert(2)
+                >>> tree.insert(4)
+                >>> tree.insert(6)
+                >>> tree.insert(8)
+                >>> list(tree.iter_levels())
+                [[5], [3, 7], [2, 4, 6, 8]]
+
+            Yields:
+                List[T]: Values of each level of tree, from left to right.
+        """
+        for level in self._iter_node_levels():
+            yield [node.value for node in level]
+
+    def _iter_node_levels(self) -> Iterator[Deque[BinaryTree.Node]]:
+        """ Iterate over the nodes of tree one level at a time.
+
+            Yields:
+                Deque[BinaryTree.Node]: Nodes of each level. The same deque is refilled with the next level,
+                    so it has to be consumed before advancing.
+        """
+        level: Deque[BinaryTree.Node] = deque()
+        if self._root is not None:
+            level.append(self._root)
+
+        while level:
+            yield level
+
+            for _ in range(len(level)):
+                node = level.popleft()
+                if node.left is not None:
+                    level.append(node.left)
+                if node.right is not None:
+                    level.append(node.right)
+
+    def _node_repr(self, node: BinaryTree.Node) -> str:
+        """ String representation of node.
+
+            Args:
+                node (BinaryTree.Node): Node to represent.
+        """
+        return repr(node)
+
+
+class AVLTree(BinaryTree[T]):
+    """ Self-balancing binary tree keeping the heights of sibling subtrees within one of each other.
+
+        Lookups are slightly faster than `RedBlackTree` because the tree is more strictly balanced,
+        at the cost of more rotations on insert and delete.
+
+        Attributes:
+            _root (Optional[AVLTree.Node]): Root node of tree.
+    """
+
+    class Node(BinaryTree.Node):
+        """ Node class for AVLTree.
+
+            Attributes:
+                value (T): Value of node.
+                left (Optional[AVLTree.Node]): Left node of current node.
+                right (Optional[AVLTree.Node]): Right node of current node.
+                height (int): Height of the subtree rooted at the node.
+        """
+        __slots__ = ('height',)
+
+        height: int
+
+        def __init__(self, value: T) -> None:
+            super().__init__(value)
+            self.height = 1
+
+    @staticmethod
+    def _height(node: Optional[AVLTree.Node]) -> int:
+        """ Height of subtree, where an empty subtree has height 0.
+
+            Args:
+                node (Optional[AVLTree.Node]): Root of subtree.
+        """
+        return node.height if node is not None else 0
+
+    def _update(self, node: AVLTree.Node) -> None:
+        """ Recompute the cached height and size of node from its children.
+
+            Args:
+                node (AVLTree.Node): Node to update.
+        """
+        node.height = 1 + max(self._height(node.left), self._height(node.right))
+        node.size = 1 + self._subtree_size(node.left) + self._subtree_size(node.right)
+
+    def _rotate_left(self, node: AVLTree.Node) -> AVLTree.Node:
+        """ Rotate subtree left, returning the new root of the subtree.
+
+            Args:
+                node (AVLTree.Node): Root of subtree to rotate.
+        """
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+
+        self._update(node)
+        self._update(pivot)
+
+        return pivot
+
+    def _rotate_right(self, node: AVLTree.Node) -> AVLTree.Node:
+        """ Rotate subtree right, returning the new root of the subtree.
+
+            Args:
+                node (AVLTree.Node): Root of subtree to rotate.
+        """
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+
+        self._update(node)
+        self._update(pivot)
+
+        return pivot
+
+    def _rebalance(self, node: AVLTree.Node) -> AVLTree.Node:
+        """ Restore the AVL invariant at node, returning the new root of the subtree.
+
+            Args:
+                node (AVLTree.Node): Root of subtree to rebalance.
+        """
+        self._update(node)
+        balance = self._height(node.left) - self._height(node.right)
+
+        if balance > 1:
+            if self._height(node.left.left) < self._height(node.left.right):
+                node.left = self._rotate_left(node.left)
+            return self._rotate_right(node)
+
+        if balance < -1:
+            if self._height(node.right.right) < self._height(node.right.left):
+                node.right = self._rotate_right(node.right)
+            return self._rotate_left(node)
+
+        return node
+
+    def _insert(self, value: T, node: Optional[AVLTree.Node]) -> AVLTree.Node:
+        """ Insert value into tree helper function.
+
+            Args:
+                value (T): Value to insert into tree.
+                node (Optional[AVLTree.Node]): Root of subtree to insert value into.
+
+            Returns:
+                AVLTree.Node: New root of subtree.
+        """
+        if node is None:
+            return AVLTree.Node(value)
+
+        if node.value >= value:
+            node.left = self._insert(value, node.left)
+        else:
+            node.right = self._insert(value, node.right)
+
+        return self._rebalance(node)
+
+    def insert(self, value: T) -> None:
+        """ Insert value into tree in O(log n).
+
+            Args:
+                value (T): Value to insert into tree.
+        """
+        self._root = self._insert(value, self._root)
+        self._size += 1
+
+    def _delete_min(self, node: AVLTree.Node) -> Optional[AVLTree.Node]:
+        """ Delete the smallest node of subtree, returning the new root of the subtree.
+
+            Args:
+                node (AVLTree.Node): Root of subtree.
+        """
+        if node.left is None:
+            return node.right
+
+        node.left = self._delete_min(node.left)
+
+        return self._rebalance(node)
+
+    def _delete(self, value: T, node: AVLTree.Node) -> Optional[AVLTree.Node]:
+        """ Delete value from tree helper function.
+
+            Args:
+                value (T): Value to delete from tree, which must be in the subtree.
+                node (AVLTree.Node): Root of subtree to delete value from.
+
+            Returns:
+                Optional[AVLTree.Node]: New root of subtree.
+        """
+        if value < node.value:
+            node.left = self._delete(value, node.left)
+        elif value > node.value:
+            node.right = self._delete(value, node.right)
+        else:
+            if node.left is None:
+                return node.right
+            if node.right is None:
+                return node.left
+
+            successor = node.right
+            while successor.left is not None:
+                successor = successor.left
+
+            node.value = successor.value
+            node.right = self._delete_min(node.right)
+
+        return self._rebalance(node)
+
+    def delete(self, value: T) -> None:
+        """ Delete one occurrence of value from tree in O(log n).
+
+            Args:
+                value (T): Value to delete from tree.
+
+            Raises:
+                IndexError: If value is not in tree.
+        """
+        if self._find(value) is None:
+            raise IndexError(f'No element of value {value}')
+
+        self._root = self._delete(value, self._root)
+        self._size -= 1
+
+
+class RedBlackTree(BinaryTree[T]):
+    """ Self-balancing binary tree colouring nodes red or black so no path is twice as long as another.
+
+        Inserts and deletes need at most a constant number of rotations, making it cheaper than
+        `AVLTree` for write heavy workloads.
+
+        Attributes:
+            _root (Optional[RedBlackTree.Node]): Root node of tree.
+    """
+
+    class Node(BinaryTree.Node):
+        """ Node class for RedBlackTree.
+
+            Attributes:
+                value (T): Value of node.
+                left (Optional[RedBlackTree.Node]): Left node of current node.
+                right (Optional[RedBlackTree.Node]): Right node of current node.
+                parent (Optional[RedBlackTree.Node]): Parent node of current node.
+                red (bool): Whether the node is red, otherwise it is black.
+        """
+        __slots__ = ('parent', 'red')
+
+        parent: Optional[RedBlackTree.Node]
+        red: bool
+
+        def __init__(self, value: T) -> None:
+            super().__init__(value)
+            self.parent = None
+            self.red = True
+
+    @classmethod
+    def from_iterable(cls, values: Iterable[T], presorted: bool = False) -> RedBlackTree[T]:
+        """ Build a perfectly balanced tree from values in O(n) after sorting.
+
+            Every level is black except for the deepest one, which is red unless it is the root,
+            so each path holds the same number of black nodes.
+
+            Args:
+                values (Iterable[T]): Values to build tree from.
+                presorted (bool): Whether or not values are already in sorted order, which skips sorting.
+
+            Returns:
+                RedBlackTree[T]: Tree holding values.
+        """
+        tree = super().from_iterable(values, presorted=presorted)
+        deepest_level = len(tree).bit_length() - 1
+
+        for depth, level in enumerate(tree._iter_node_levels()):
+            for node in level:
+                node.red = 0 < depth == deepest_level
+                for child in (node.left, node.right):
+                    if child is not None:
+                        child.parent = node
+
+        return tree
+
+    @staticmethod
+    def _is_red(node: Optional[RedBlackTree.Node]) -> bool:
+        """ Whether node is red, where empty nodes are black.
+
+            Args:
+                node (Optional[RedBlackTree.Node]): Node to check.
+        """
+        return node is not None and node.red
+
+    def _replace_child(self,
+                       parent: Optional[RedBlackTree.Node],
+                       old: RedBlackTree.Node,
+                       new: Optional[RedBlackTree.Node]) -> None:
+        """ Point the link from parent to old at new instead.
+
+            Args:
+                parent (Optional[RedBlackTree.Node]): Parent of old, or None if old is the root.
+                old (RedBlackTree.Node): Current child.
+                new (Optional[RedBlackTree.Node]): Replacement child.
+        """
+        if new is not None:
+            new.parent = parent
+
+        if parent is None:
+            self._root = new
+        elif parent.left is old:
+            parent.left = new
+        else:
+            parent.right = new
+
+    def _rotate_left(self, node: RedBlackTree.Node) -> None:
+        """ Rotate subtree rooted at node left.
+
+            Args:
+                node (RedBlackTree.Node): Root of subtree to rotate.
+        """
+        pivot = node.right
+        node.right = pivot.left
+        if pivot.left is not None:
+            pivot.left.parent = node
+
+        self._replace_child(node.parent, node, pivot)
+        pivot.left = node
+        node.parent = pivot
+
+        pivot.size = node.size
+        node.size = 1 + self._subtree_size(node.left) + self._subtree_size(node.right)
+
+    def _rotate_right(self, node: RedBlackTree.Node) -> None:
+        """ Rotate subtree rooted at node right.
+
+            Args:
+                node (RedBlackTree.Node): Root of subtree to rotate.
+        """
+        pivot = node.left
+        node.left = pivot.right
+        if pivot.right is not None:
+            pivot.right.parent = node
+
+        self._replace_child(node.parent, node, pivot)
+        pivot.right = node
+        node.parent = pivot
+
+        pivot.size = node.size
+        node.size = 1 + self._subtree_size(node.left) + self._subtree_size(node.right)
+
+    def insert(self, value: T) -> None:
+        """ Insert value into tree in O(log n).
+
+            Args:
+                value (T): Value to insert into tree.
+        """
+        parent: Optional[RedBlackTree.Node] = None
+        node = self._root
+        while node is not None:
+            parent = node
+            parent.size += 1
+            node = node.left if node.value >= value else node.right
+
+        new_node = RedBlackTree.Node(value)
+        new_node.parent = parent
+        if parent is None:
+            self._root = new_node
+        elif parent.value >= value:
+            parent.left = new_node
+        else:
+            parent.right = new_node
+
+        self._size += 1
+        self._insert_fixup(new_node)
+
+    def _insert_fixup(self, node: RedBlackTree.Node) -> None:
+        """ Restore the red-black invariants after inserting a red node.
+
+            Args:
+                node (RedBlackTree.Node): Node that was inserted.
+        """
+        while self._is_red(node.parent):
+            parent = node.parent
+            grandparent = parent.parent
+
+            if parent is grandparent.left:
+                uncle = grandparent.right
+                if self._is_red(uncle):
+                    parent.red = uncle.red = False
+                    grandparent.red = True
+                    node = grandparent
+                    continue
+
+                if node is parent.right:
+                    self._rotate_left(parent)
+                    node, parent = parent, node
+
+                parent.red = False
+                grandparent.red = True
+                self._rotate_right(grandparent)
+            else:
+                uncle = grandparent.left
+                if self._is_red(uncle):
+                    parent.red = uncle.red = False
+                    grandparent.red = True
+                    node = grandparent
+                    continue
+
+                if node is parent.left:
+                    self._rotate_right(parent)
+                    node, parent = parent, node
+
+                parent.red = False
+                grandparent.red = True
+                self._rotate_left(grandparent)
+
+        self._root.red = False
+
+    def delete(self, value: T) -> None:
+        """ Delete one occurrence of value from tree in O(log n).
+
+            Args:
+                value (T): Value to delete from tree.
+
+            Raises:
+                IndexError: If value is not in tree.
+        """
+        node = self._find(value)
+        if node is None:
+            raise IndexError(f'No element of value {value}')
+
+        # Node with two children takes the value of its in order successor, which is then removed instead
+        if node.left is not None and node.right is not None:
+            successor = node.right
+            while successor.left is not None:
+                successor = successor.left
+
+            node.value = successor.value
+            node = successor
+
+        child = node.left if node.left is not None else node.right
+        parent = node.parent
+        self._replace_child(parent, node, child)
+        self._size -= 1
+
+        ancestor = parent
+        while ancestor is not None:
+            ancestor.size -= 1
+            ancestor = ancestor.parent
+
+        if not node.red:
+            self._delete_fixup(child, parent)
+
+    def _delete_fixup(self, node: Optional[RedBlackTree.Node], parent: Optional[RedBlackTree.Node]) -> None:
+        """ Restore the red-black invariants after removing a black node.
+
+            Args:
+                node (Optional[RedBlackTree.Node]): Node that took the place of the removed node.
+                parent (Optional[RedBlackTree.Node]): Parent of node.
+        """
+        while node is not self._root and not self._is_red(node):
+            if node is parent.left:
+                sibling = parent.right
+                if sibling.red:
+                    sibling.red = False
+                    parent.red = True
+                    self._rotate_left(parent)
+                    sibling = parent.right
+
+                if not self._is_red(sibling.left) and not self._is_red(sibling.right):
+                    sibling.red = True
+                    node, parent = parent, parent.parent
+                    continue
+
+                if not self._is_red(sibling.right):
+                    sibling.left.red = False
+                    sibling.red = True
+                    self._rotate_right(sibling)
+                    sibling = parent.right
+
+                sibling.red = parent.red
+                parent.red = False
+                sibling.right.red = False
+                self._rotate_left(parent)
+            else:
+                sibling = parent.left
+                if sibling.red:
+                    sibling.red = False
+                    parent.red = True
+                    self._rotate_right(parent)
+                    sibling = parent.left
+
+                if not self._is_red(sibling.left) and not self._is_red(sibling.right):
+                    sibling.red = True
+                    node, parent = parent, parent.parent
+                    continue
+
+                if not self._is_red(sibling.left):
+                    sibling.right.red = False
+                    sibling.red = True
+                    self._rotate_left(sibling)
+                    sibling = parent.left
+
+                sibling.red = parent.red
+                parent.red = False
+                sibling.left.red = False
+                self._rotate_right(parent)
+
+            node = self._root
 
-        return [node.value for node in visited]
+        if node is not None:
+            node.red = False
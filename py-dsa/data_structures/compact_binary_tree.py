@@ -0,0 +1,251 @@
+# coding: utf-8
+
+from __future__ import annotations
+
+from array import array
+from typing import Callable, Iterable, List, MutableSequence, Optional, Sequence, Tuple, TypeVar
+
+from .binary_tree import _BinaryTreeBase
+
+
+__all__ = [
+    'CompactBinaryTree',
+]
+
+
+T = TypeVar('T')
+
+# Slot 0 is a sentinel standing in for a missing node, so that missing nodes are falsy like None
+_NIL = 0
+
+
+class CompactBinaryTree(_BinaryTreeBase[T]):
+    """ Binary tree storing its nodes as parallel columns instead of node objects.
+
+        Node `i` is described by `_values[i]`, `_left[i]`, `_right[i]` and `_sizes[i]`, where children
+        are indices into the same columns and `0` marks a missing child, with slot 0 reserved for it.
+        Links are packed into 4 byte `array` slots, and passing a `typecode` packs the values too, so a
+        tree of floats costs about 20 bytes per value instead of the 64 bytes of a `BinaryTree.Node` plus
+        24 bytes for its boxed value.
+
+        Slots of deleted nodes are chained into a free list through `_left` and reused by later inserts.
+        Queries and traversals are shared with `BinaryTree` through `_BinaryTreeBase`, which reads the
+        columns through their `__getitem__`.
+
+        Attributes:
+            _values (MutableSequence[T]): Value of each node.
+            _left (array): Index of the left child of each node.
+            _right (array): Index of the right child of each node.
+            _sizes (array): Number of nodes in the subtree rooted at each node.
+            _root (int): Index of root node, or 0 if tree is empty.
+            _free (int): Index of the first free slot, or 0 if every slot is in use.
+            _size (int): Number of values in tree.
+            _typecode (Optional[str]): Typecode of the `array` holding values, or None to hold them in a list.
+    """
+
+    _values: MutableSequence[T]
+    _left: array
+    _right: array
+    _sizes: array
+    _root: int
+    _free: int
+    _size: int
+    _typecode: Optional[str]
+
+    def __init__(self, typecode: Optional[str] = None):
+        """ Initializes an empty tree.
+
+            Args:
+                typecode (Optional[str]): `array` typecode of the values, such as 'q' or 'd'. When None,
+                    values can be any comparable python object.
+        """
+        self._typecode = typecode
+        self._values = array(typecode, [0]) if typecode is not None else [None]
+        self._left = array('i', [_NIL])
+        self._right = array('i', [_NIL])
+        self._sizes = array('i', [0])
+        self._root = _NIL
+        self._free = _NIL
+        self._size = 0
+
+    @classmethod
+    def from_iterable(cls,
+                      values: Iterable[T],
+                      presorted: bool = False,
+                      typecode: Optional[str] = None) -> CompactBinaryTree[T]:
+        """ Build a perfectly balanced tree from values in O(n) after sorting.
+
+            Nodes are laid out in sorted order after the sentinel, so node `i` holds the i-th smallest value
+            counting from 1.
+
+            Args:
+                values (Iterable[T]): Values to build tree from.
+                presorted (bool): Whether or not values are already in sorted order, which skips sorting.
+                typecode (Optional[str]): `array` typecode of the values.
+
+            Returns:
+                CompactBinaryTree[T]: Tree holding values.
+        """
+        if presorted and isinstance(values, Sequence):
+            ordered = values
+        else:
+            ordered = list(values)
+            if not presorted:
+                ordered.sort()
+
+        tree = cls(typecode=typecode)
+        n = len(ordered)
+        tree._values.extend(ordered)
+        tree._left = array('i', [_NIL]) * (n + 1)
+        tree._right = array('i', [_NIL]) * (n + 1)
+        tree._sizes = array('i', [0]) * (n + 1)
+        tree._root = tree._build(1, n)
+        tree._size = n
+
+        return tree
+
+    def _build(self, low: int, high: int) -> int:
+        """ Link the nodes between low and high into a balanced subtree helper function.
+
+            Args:
+                low (int): Index of smallest node of subtree.
+                high (int): Index of largest node of subtree.
+
+            Returns:
+                int: Index of root of subtree.
+        """
+        if low > high:
+            return _NIL
+
+        middle = low + (high - low) // 2
+        self._left[middle] = self._build(low, middle - 1)
+        self._right[middle] = self._build(middle + 1, high)
+        self._sizes[middle] = high - low + 1
+
+        return middle
+
+    def _accessors(self) -> Tuple[Callable[[int], T], Callable[[int], int], Callable[[int], int], Callable[[int], int]]:
+        """ Functions reading the value, left child, right child and subtree size of a node. """
+        return self._values.__getitem__, self._left.__getitem__, self._right.__getitem__, self._sizes.__getitem__
+
+    def _node_repr(self, node: int) -> str:
+        """ String representation of node.
+
+            Args:
+                node (int): Index of node.
+        """
+        left = self._values[self._left[node]] if self._left[node] != _NIL else None
+        right = self._values[self._right[node]] if self._right[node] != _NIL else None
+        return f'<Node value={self._values[node]} left={left} right={right}>'
+
+    def _allocate(self, value: T) -> int:
+        """ Store value in a free slot, growing the columns when none is free.
+
+            Args:
+                value (T): Value of the new node.
+
+            Returns:
+                int: Index of the new node.
+        """
+        node = self._free
+        if node == _NIL:
+            self._values.append(value)
+            self._left.append(_NIL)
+            self._right.append(_NIL)
+            self._sizes.append(1)
+            return len(self._sizes) - 1
+
+        self._free = self._left[node]
+        self._values[node] = value
+        self._left[node] = _NIL
+        self._right[node] = _NIL
+        self._sizes[node] = 1
+
+        return node
+
+    def _release(self, node: int) -> None:
+        """ Push the slot of a removed node onto the free list.
+
+            Args:
+                node (int): Index of removed node.
+        """
+        if self._typecode is None:
+            # Drop the reference so the value can be garbage collected
+            self._values[node] = None
+
+        self._left[node] = self._free
+        self._free = node
+
+    def insert(self, value: T) -> None:
+        """ Insert value into tree.
+
+            Args:
+                value (T): Value to insert into tree.
+        """
+        new_node = self._allocate(value)
+        self._size += 1
+
+        if self._root == _NIL:
+            self._root = new_node
+            return
+
+        values, left, right, sizes = self._values, self._left, self._right, self._sizes
+
+        node = self._root
+        while True:
+            sizes[node] += 1
+            if values[node] >= value:
+                if left[node] == _NIL:
+                    left[node] = new_node
+                    return
+                node = left[node]
+            else:
+                if right[node] == _NIL:
+                    right[node] = new_node
+                    return
+                node = right[node]
+
+    def delete(self, value: T) -> None:
+        """ Delete one occurrence of value from tree.
+
+            Args:
+                value (T): Value to delete from tree.
+
+            Raises:
+                IndexError: If value is not in tree.
+        """
+        values, left, right, sizes = self._values, self._left, self._right, self._sizes
+
+        path: List[int] = []
+        node = self._root
+        while node != _NIL and values[node] != value:
+            path.append(node)
+            node = left[node] if value < values[node] else right[node]
+
+        if node == _NIL:
+            raise IndexError(f'No element of value {value}')
+
+        # Node with two children takes the value of its in order successor, which is then removed instead
+        if left[node] != _NIL and right[node] != _NIL:
+            path.append(node)
+            successor = right[node]
+            while left[successor] != _NIL:
+                path.append(successor)
+                successor = left[successor]
+
+            values[node] = values[successor]
+            node = successor
+
+        for ancestor in path:
+            sizes[ancestor] -= 1
+
+        child = left[node] if left[node] != _NIL else right[node]
+        if not path:
+            self._root = child
+        elif left[path[-1]] == node:
+            left[path[-1]] = child
+        else:
+            right[path[-1]] = child
+
+        self._release(node)
+        self._size -= 1
@@ -0,0 +1,552 @@
+# coding: utf-8
+
+from __future__ import annotations
+
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+
+__all__ = [
+    'FrozenTrie',
+    'RadixTrie',
+]
+
+
+class _RadixNode:
+    """ A node in a radix trie.
+
+        Attributes:
+            label (str): The label of the edge leading into the node.
+            children (Optional[Dict[str, _RadixNode]]): The children of the node keyed by the first letter of
+                their label, or None if the node has none.
+            is_word (bool): Whether or not the node represents a word.
+    """
+    __slots__ = ('label', 'children', 'is_word')
+
+    label: str
+    children: Optional[Dict[str, _RadixNode]]
+    is_word: bool
+
+    def __init__(self, label: str, is_word: bool = False):
+        self.label = label
+        self.children = None
+        self.is_word = is_word
+
+
+class RadixTrie:
+    """ A radix (Patricia) trie, which merges chains of single-child nodes into one node whose edge label
+        holds the whole chain.
+
+        A plain `Trie` allocates a dictionary per letter, while a radix trie allocates a slotted node per
+        branch point, and leaves own no dictionary at all. Lookups compare whole labels with
+        `str.startswith` instead of stepping through one dictionary per letter.
+
+        Private Attributes:
+            _root (_RadixNode): The root of the trie, with an empty label.
+            _size (int): The number of words in the trie.
+
+        Methods:
+            insert: Inserts a word into the trie.
+            search: Searches for a word in the trie.
+            starts_with: Searches for a prefix in the trie.
+            freeze: Packs the trie into an immutable FrozenTrie.
+    """
+
+    def __init__(self, words: Optional[Iterable[str]] = None):
+        """ Initializes the trie.
+
+            Args:
+                words (Optional[Iterable[str]]): Words to fill the trie with.
+        """
+        self._root = _RadixNode('')
+        self._size = 0
+
+        if words is not None:
+            for word in words:
+                self.insert(word)
+
+    def insert(self, word: str) -> None:
+        """ Inserts a word into the trie, splitting the edge where the word leaves an existing label.
+
+            Args:
+                word (str): The word to insert.
+        """
+        node = self._root
+        i = 0
+        length = len(word)
+
+        while i < length:
+            if node.children is None:
+                node.children = {}
+
+            child = node.children.get(word[i])
+            if child is None:
+                node.children[word[i]] = _RadixNode(word[i:], True)
+                self._size += 1
+                return
+
+            label = child.label
+            if word.startswith(label, i):
+                node = child
+                i += len(label)
+                continue
+
+            common = 1
+            limit = min(len(label), length - i)
+            while common < limit and label[common] == word[i + common]:
+                common += 1
+
+            split = _RadixNode(label[:common])
+            split.children = {label[common]: child}
+            child.label = label[common:]
+            node.children[word[i]] = split
+
+            node = split
+            i += common
+
+        if not node.is_word:
+            node.is_word = True
+            self._size += 1
+
+    def search(self, word: str) -> bool:
+        """ Searches for a word in the trie.
+
+            Args:
+                word (str): The word to search for.
+
+            Returns:
+                (bool) Whether or not the word is in the trie.
+        """
+        node = self._root
+        i = 0
+
+        while i < len(word):
+            child = node.children.get(word[i]) if node.children is not None else None
+            if child is None or not word.startswith(child.label, i):
+                return False
+
+            node = child
+            i += len(child.label)
+
+        return node.is_word
+
+    def starts_with(self, prefix: str) -> bool:
+        """ Searches for a prefix in the trie.
+
+            Args:
+                prefix (str): The prefix to search for.
+
+            Returns:
+                (bool) Whether or not the prefix is in the trie.
+        """
+        node = self._root
+        i = 0
+
+        while i < len(prefix):
+            child = node.children.get(prefix[i]) if node.children is not None else None
+            if child is None:
+                return False
+
+            if not prefix.startswith(child.label, i):
+                return child.label.startswith(prefix[i:])
+
+            node = child
+            i += len(child.label)
+
+        return True
+
+    def freeze(self) -> FrozenTrie:
+        """ Packs the words of the trie into an immutable FrozenTrie.
+
+            Returns:
+                (FrozenTrie) The packed trie.
+        """
+        return FrozenTrie(self)
+
+    def __iter__(self) -> Iterator[str]:
+        """ Iterator over the words of the trie in sorted order. """
+        stack: List[Tuple[_RadixNode, str]] = [(self._root, '')]
+        while stack:
+            node, prefix = stack.pop()
+            if node.is_word:
+                yield prefix
+
+            if node.children is not None:
+                for letter in sorted(node.children, reverse=True):
+                    child = node.children[letter]
+                    stack.append((child, prefix + child.label))
+
+    def __contains__(self, word: str) -> bool:
+        """ Whether or not word is in RadixTrie. """
+        return self.search(word)
+
+    def __len__(self) -> int:
+        """ Number of words in RadixTrie. """
+        return self._size
+
+
+def _common_prefix_length(a: bytes, b: bytes, start: int) -> int:
+    """ Length of the common prefix of a and b from index start on.
+
+        Args:
+            a (bytes): The first string.
+            b (bytes): The second string.
+            start (int): The index to compare from.
+
+        Returns:
+            (int) The number of equal bytes from start on.
+    """
+    low, high = start, min(len(a), len(b))
+    while low < high:
+        middle = (low + high + 1) // 2
+        if a[low:middle] == b[low:middle]:
+            low = middle
+        else:
+            high = middle - 1
+
+    return low - start
+
+
+class FrozenTrie:
+    """ An immutable radix trie over the UTF-8 bytes of its words, packed into a handful of flat columns.
+
+        Nodes are numbered in breadth-first order and the edges of every node are consecutive and sorted by
+        their first byte, so the child of edge `e` is always node `e + 1` and no child pointers are stored:
+
+            _edges[n] .. _edges[n + 1]          The edges leaving node n.
+            _first[e]                           The first byte of the label of edge e.
+            _offsets[e] .. _offsets[e + 1]      The bytes of the label of edge e in _labels.
+            _words[n]                           1 if node n is a word.
+
+        A lookup binary searches `_first` for the next byte among the edges of the current node and compares
+        the whole label with one slice comparison. The trie costs a few bytes per node plus one byte per
+        label byte, with no per-node python object.
+
+        `to_bytes` writes the columns one after another behind a small header, and `from_bytes` reads them
+        back as memoryviews over the buffer without copying it. `open` does the same over a memory-mapped
+        file, so a large trie loads in constant time and processes mapping the same file share its pages.
+
+        Private Attributes:
+            _edges (array): The index of the first edge of every node, plus the number of edges.
+            _first (bytes): The first byte of the label of every edge.
+            _offsets (array): The offset of the label of every edge in _labels, plus the length of _labels.
+            _labels (bytes): The labels of every edge, concatenated.
+            _words (bytes): Whether or not every node is a word.
+            _size (int): The number of words, counted once when the trie is built and kept in the header.
+
+        Methods:
+            search: Searches for a word in the trie.
+            starts_with: Searches for a prefix in the trie.
+            iter_prefix: Iterates over the words starting with a prefix.
+            to_bytes: Serializes the trie.
+            save: Writes the trie to a file.
+            from_bytes: Loads a trie from a buffer without copying it.
+            open: Loads a trie from a file by memory-mapping it.
+    """
+
+    MAGIC: bytes = b'PYDSATRI'
+    VERSION: int = 2
+
+    # Magic, version, number of nodes, number of edges, number of label bytes, number of words, all little-endian.
+    _HEADER = struct.Struct('<8sIIIII')
+
+    def __init__(self, words: Iterable[str]):
+        """ Packs words into the trie.
+
+            Args:
+                words (Iterable[str]): The words of the trie, in any order and possibly repeated.
+        """
+        encoded = sorted({word.encode('utf-8') for word in words})
+
+        edges = array('I')
+        first = bytearray()
+        offsets = array('I', [0])
+        labels = bytearray()
+        is_word = bytearray()
+
+        queue: Deque[Tuple[int, int, int]] = deque([(0, len(encoded), 0)])
+        while queue:
+            lo, hi, depth = queue.popleft()
+
+            edges.append(len(first))
+            is_word.append(lo < hi and len(encoded[lo]) == depth)
+            if is_word[-1]:
+                lo += 1
+
+            while lo < hi:
+                word = encoded[lo]
+                byte = word[depth]
+                if byte < 255:
+                    group_hi = bisect_left(encoded, word[:depth] + bytes((byte + 1,)), lo + 1, hi)
+                else:
+                    group_hi = hi
+
+                if group_hi == lo + 1:
+                    end = len(word)
+                else:
+                    end = depth + _common_prefix_length(word, encoded[group_hi - 1], depth)
+                first.append(byte)
+                labels += word[depth:end]
+                offsets.append(len(labels))
+                queue.append((lo, group_hi, end))
+
+                lo = group_hi
+
+        edges.append(len(first))
+
+        self._edges: Sequence[int] = edges
+        self._first: Sequence[int] = bytes(first)
+        self._offsets: Sequence[int] = offsets
+        self._labels: Sequence[int] = bytes(labels)
+        self._words: Sequence[int] = bytes(is_word)
+        self._size = len(encoded)
+
+    def _walk(self, key: bytes) -> Tuple[int, int]:
+        """ Follows key down the trie along whole edge labels.
+
+            Args:
+                key (bytes): The UTF-8 bytes to follow.
+
+            Returns:
+                (Tuple[int, int]) The last node reached and how many bytes of key lead to it.
+        """
+        edges, first, offsets, labels = self._edges, self._first, self._offsets, self._labels
+
+        node = 0
+        i = 0
+        while i < len(key):
+            byte = key[i]
+            hi = edges[node + 1]
+            edge = bisect_left(first, byte, edges[node], hi)
+            if edge == hi or first[edge] != byte:
+                break
+
+            start = offsets[edge]
+            end = offsets[edge + 1]
+            if not key.startswith(labels[start:end], i):
+                break
+
+            node = edge + 1
+            i += end - start
+
+        return node, i
+
+    def _edge(self, node: int, byte: int) -> int:
+        """ Finds the edge leaving node whose label starts with byte.
+
+            Args:
+                node (int): The node to leave.
+                byte (int): The first byte of the label.
+
+            Returns:
+                (int) The edge, or -1 if there is none.
+        """
+        hi = self._edges[node + 1]
+        edge = bisect_left(self._first, byte, self._edges[node], hi)
+
+        return edge if edge < hi and self._first[edge] == byte else -1
+
+    def search(self, word: str) -> bool:
+        """ Searches for a word in the trie.
+
+            Args:
+                word (str): The word to search for.
+
+            Returns:
+                (bool) Whether or not the word is in the trie.
+        """
+        key = word.encode('utf-8')
+        node, matched = self._walk(key)
+
+        return matched == len(key) and self._words[node] == 1
+
+    def starts_with(self, prefix: str) -> bool:
+        """ Searches for a prefix in the trie.
+
+            Args:
+                prefix (str): The prefix to search for.
+
+            Returns:
+                (bool) Whether or not the prefix is in the trie.
+        """
+        key = prefix.encode('utf-8')
+        node, matched = self._walk(key)
+        if matched == len(key):
+            return True
+
+        edge = self._edge(node, key[matched])
+        if edge < 0:
+            return False
+
+        start = self._offsets[edge]
+        return self._labels[start:start + len(key) - matched] == key[matched:]
+
+    def __iter__(self) -> Iterator[str]:
+        """ Iterator over the words of the trie in sorted order. """
+        return self.iter_prefix()
+
+    def __contains__(self, word: str) -> bool:
+        """ Whether or not word is in FrozenTrie. """
+        return self.search(word)
+
+    def __len__(self) -> int:
+        """ Number of words in FrozenTrie. """
+        return self._size
+
+    def iter_prefix(self, prefix: str = '') -> Iterator[str]:
+        """ Lazily iterates over the words starting with a prefix, in sorted order.
+
+            Args:
+                prefix (str): The prefix of the words.
+
+            Yields:
+                (str) The words starting with prefix.
+        """
+        edges, offsets, labels, words = self._edges, self._offsets, self._labels, self._words
+
+        key = prefix.encode('utf-8')
+        node, matched = self._walk(key)
+        if matched < len(key):
+            edge = self._edge(node, key[matched])
+            if edge < 0:
+                return
+
+            start = offsets[edge]
+            end = offsets[edge + 1]
+            if labels[start:start + len(key) - matched] != key[matched:]:
+                return
+
+            node = edge + 1
+            key = key[:matched] + bytes(labels[start:end])
+
+        stack: List[Tuple[int, bytes]] = [(node, key)]
+        while stack:
+            node, path = stack.pop()
+            if words[node]:
+                yield path.decode('utf-8')
+
+            for edge in range(edges[node + 1] - 1, edges[node] - 1, -1):
+                stack.append((edge + 1, path + bytes(labels[offsets[edge]:offsets[edge + 1]])))
+
+    def to_bytes(self) -> bytes:
+        """ Serializes the trie into the layout read by `from_bytes`.
+
+            Returns:
+                (bytes) The header followed by the columns of the trie.
+        """
+        header = self._HEADER.pack(
+            self.MAGIC, self.VERSION, len(self._words), len(self._first), len(self._labels), self._size)
+        columns = [_little_endian(self._edges), _little_endian(self._offsets),
+                   bytes(self._first), bytes(self._words), bytes(self._labels)]
+
+        return header + b''.join(columns)
+
+    def save(self, path: str) -> None:
+        """ Writes the trie to a file, to be loaded with `open`.
+
+            Args:
+                path (str): The path of the file.
+        """
+        with open(path, 'wb') as file:
+            file.write(self.to_bytes())
+
+    @classmethod
+    def from_bytes(cls, data: Any) -> FrozenTrie:
+        """ Loads a trie from a buffer written by `to_bytes`, reading the columns in place without copying.
+
+            The buffer must stay unchanged for as long as the trie is used.
+
+            Args:
+                data (Any): Any object supporting the buffer protocol, such as bytes or an mmap.
+
+            Raises:
+                ValueError: If data is not a serialized FrozenTrie.
+
+            Returns:
+                (FrozenTrie) The loaded trie.
+        """
+        view = memoryview(data).cast('B')
+        if len(view) < cls._HEADER.size:
+            raise ValueError('Data is not a serialized FrozenTrie.')
+
+        magic, version, nodes, edges, label_bytes, words = cls._HEADER.unpack_from(view)
+        if magic != cls.MAGIC or version != cls.VERSION:
+            raise ValueError('Data is not a serialized FrozenTrie.')
+
+        sizes = [4 * (nodes + 1), 4 * (edges + 1), edges, nodes, label_bytes]
+        if len(view) != cls._HEADER.size + sum(sizes):
+            raise ValueError('Data is not a serialized FrozenTrie.')
+
+        sections = []
+        start = cls._HEADER.size
+        for size in sizes:
+            sections.append(view[start:start + size])
+            start += size
+
+        trie = cls.__new__(cls)
+        trie._edges = _unsigned_ints(sections[0])
+        trie._offsets = _unsigned_ints(sections[1])
+        trie._first, trie._words, trie._labels = sections[2:]
+        trie._size = words
+
+        return trie
+
+    @classmethod
+    def open(cls, path: str) -> FrozenTrie:
+        """ Loads a trie from a file written by `save` by memory-mapping it read-only.
+
+            Only the pages that lookups touch are read from disk, and they are shared with every other
+            process mapping the same file.
+
+            Args:
+                path (str): The path of the file.
+
+            Raises:
+                ValueError: If the file is not a serialized FrozenTrie.
+
+            Returns:
+                (FrozenTrie) The loaded trie.
+        """
+        with open(path, 'rb') as file:
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        return cls.from_bytes(mapping)
+
+
+def _little_endian(column: Sequence[int]) -> bytes:
+    """ Serializes a column of 4 byte unsigned ints in little-endian order.
+
+        Args:
+            column (Sequence[int]): The column, as an array('I') or a memoryview cast to 'I'.
+
+        Returns:
+            (bytes) The serialized column.
+    """
+    if sys.byteorder == 'little':
+        return bytes(column)
+
+    swapped = array('I', column)
+    swapped.byteswap()
+    return swapped.tobytes()
+
+
+def _unsigned_ints(section: memoryview) -> Sequence[int]:
+    """ Reads a serialized column of 4 byte little-endian unsigned ints, in place on little-endian machines.
+
+        Args:
+            section (memoryview): The bytes of the column.
+
+        Returns:
+            (Sequence[int]) The column.
+    """
+    if sys.byteorder == 'little':
+        return section.cast('I')
+
+    column = array('I', section.tobytes())
+    column.byteswap()
+    return column
@@ -2,40 +2,157 @@
 from __future__ import annotations
 
 import typing
+from array import array
+from itertools import islice
 
 T = typing.TypeVar('T')
 
 
 class DynamicArray:
     """ A dynamic array implementation.
+
+        With a typecode, values are stored unboxed in an `array.array`, which exposes the buffer protocol,
+        so `view` hands the values to NumPy or `struct` without copying them. Without one, any python
+        object is stored in a list.
     
         Attributes:
             capacity (int): The capacity of the array.
         
         Private Attributes:
             _length (int): The length of the array.
-            _array (List[Any]): The array.
+            _array (MutableSequence[T]): The array, padded with 0 up to its capacity.
+            _typecode (Optional[str]): `array` typecode of the values, None to store any python object.
+            _growth_factor (float): How much the capacity is multiplied by when the array is full.
         
         Methods:
             get: Gets the value at the given index.
-            insert: Inserts a value at the given index.
+            insert: Inserts a value at the given index, shifting the values after it back.
+            delete: Deletes and returns the value at the given index, shifting the values after it forward.
             pushback: Pushes a value to the back of the array.
             popback: Pops a value from the back of the array.
-            resize: Resizes the array to double its current capacity.
+            extend: Pushes values to the back of the array.
+            fill: Sets every value in a range of the array to one value.
+            copy_from: Copies values into the array starting at an index.
+            resize: Resizes the array by its growth factor.
+            shrink_to_fit: Shrinks the capacity of the array to its size.
+            view: Gets a memoryview of the values of a typed array.
             get_size: Gets the size of the array.
             get_capacity: Gets the capacity of the array.
     """
 
-    def __init__(self, capacity: int):
+    def __init__(self, capacity: int, typecode: typing.Optional[str] = None, growth_factor: float = 2):
         """ Initializes the dynamic array.
         
             Args:
                 capacity (int): The capacity of the array.
+                typecode (Optional[str]): `array` typecode of the values, None to store any python object.
+                growth_factor (float): How much the capacity is multiplied by when the array is full.
+
+            Raises:
+                ValueError: If capacity is negative or growth_factor is not larger than 1.
         """
+        if capacity < 0:
+            raise ValueError('Capacity must not be negative.')
+        if growth_factor <= 1:
+            raise ValueError('Growth factor must be larger than 1.')
+
         self.capacity = capacity
         self._length = 0
-        self._array: typing.List[T] = [0] * self.capacity
+        self._typecode = typecode
+        self._growth_factor = growth_factor
+        self._array: typing.MutableSequence[T] = self._padding(self.capacity)
+
+    def _padding(self, count: int) -> typing.MutableSequence[T]:
+        """ Creates count zeros of the storage type of the array.
+
+            Args:
+                count (int): The number of zeros.
+
+            Returns:
+                (MutableSequence[T]) The zeros, as an array of the typecode or a list.
+        """
+        if self._typecode is not None:
+            return array(self._typecode, [0]) * count
+
+        return [0] * count
+
+    def _reserve(self, capacity: int) -> None:
+        """ Grows the array in place to hold at least capacity values.
+
+            Args:
+                capacity (int): The capacity to grow to.
+        """
+        if capacity > self.capacity:
+            self._array += self._padding(capacity - self.capacity)
+            self.capacity = capacity
+
+    def _restore_capacity(self) -> None:
+        """ Pads or trims the storage back to the capacity after a slice operation changed its length,
+            growing the capacity by the growth factor if the values no longer fit.
+        """
+        if self._length > self.capacity:
+            self.capacity = max(self._length, int(self.capacity * self._growth_factor))
+
+        extra = len(self._array) - self.capacity
+        if extra > 0:
+            del self._array[self.capacity:]
+        elif extra < 0:
+            self._array += self._padding(-extra)
+
+    def _coerce(self, values: typing.Iterable[T]) -> typing.MutableSequence[T]:
+        """ Converts values to the storage type of the array, so they can be slice assigned into it.
+
+            Args:
+                values (Iterable[T]): The values to convert.
+
+            Returns:
+                (MutableSequence[T]) The values, as an array of the typecode or a list.
+        """
+        if isinstance(values, DynamicArray):
+            values = values._array[:values._length]
 
+        if self._typecode is not None:
+            if not isinstance(values, array) or values.typecode != self._typecode:
+                values = array(self._typecode, values)
+        elif not isinstance(values, list):
+            values = list(values)
+
+        return values
+
+    def _index(self, i: int) -> int:
+        """ Checks an index is in the array, counting negative indices from the back.
+
+            Args:
+                i (int): The index to check.
+
+            Raises:
+                IndexError: If the index is not in the array.
+
+            Returns:
+                (int) The non-negative index.
+        """
+        if i < 0:
+            i += self._length
+        if not 0 <= i < self._length:
+            raise IndexError('Index not accessible')
+
+        return i
+
+    def _slice(self, index: slice) -> typing.Tuple[slice, int]:
+        """ Bounds a slice to the values of the array, so it never reaches into the padding.
+
+            Args:
+                index (slice): The slice to bound.
+
+            Returns:
+                (Tuple[slice, int]) The bounded slice and the number of values it covers.
+        """
+        indices = range(*index.indices(self._length))
+        if not indices:
+            return slice(0, 0), 0
+
+        stop = indices[-1] + indices.step
+        return slice(indices[0], stop if stop >= 0 else None, indices.step), len(indices)
 
     def get(self, i: int) -> T:
         """ Gets the value at the given index.
@@ -49,13 +166,44 @@ class DynamicArray:
         return self._array[i]
 
     def insert(self, i: int, n: T) -> None:
-        """ Inserts a value at the given index.
+        """ Inserts a value at the given index, shifting the values after it back in one block move.
         
             Args:
-                i (int): The index to insert the value at.
+                i (int): The index to insert the value at, which may be the size of the array to push to the back.
                 n (T): The value to insert.
+
+            Raises:
+                IndexError: If the index is past the back of the array.
+        """
+        if i < 0:
+            i += self._length
+        if not 0 <= i <= self._length:
+            raise IndexError('Index not accessible')
+
+        self._array.insert(i, n)
+        self._length += 1
+        self._restore_capacity()
+
+    def delete(self, i: int) -> T:
+        """ Deletes the value at the given index, shifting the values after it forward in one block move.
+
+            Args:
+                i (int): The index of the value to delete.
+
+            Raises:
+                IndexError: If the index is not in the array.
+
+            Returns:
+                (T) The deleted value.
         """
-        self._array[i] = n
+        i = self._index(i)
+        val = self._array[i]
+
+        del self._array[i]
+        self._length -= 1
+        self._restore_capacity()
+
+        return val
 
     def pushback(self, n: T) -> None:
         """ Pushes a value to the back of the array.
@@ -83,11 +231,139 @@ class DynamicArray:
 
         return self._array[self._length]
 
+    def extend(self, values: typing.Iterable[T]) -> None:
+        """ Pushes values to the back of the array, growing it at most once and copying them in with one
+            slice assignment.
+
+            Args:
+                values (Iterable[T]): The values to push to the back of the array.
+        """
+        self.copy_from(values, self._length)
+
+    def fill(self, value: T, start: int = 0, stop: typing.Optional[int] = None) -> None:
+        """ Sets every value in a range of the array to one value with one slice assignment.
+
+            Args:
+                value (T): The value to set.
+                start (int): The index of the first value to set.
+                stop (Optional[int]): The index after the last value to set, None for the size of the array.
+        """
+        start, stop, _ = slice(start, stop).indices(self._length)
+        if start < stop:
+            self._array[start:stop] = self._coerce([value]) * (stop - start)
+
+    def copy_from(self, values: typing.Iterable[T], start: int = 0) -> None:
+        """ Copies values into the array starting at an index with one slice assignment, overwriting the
+            values there and growing the array at most once if they run past its back.
+
+            Args:
+                values (Iterable[T]): The values to copy, which may be another DynamicArray.
+                start (int): The index to copy the first value to, which may be the size of the array.
+
+            Raises:
+                IndexError: If start is past the back of the array.
+        """
+        if not 0 <= start <= self._length:
+            raise IndexError('Index not accessible')
+
+        values = self._coerce(values)
+
+        stop = start + len(values)
+        if stop > self.capacity:
+            self._reserve(max(stop, int(self.capacity * self._growth_factor)))
+
+        self._array[start:stop] = values
+        self._length = max(self._length, stop)
+
     def resize(self) -> None:
-        """ Resizes the array to double its current capacity.
+        """ Resizes the array by its growth factor, adding at least one slot.
         """
-        self._array += [0] * self.capacity
-        self.capacity *= 2
+        self._reserve(max(self.capacity + 1, int(self.capacity * self._growth_factor)))
+
+    def shrink_to_fit(self) -> None:
+        """ Shrinks the capacity of the array to its size, releasing the unused slots.
+        """
+        del self._array[self._length:]
+        self.capacity = self._length
+
+    def view(self, start: int = 0, stop: typing.Optional[int] = None) -> memoryview:
+        """ Gets a memoryview of the values of a typed array, sharing memory with the array.
+
+            The array can not grow or shrink while a view of it is alive, so release views before pushing
+            past the capacity.
+
+            Args:
+                start (int): The index of the first value in the view.
+                stop (Optional[int]): The index after the last value in the view, None for the size of the array.
+
+            Raises:
+                TypeError: If the array has no typecode.
+
+            Returns:
+                (memoryview) The view of the values.
+        """
+        if self._typecode is None:
+            raise TypeError('Only arrays with a typecode expose their buffer.')
+
+        return memoryview(self._array)[:self._length][start:stop]
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """ Exposes the values of a typed array to `memoryview` and other buffer consumers on python 3.12+. """
+        return self.view()
+
+    def __getitem__(self, index: typing.Union[int, slice]) -> typing.Union[T, DynamicArray]:
+        """ Gets the value at an index, or a new DynamicArray of the values in a slice. """
+        if isinstance(index, slice):
+            index, count = self._slice(index)
+            ret = DynamicArray(count, self._typecode, self._growth_factor)
+            ret.copy_from(self._array[index])
+            return ret
+
+        return self._array[self._index(index)]
+
+    def __setitem__(self, index: typing.Union[int, slice], value: typing.Union[T, typing.Iterable[T]]) -> None:
+        """ Sets the value at an index, or replaces the values in a slice, which may change the size of the
+            array for slices without a step.
+        """
+        if not isinstance(index, slice):
+            self._array[self._index(index)] = value
+            return
+
+        values = self._coerce(value)
+        if index.step is None or index.step == 1:
+            start, stop, _ = index.indices(self._length)
+            stop = max(start, stop)
+            self._array[start:stop] = values
+            self._length += len(values) - (stop - start)
+            self._restore_capacity()
+        else:
+            index, count = self._slice(index)
+            if len(values) != count:
+                raise ValueError(f'Can not assign {len(values)} values to an extended slice of size {count}.')
+            self._array[index] = values
+
+    def __delitem__(self, index: typing.Union[int, slice]) -> None:
+        """ Deletes the value at an index or the values in a slice, shifting the values after them forward. """
+        if not isinstance(index, slice):
+            self.delete(index)
+            return
+
+        index, count = self._slice(index)
+        del self._array[index]
+        self._length -= count
+        self._restore_capacity()
+
+    def __iter__(self) -> typing.Iterator[T]:
+        """ Iterator over the values of the array. """
+        return islice(self._array, self._length)
+
+    def __len__(self) -> int:
+        """ Size of the array. """
+        return self._length
+
+    def __repr__(self) -> str:
+        """ Representation of DynamicArray. """
+        return f'DynamicArray({list(self)}, capacity={self.capacity})'
 
     def get_size(self) -> int:
         """ Gets the size of the array.
@@ -0,0 +1,1020 @@
+# coding: utf-8
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from itertools import count
+from typing import Any, Callable, Generic, Iterable, List, Optional, TypeVar
+
+
+__all__ = [
+    'DaryHeap',
+    'HeapHandle',
+    'IndexedMaxHeap',
+    'IndexedMinHeap',
+    'MaxHeap',
+    'MinHeap',
+    'PairingHeap',
+]
+
+
+T = TypeVar('T')
+
+
+class HeapHandle(Generic[T]):
+    """ An element of a heap, returned by the indexed heaps to refer back to a pushed value.
+
+        Attributes:
+            priority (Any): The priority the heap is ordered by.
+            seq (int): The order the element was pushed in, which breaks ties between equal priorities.
+            value (T): The pushed value.
+            index (int): The position of the element in the heap, or -1 once it has left an indexed heap.
+    """
+    __slots__ = ('priority', 'seq', 'value', 'index')
+
+    priority: Any
+    seq: int
+    value: T
+    index: int
+
+    def __init__(self, priority: Any, seq: int, value: T):
+        self.priority = priority
+        self.seq = seq
+        self.value = value
+        self.index = -1
+
+    def __repr__(self) -> str:
+        """ Representation of HeapHandle. """
+        return f'<HeapHandle value={self.value} priority={self.priority}>'
+
+
+class _PriorityQueueBase(ABC, Generic[T]):
+    """ An abstract min priority queue whose pushes return handles for changing or removing the pushed value.
+
+        Methods:
+            is_empty: Returns whether the queue is empty.
+            peek: Returns the value with the smallest priority.
+            push: Pushes a value to the queue and returns its handle.
+            pop: Removes and returns the value with the smallest priority.
+            decrease_key: Lowers the priority of a pushed value.
+            remove: Removes a pushed value from the queue.
+    """
+
+    @abstractmethod
+    def peek(self) -> T:
+        """ Returns the value with the smallest priority without removing it.
+
+            Returns:
+                (T) The value with the smallest priority.
+        """
+        pass
+
+    @abstractmethod
+    def push(self, value: T, priority: Any = None) -> Any:
+        """ Pushes a value to the queue.
+
+            Args:
+                value (T): The value to push.
+                priority (Any): The priority of value, None to compute it with the key of the queue.
+
+            Returns:
+                (Any) The handle of the pushed value.
+        """
+        pass
+
+    @abstractmethod
+    def pop(self) -> T:
+        """ Removes and returns the value with the smallest priority.
+
+            Returns:
+                (T) The value with the smallest priority.
+        """
+        pass
+
+    @abstractmethod
+    def decrease_key(self, handle: Any, priority: Any) -> None:
+        """ Lowers the priority of a pushed value.
+
+            Args:
+                handle (Any): The handle returned when the value was pushed.
+                priority (Any): The new priority, which must not be larger than the current one.
+        """
+        pass
+
+    @abstractmethod
+    def remove(self, handle: Any) -> T:
+        """ Removes a pushed value from the queue.
+
+            Args:
+                handle (Any): The handle returned when the value was pushed.
+
+            Returns:
+                (T) The removed value.
+        """
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    def is_empty(self) -> bool:
+        """ Returns whether the queue is empty.
+
+            Returns:
+                (bool) Whether the queue is empty.
+        """
+        return len(self) == 0
+
+
+class _HeapBase(ABC, Generic[T]):
+    """ An abstract binary heap stored in a list, ordered by a key of each value.
+
+        Elements with equal priorities are popped in the order they were pushed.
+
+        Private Attributes:
+            _entries (List[HeapHandle[T]]): The elements of the heap, in heap order.
+            _key (Optional[Callable[[T], Any]]): Computes the priority of a value, None to use the value itself.
+            _counter (Iterator[int]): Source of the push order of elements.
+
+        Methods:
+            is_empty: Returns whether the heap is empty.
+            peek: Returns the top value of the heap.
+            push: Pushes a value to the heap.
+            push_many: Pushes values to the heap.
+            pop: Removes and returns the top value of the heap.
+            pushpop: Pushes a value, then removes and returns the top value of the heap.
+    """
+
+    def __init__(self, values: Optional[Iterable[T]] = None, key: Optional[Callable[[T], Any]] = None):
+        """ Initializes the heap, heapifying values in O(n).
+
+            Args:
+                values (Optional[Iterable[T]]): Values to fill the heap with.
+                key (Optional[Callable[[T], Any]]): Computes the priority of a value, None to use the value itself.
+        """
+        self._key = key
+        self._counter = count()
+        self._entries: List[HeapHandle[T]] = []
+
+        if values is not None:
+            self._entries = [self._entry(value) for value in values]
+            self._heapify()
+
+    def _entry(self, value: T, priority: Any = None) -> HeapHandle[T]:
+        """ Creates the element for value.
+
+            Args:
+                value (T): The value of the element.
+                priority (Any): The priority of the element, None to compute it from value.
+        """
+        if priority is None:
+            priority = self._key(value) if self._key is not None else value
+
+        return HeapHandle(priority, next(self._counter), value)
+
+    @abstractmethod
+    def _before(self, a: HeapHandle[T], b: HeapHandle[T]) -> bool:
+        """ Whether element a belongs above element b in the heap.
+
+            Args:
+                a (HeapHandle[T]): The first element.
+                b (HeapHandle[T]): The second element.
+        """
+        pass
+
+    def _set(self, index: int, entry: HeapHandle[T]) -> None:
+        """ Places an element at index of the heap.
+
+            Args:
+                index (int): The index to place the element at.
+                entry (HeapHandle[T]): The element to place.
+        """
+        self._entries[index] = entry
+
+    def _heapify(self) -> None:
+        """ Restores heap order over all elements in O(n), sifting down every parent from the bottom up.
+        """
+        for index in reversed(range(len(self._entries) // 2)):
+            self._sift_down(index)
+
+    def _sift_up(self, index: int) -> None:
+        """ Moves the element at index up until its parent belongs above it.
+
+            Args:
+                index (int): The index of the element to move.
+        """
+        entries = self._entries
+        entry = entries[index]
+
+        while index > 0:
+            parent = (index - 1) >> 1
+            if not self._before(entry, entries[parent]):
+                break
+
+            self._set(index, entries[parent])
+            index = parent
+
+        self._set(index, entry)
+
+    def _sift_down(self, index: int) -> None:
+        """ Moves the element at index down until it belongs above its children.
+
+            Args:
+                index (int): The index of the element to move.
+        """
+        entries = self._entries
+        size = len(entries)
+        entry = entries[index]
+
+        while True:
+            child = 2 * index + 1
+            if child >= size:
+                break
+
+            if child + 1 < size and self._before(entries[child + 1], entries[child]):
+                child += 1
+
+            if not self._before(entries[child], entry):
+                break
+
+            self._set(index, entries[child])
+            index = child
+
+        self._set(index, entry)
+
+    def _push_entry(self, entry: HeapHandle[T]) -> None:
+        """ Pushes an element to the heap.
+
+            Args:
+                entry (HeapHandle[T]): The element to push.
+        """
+        self._entries.append(entry)
+        self._sift_up(len(self._entries) - 1)
+
+    def _pop_entry(self) -> HeapHandle[T]:
+        """ Removes and returns the top element of the heap.
+
+            Raises:
+                IndexError: If the heap is empty.
+        """
+        if not self._entries:
+            raise IndexError('Heap is empty.')
+
+        last = self._entries.pop()
+        if not self._entries:
+            return last
+
+        top = self._entries[0]
+        self._set(0, last)
+        self._sift_down(0)
+
+        return top
+
+    def is_empty(self) -> bool:
+        """ Returns whether the heap is empty.
+
+            Returns:
+                (bool) Whether the heap is empty.
+        """
+        return len(self._entries) == 0
+
+    def peek(self) -> T:
+        """ Returns the top value of the heap without removing it.
+
+            Raises:
+                IndexError: If the heap is empty.
+
+            Returns:
+                (T) The top value of the heap.
+        """
+        if not self._entries:
+            raise IndexError('Heap is empty.')
+
+        return self._entries[0].value
+
+    def push(self, value: T) -> None:
+        """ Pushes a value to the heap in O(log n).
+
+            Args:
+                value (T): The value to push.
+        """
+        self._push_entry(self._entry(value))
+
+    def push_many(self, values: Iterable[T]) -> None:
+        """ Pushes values to the heap, heapifying everything at once when that is cheaper.
+
+            Args:
+                values (Iterable[T]): The values to push.
+        """
+        new_entries = [self._entry(value) for value in values]
+
+        # Sifting each value up costs O(k log n), re-heapifying costs O(n + k)
+        if len(new_entries) > len(self._entries):
+            self._entries.extend(new_entries)
+            self._heapify()
+        else:
+            for entry in new_entries:
+                self._push_entry(entry)
+
+    def pop(self) -> T:
+        """ Removes and returns the top value of the heap in O(log n).
+
+            Raises:
+                IndexError: If the heap is empty.
+
+            Returns:
+                (T) The top value of the heap.
+        """
+        return self._pop_entry().value
+
+    def pushpop(self, value: T) -> T:
+        """ Pushes a value, then removes and returns the top value of the heap, in a single sift.
+
+            Args:
+                value (T): The value to push.
+
+            Returns:
+                (T) The top value of the heap, which is value itself if it belongs above every element.
+        """
+        entry = self._entry(value)
+        if not self._entries or not self._before(self._entries[0], entry):
+            return value
+
+        top = self._entries[0]
+        self._set(0, entry)
+        self._sift_down(0)
+        self._release(top)
+
+        return top.value
+
+    def _release(self, entry: HeapHandle[T]) -> None:
+        """ Marks an element as no longer in the heap.
+
+            Args:
+                entry (HeapHandle[T]): The removed element.
+        """
+        pass
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({[entry.value for entry in self._entries]})'
+
+
+class MinHeap(_HeapBase[T]):
+    """ A heap that pops the value with the smallest priority first.
+
+        Example:
+            >>> heap = MinHeap([5, 3, 8, 1])
+            >>> heap.pop()
+            1
+            >>> heap = MinHeap(['pear', 'fig', 'kiwi'], key=len)
+            >>> [heap.pop() for _ in range(len(heap))]
+            ['fig', 'pear', 'kiwi']
+    """
+
+    def _before(self, a: HeapHandle[T], b: HeapHandle[T]) -> bool:
+        """ Whether element a belongs above element b in the heap.
+
+            Args:
+                a (HeapHandle[T]): The first element.
+                b (HeapHandle[T]): The second element.
+        """
+        if a.priority < b.priority:
+            return True
+        if b.priority < a.priority:
+            return False
+
+        return a.seq < b.seq
+
+
+class MaxHeap(_HeapBase[T]):
+    """ A heap that pops the value with the largest priority first.
+
+        Example:
+            >>> heap = MaxHeap([5, 3, 8, 1])
+            >>> heap.pop()
+            8
+    """
+
+    def _before(self, a: HeapHandle[T], b: HeapHandle[T]) -> bool:
+        """ Whether element a belongs above element b in the heap.
+
+            Args:
+                a (HeapHandle[T]): The first element.
+                b (HeapHandle[T]): The second element.
+        """
+        if b.priority < a.priority:
+            return True
+        if a.priority < b.priority:
+            return False
+
+        return a.seq < b.seq
+
+
+class _IndexedHeapBase(_HeapBase[T]):
+    """ An abstract heap tracking the position of every element.
+
+        Pushed values can be reprioritized or removed in O(log n) through the handle returned by `push`.
+
+        Methods:
+            push: Pushes a value to the heap and returns its handle.
+            update: Changes the priority of a pushed value.
+            remove: Removes a pushed value from the heap.
+    """
+
+    def _set(self, index: int, entry: HeapHandle[T]) -> None:
+        """ Places an element at index of the heap, recording the index on the element.
+
+            Args:
+                index (int): The index to place the element at.
+                entry (HeapHandle[T]): The element to place.
+        """
+        self._entries[index] = entry
+        entry.index = index
+
+    def _heapify(self) -> None:
+        """ Restores heap order over all elements in O(n), recording the index of every element.
+        """
+        for index, entry in enumerate(self._entries):
+            entry.index = index
+
+        super()._heapify()
+
+    def _release(self, entry: HeapHandle[T]) -> None:
+        """ Marks an element as no longer in the heap.
+
+            Args:
+                entry (HeapHandle[T]): The removed element.
+        """
+        entry.index = -1
+
+    def _check(self, handle: HeapHandle[T]) -> None:
+        """ Checks handle refers to an element of this heap.
+
+            Args:
+                handle (HeapHandle[T]): The handle to check.
+
+            Raises:
+                IndexError: If handle is not in the heap.
+        """
+        if not 0 <= handle.index < len(self._entries) or self._entries[handle.index] is not handle:
+            raise IndexError('Handle is not in heap.')
+
+    def push(self, value: T, priority: Any = None) -> HeapHandle[T]:
+        """ Pushes a value to the heap in O(log n).
+
+            Args:
+                value (T): The value to push.
+                priority (Any): The priority of value, None to compute it with the key of the heap.
+
+            Returns:
+                (HeapHandle[T]) The handle of the pushed value.
+        """
+        entry = self._entry(value, priority)
+        self._push_entry(entry)
+
+        return entry
+
+    def pop(self) -> T:
+        """ Removes and returns the top value of the heap in O(log n).
+
+            Raises:
+                IndexError: If the heap is empty.
+
+            Returns:
+                (T) The top value of the heap.
+        """
+        entry = self._pop_entry()
+        self._release(entry)
+
+        return entry.value
+
+    def update(self, handle: HeapHandle[T], priority: Any) -> None:
+        """ Changes the priority of a pushed value in O(log n), moving it up or down the heap.
+
+            Args:
+                handle (HeapHandle[T]): The handle returned when the value was pushed.
+                priority (Any): The new priority of the value.
+
+            Raises:
+                IndexError: If handle is not in the heap.
+        """
+        self._check(handle)
+
+        handle.priority = priority
+        self._sift_up(handle.index)
+        self._sift_down(handle.index)
+
+    def remove(self, handle: HeapHandle[T]) -> T:
+        """ Removes a pushed value from the heap in O(log n).
+
+            Args:
+                handle (HeapHandle[T]): The handle returned when the value was pushed.
+
+            Raises:
+                IndexError: If handle is not in the heap.
+
+            Returns:
+                (T) The removed value.
+        """
+        self._check(handle)
+
+        index = handle.index
+        last = self._entries.pop()
+        if last is not handle:
+            self._set(index, last)
+            self._sift_up(index)
+            self._sift_down(last.index)
+
+        self._release(handle)
+
+        return handle.value
+
+
+class IndexedMinHeap(_IndexedHeapBase[T], MinHeap[T], _PriorityQueueBase[T]):
+    """ A MinHeap whose pushes return handles, supporting decrease-key for scheduler and shortest path workloads.
+
+        Example:
+            >>> heap = IndexedMinHeap()
+            >>> a = heap.push('a', priority=5)
+            >>> b = heap.push('b', priority=3)
+            >>> heap.decrease_key(a, 1)
+            >>> heap.pop()
+            'a'
+    """
+
+    def decrease_key(self, handle: HeapHandle[T], priority: Any) -> None:
+        """ Lowers the priority of a pushed value in O(log n).
+
+            Args:
+                handle (HeapHandle[T]): The handle returned when the value was pushed.
+                priority (Any): The new priority, which must not be larger than the current one.
+
+            Raises:
+                IndexError: If handle is not in the heap.
+                ValueError: If priority is larger than the current priority.
+        """
+        self._check(handle)
+        if handle.priority < priority:
+            raise ValueError('New priority is larger than the current priority.')
+
+        handle.priority = priority
+        self._sift_up(handle.index)
+
+
+class IndexedMaxHeap(_IndexedHeapBase[T], MaxHeap[T]):
+    """ A MaxHeap whose pushes return handles, supporting increase-key.
+    """
+
+    def increase_key(self, handle: HeapHandle[T], priority: Any) -> None:
+        """ Raises the priority of a pushed value in O(log n).
+
+            Args:
+                handle (HeapHandle[T]): The handle returned when the value was pushed.
+                priority (Any): The new priority, which must not be smaller than the current one.
+
+            Raises:
+                IndexError: If handle is not in the heap.
+                ValueError: If priority is smaller than the current priority.
+        """
+        self._check(handle)
+        if priority < handle.priority:
+            raise ValueError('New priority is smaller than the current priority.')
+
+        handle.priority = priority
+        self._sift_up(handle.index)
+
+
+class DaryHeap(IndexedMinHeap[T]):
+    """ An IndexedMinHeap where every element has `arity` children instead of two.
+
+        A wider heap is shallower, so pushes and decrease-keys sift through fewer levels, while pops
+        compare more children per level. The children of an element are adjacent in the list.
+    """
+
+    def __init__(self,
+                 values: Optional[Iterable[T]] = None,
+                 key: Optional[Callable[[T], Any]] = None,
+                 arity: int = 4):
+        """ Initializes the heap, heapifying values in O(n).
+
+            Args:
+                values (Optional[Iterable[T]]): Values to fill the heap with.
+                key (Optional[Callable[[T], Any]]): Computes the priority of a value, None to use the value itself.
+                arity (int): The number of children of every element.
+
+            Raises:
+                ValueError: If arity is less than 2.
+        """
+        if arity < 2:
+            raise ValueError('Arity must be at least 2.')
+
+        self._arity = arity
+        super().__init__(values, key)
+
+    def _heapify(self) -> None:
+        """ Restores heap order over all elements in O(n), recording the index of every element.
+        """
+        for index, entry in enumerate(self._entries):
+            entry.index = index
+
+        last_parent = (len(self._entries) - 2) // self._arity
+        for index in reversed(range(last_parent + 1)):
+            self._sift_down(index)
+
+    def _sift_up(self, index: int) -> None:
+        """ Moves the element at index up until its parent belongs above it.
+
+            Args:
+                index (int): The index of the element to move.
+        """
+        entries = self._entries
+        arity = self._arity
+        entry = entries[index]
+
+        while index > 0:
+            parent = (index - 1) // arity
+            if not self._before(entry, entries[parent]):
+                break
+
+            self._set(index, entries[parent])
+            index = parent
+
+        self._set(index, entry)
+
+    def _sift_down(self, index: int) -> None:
+        """ Moves the element at index down until it belongs above all of its children.
+
+            Args:
+                index (int): The index of the element to move.
+        """
+        entries = self._entries
+        arity = self._arity
+        size = len(entries)
+        entry = entries[index]
+
+        while True:
+            first_child = arity * index + 1
+            if first_child >= size:
+                break
+
+            child = first_child
+            for sibling in range(first_child + 1, min(first_child + arity, size)):
+                if self._before(entries[sibling], entries[child]):
+                    child = sibling
+
+            if not self._before(entries[child], entry):
+                break
+
+            self._set(index, entries[child])
+            index = child
+
+        self._set(index, entry)
+
+
+class PairingHeap(_PriorityQueueBase[T]):
+    """ A pairing heap, a min priority queue stored as a tree where every node links to its first child and
+        next sibling.
+
+        Pushing and merging two heaps only link two roots in O(1), and decrease-key cuts the node out and
+        links it back to the root in O(1). Pops pair up the children of the root and take amortized
+        O(log n). Elements with equal priorities are popped in the order they were pushed.
+
+        Example:
+            >>> heap = PairingHeap([5, 3, 8])
+            >>> node = heap.push(9)
+            >>> heap.decrease_key(node, 1)
+            >>> heap.pop()
+            9
+
+        Private Attributes:
+            _root (Optional[PairingHeap.Node]): The node with the smallest priority.
+            _size (int): The size of the heap.
+            _key (Optional[Callable[[T], Any]]): Computes the priority of a value, None to use the value itself.
+            _counter (Iterator[int]): Source of the push order of elements.
+            _owner (PairingHeap._Owner): The owner record of the heap, shared by the nodes pushed to it.
+
+        Methods:
+            merge: Moves every element of another pairing heap into this one.
+    """
+
+    class _Owner:
+        """ Owner record of a PairingHeap, which its nodes point to instead of the heap itself.
+
+            Merging a heap forwards its record to the record of the heap it was merged into, so the nodes
+            moved by the merge change owner without being visited, and merge stays O(1).
+
+            Attributes:
+                parent (Optional[PairingHeap._Owner]): The record this one was forwarded to, None while its heap
+                    is still the owner.
+        """
+        __slots__ = ('parent',)
+
+        parent: Optional[PairingHeap._Owner]
+
+        def __init__(self):
+            self.parent = None
+
+        def find(self) -> PairingHeap._Owner:
+            """ Follows the forwarded records to the one of the heap that owns the nodes now, pointing every
+                record on the way straight at it so later lookups take O(1).
+
+                Returns:
+                    (PairingHeap._Owner) The record of the owning heap.
+            """
+            root = self
+            while root.parent is not None:
+                root = root.parent
+
+            record = self
+            while record.parent is not None and record.parent is not root:
+                record.parent, record = root, record.parent
+
+            return root
+
+    class Node(Generic[T]):
+        """ Node class for PairingHeap, returned by `push` as the handle of the pushed value.
+
+            Attributes:
+                priority (Any): The priority the heap is ordered by.
+                seq (int): The order the node was pushed in, which breaks ties between equal priorities.
+                value (T): The pushed value.
+                child (Optional[PairingHeap.Node]): The first child of the node.
+                sibling (Optional[PairingHeap.Node]): The next sibling of the node.
+                prev (Optional[PairingHeap.Node]): The previous sibling of the node, or its parent if it is the
+                    first child.
+                owner (Optional[PairingHeap._Owner]): The owner record of the heap the node was pushed to, None
+                    once it is popped or removed.
+        """
+        __slots__ = ('priority', 'seq', 'value', 'child', 'sibling', 'prev', 'owner')
+
+        priority: Any
+        seq: int
+        value: T
+        child: Optional[PairingHeap.Node]
+        sibling: Optional[PairingHeap.Node]
+        prev: Optional[PairingHeap.Node]
+        owner: Optional[PairingHeap._Owner]
+
+        def __init__(self, priority: Any, seq: int, value: T, owner: PairingHeap._Owner):
+            self.priority = priority
+            self.seq = seq
+            self.value = value
+            self.child = self.sibling = self.prev = None
+            self.owner = owner
+
+        def __repr__(self) -> str:
+            """ Representation of Node. """
+            return f'<Node value={self.value} priority={self.priority}>'
+
+    def __init__(self, values: Optional[Iterable[T]] = None, key: Optional[Callable[[T], Any]] = None):
+        """ Initializes the heap.
+
+            Args:
+                values (Optional[Iterable[T]]): Values to fill the heap with.
+                key (Optional[Callable[[T], Any]]): Computes the priority of a value, None to use the value itself.
+        """
+        self._root: Optional[PairingHeap.Node] = None
+        self._size = 0
+        self._key = key
+        self._counter = count()
+        self._owner = PairingHeap._Owner()
+
+        if values is not None:
+            for value in values:
+                self.push(value)
+
+    @staticmethod
+    def _before(a: PairingHeap.Node, b: PairingHeap.Node) -> bool:
+        """ Whether node a belongs above node b in the heap.
+
+            Args:
+                a (PairingHeap.Node): The first node.
+                b (PairingHeap.Node): The second node.
+        """
+        if a.priority < b.priority:
+            return True
+        if b.priority < a.priority:
+            return False
+
+        return a.seq < b.seq
+
+    def _link(self, a: Optional[PairingHeap.Node], b: Optional[PairingHeap.Node]) -> Optional[PairingHeap.Node]:
+        """ Links two root nodes, making the one that belongs lower the first child of the other.
+
+            Args:
+                a (Optional[PairingHeap.Node]): The first root.
+                b (Optional[PairingHeap.Node]): The second root.
+
+            Returns:
+                (Optional[PairingHeap.Node]) The root of the linked tree.
+        """
+        if a is None:
+            return b
+        if b is None:
+            return a
+
+        if self._before(b, a):
+            a, b = b, a
+
+        b.prev = a
+        b.sibling = a.child
+        if a.child is not None:
+            a.child.prev = b
+        a.child = b
+
+        return a
+
+    def _merge_pairs(self, first: Optional[PairingHeap.Node]) -> Optional[PairingHeap.Node]:
+        """ Links a list of siblings into one tree, linking them in pairs from left to right and then
+            linking the pairs from right to left.
+
+            Args:
+                first (Optional[PairingHeap.Node]): The first sibling.
+
+            Returns:
+                (Optional[PairingHeap.Node]) The root of the linked tree.
+        """
+        pairs: List[PairingHeap.Node] = []
+
+        node = first
+        while node is not None:
+            a = node
+            b = node.sibling
+            node = b.sibling if b is not None else None
+
+            a.prev = a.sibling = None
+            if b is not None:
+                b.prev = b.sibling = None
+
+            pairs.append(self._link(a, b))
+
+        root: Optional[PairingHeap.Node] = None
+        for pair in reversed(pairs):
+            root = self._link(pair, root)
+
+        return root
+
+    def _cut(self, node: PairingHeap.Node) -> None:
+        """ Detaches a non-root node, along with its children, from its parent.
+
+            Args:
+                node (PairingHeap.Node): The node to detach.
+        """
+        if node.prev.child is node:
+            node.prev.child = node.sibling
+        else:
+            node.prev.sibling = node.sibling
+
+        if node.sibling is not None:
+            node.sibling.prev = node.prev
+
+        node.prev = node.sibling = None
+
+    def _check(self, node: PairingHeap.Node) -> None:
+        """ Checks node refers to an element of this heap.
+
+            Args:
+                node (PairingHeap.Node): The node to check.
+
+            Raises:
+                IndexError: If node was already popped or removed, or belongs to another heap.
+        """
+        if node.owner is None or node.owner.find() is not self._owner:
+            raise IndexError('Handle is not in heap.')
+
+    def peek(self) -> T:
+        """ Returns the value with the smallest priority without removing it.
+
+            Raises:
+                IndexError: If the heap is empty.
+
+            Returns:
+                (T) The value with the smallest priority.
+        """
+        if self._root is None:
+            raise IndexError('Heap is empty.')
+
+        return self._root.value
+
+    def push(self, value: T, priority: Any = None) -> PairingHeap.Node:
+        """ Pushes a value to the heap in O(1).
+
+            Args:
+                value (T): The value to push.
+                priority (Any): The priority of value, None to compute it with the key of the heap.
+
+            Returns:
+                (PairingHeap.Node) The handle of the pushed value.
+        """
+        if priority is None:
+            priority = self._key(value) if self._key is not None else value
+
+        node = PairingHeap.Node(priority, next(self._counter), value, self._owner)
+        self._root = self._link(self._root, node)
+        self._size += 1
+
+        return node
+
+    def pop(self) -> T:
+        """ Removes and returns the value with the smallest priority in amortized O(log n).
+
+            Raises:
+                IndexError: If the heap is empty.
+
+            Returns:
+                (T) The value with the smallest priority.
+        """
+        if self._root is None:
+            raise IndexError('Heap is empty.')
+
+        root = self._root
+        self._root = self._merge_pairs(root.child)
+        self._size -= 1
+
+        root.child = root.owner = None
+
+        return root.value
+
+    def decrease_key(self, handle: PairingHeap.Node, priority: Any) -> None:
+        """ Lowers the priority of a pushed value in O(1).
+
+            Args:
+                handle (PairingHeap.Node): The handle returned when the value was pushed.
+                priority (Any): The new priority, which must not be larger than the current one.
+
+            Raises:
+                IndexError: If handle is not in the heap.
+                ValueError: If priority is larger than the current priority.
+        """
+        self._check(handle)
+        if handle.priority < priority:
+            raise ValueError('New priority is larger than the current priority.')
+
+        handle.priority = priority
+        if handle is not self._root:
+            self._cut(handle)
+            self._root = self._link(self._root, handle)
+
+    def remove(self, handle: PairingHeap.Node) -> T:
+        """ Removes a pushed value from the heap in amortized O(log n).
+
+            Args:
+                handle (PairingHeap.Node): The handle returned when the value was pushed.
+
+            Raises:
+                IndexError: If handle is not in the heap.
+
+            Returns:
+                (T) The removed value.
+        """
+        self._check(handle)
+        if handle is self._root:
+            return self.pop()
+
+        self._cut(handle)
+        self._root = self._link(self._root, self._merge_pairs(handle.child))
+        self._size -= 1
+
+        handle.child = handle.owner = None
+
+        return handle.value
+
+    def merge(self, other: PairingHeap[T]) -> None:
+        """ Moves every element of another pairing heap into this one in O(1), leaving the other heap empty.
+
+            Handles of the other heap stay valid and now refer to this heap.
+
+            Args:
+                other (PairingHeap[T]): The heap to merge in.
+
+            Raises:
+                ValueError: If other is this heap.
+        """
+        if other is self:
+            raise ValueError('Can not merge a heap into itself.')
+
+        self._root = self._link(self._root, other._root)
+        self._size += other._size
+
+        other._owner.parent = self._owner
+        other._owner = PairingHeap._Owner()
+        other._root = None
+        other._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self) -> str:
+        values: List[T] = []
+        stack = [self._root] if self._root is not None else []
+        while stack:
+            node = stack.pop()
+            values.append(node.value)
+            for next_node in (node.sibling, node.child):
+                if next_node is not None:
+                    stack.append(next_node)
+
+        return f'PairingHeap({values})'
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from typing import Iterable, Iterator, List, Optional, Generic, TypeVar
+from typing import Iterable, Iterator, List, Optional, Generic, Tuple, TypeVar, Union
 
 
 __all__ = [
+    'DoublyLinkedList',
     'SinglyLinkedList',
+    'UnrolledLinkedList',
 ]
 
 
@@ -12,7 +14,7 @@ T = TypeVar('T')
 
 
 class SingleLinkedListIterator(Generic[T], Iterator):
-    """ Iterator for SinglyLinkedList.
+    """ Iterator for SinglyLinkedList, also used by DoublyLinkedList since it only follows `next` links.
     
         Attributes:
             _node (Optional[SinglyLinkedList.Node]): Current node in iteration.
@@ -44,11 +46,17 @@ class SingleLinkedListIterator(Generic[T], Iterator):
 
 class SinglyLinkedList(Generic[T], Iterable):
     """ Singly linked list implementation.
+
+        Removed nodes can be recycled through a bounded pool, so workloads that keep appending and
+        popping reuse node objects instead of allocating new ones and leaving the old ones to the
+        garbage collector.
     
         Attributes:
             _head (Optional[SinglyLinkedList.Node]): Starting node of list.
             _tail (Optional[SinglyLinkedList.Node]): Ending node of list.
             _size (int): Size of list.
+            _pool (List[SinglyLinkedList.Node]): Removed nodes available for reuse.
+            _pool_size (int): Maximum number of nodes kept in the pool.
     """
     
     class Node:
@@ -58,6 +66,8 @@ class SinglyLinkedList(Generic[T], Iterable):
                 value (T): Value of node.
                 next (Optional[SinglyLinkedList.Node]): Next node in list.
         """
+        __slots__ = ('value', 'next')
+
         value: T
         next: Optional[SinglyLinkedList.Node]
 
@@ -72,10 +82,20 @@ class SinglyLinkedList(Generic[T], Iterable):
     _head: Optional[Node]
     _tail: Optional[Node]
     _size: int
+    _pool: List[Node]
+    _pool_size: int
 
-    def __init__(self, value: Optional[Iterable[T]] = None):
+    def __init__(self, value: Optional[Iterable[T]] = None, pool_size: int = 0):
+        """ Initializes the linked list.
+
+            Args:
+                value (Optional[Iterable[T]]): Values to fill the list with.
+                pool_size (int): Maximum number of removed nodes kept for reuse, 0 disables pooling.
+        """
         self._head = self._tail = None
         self._size = 0
+        self._pool = []
+        self._pool_size = pool_size
 
         if value is not None:
             self._link_list(value)
@@ -96,6 +116,31 @@ class SinglyLinkedList(Generic[T], Iterable):
         """ Iterator for SinglyLinkedList. """
         return SingleLinkedListIterator(self._head)
 
+    def _new_node(self, value: T) -> SinglyLinkedList.Node:
+        """ Get a node holding value, reusing a pooled node when one is available.
+
+            Args:
+                value (T): Value of node.
+        """
+        if self._pool:
+            node = self._pool.pop()
+            node.value = value
+            return node
+
+        return SinglyLinkedList.Node(value=value)
+
+    def _release_node(self, node: SinglyLinkedList.Node) -> None:
+        """ Return a removed node to the pool, unless the pool is full.
+
+            Args:
+                node (SinglyLinkedList.Node): Node that was unlinked from the list.
+        """
+        if len(self._pool) < self._pool_size:
+            # Drop references so the pool does not keep removed values or nodes alive
+            node.value = None
+            node.next = None
+            self._pool.append(node)
+
     def _link_list(self, value: Iterable[T]) -> None:
         """ Link list of values together.
         
@@ -104,7 +149,7 @@ class SinglyLinkedList(Generic[T], Iterable):
         """
         prev_node: Optional[SinglyLinkedList.Node] = None
         for val in value:
-            new_node: SinglyLinkedList.Node = SinglyLinkedList.Node(val)
+            new_node: SinglyLinkedList.Node = self._new_node(val)
 
             if prev_node is not None:
                 prev_node.next = new_node
@@ -137,7 +182,7 @@ class SinglyLinkedList(Generic[T], Iterable):
             Args:
                 value (T): Value to append to end of list.
         """
-        new_node = SinglyLinkedList.Node(value=value)
+        new_node = self._new_node(value)
         
         if self._head is None and self._tail is None:
             self._head = new_node
@@ -154,10 +199,10 @@ class SinglyLinkedList(Generic[T], Iterable):
             Args:
                 value (T): Value to insert at start of list.
         """
-        new_node = SinglyLinkedList.Node(value=value)
+        new_node = self._new_node(value)
 
         if self._head is None:
-            self._head = new_node
+            self._head = self._tail = new_node
         else:
             new_node.next = self._head
             self._head = new_node
@@ -173,7 +218,8 @@ class SinglyLinkedList(Generic[T], Iterable):
         if self._tail is None:
             return None
 
-        ret = self._tail.value
+        removed = self._tail
+        ret = removed.value
 
         node = self._head
         while node is not None:
@@ -188,6 +234,7 @@ class SinglyLinkedList(Generic[T], Iterable):
             node = node.next
         
         self._size -= 1
+        self._release_node(removed)
 
         return ret
 
@@ -232,6 +279,7 @@ class SinglyLinkedList(Generic[T], Iterable):
             node = node.next
 
         self._size -= 1
+        self._release_node(node)
 
     def get(self, index: int) -> T:
         """ Get value at index
@@ -275,3 +323,629 @@ class SinglyLinkedList(Generic[T], Iterable):
             node = node.next
         
         return count
+
+
+class DoublyLinkedList(Generic[T], Iterable):
+    """ Doubly linked list implementation.
+
+        Every node links to its previous node, so both ends can be popped in O(1). `append`, `insert`
+        and `insert_after` return the new node, which can later be passed to `insert_after` or
+        `remove_node` to edit the list around it in O(1), e.g. to build an LRU cache. Every node knows the
+        list it is in, so a handle from another list or one already removed raises IndexError.
+
+        Attributes:
+            _head (Optional[DoublyLinkedList.Node]): Starting node of list.
+            _tail (Optional[DoublyLinkedList.Node]): Ending node of list.
+            _size (int): Size of list.
+    """
+
+    class Node:
+        """ Node class for DoublyLinkedList.
+
+            Attributes:
+                value (T): Value of node.
+                prev (Optional[DoublyLinkedList.Node]): Previous node in list.
+                next (Optional[DoublyLinkedList.Node]): Next node in list.
+                owner (Optional[DoublyLinkedList]): List the node is in, None once it is removed.
+        """
+        __slots__ = ('value', 'prev', 'next', 'owner')
+
+        value: T
+        prev: Optional[DoublyLinkedList.Node]
+        next: Optional[DoublyLinkedList.Node]
+        owner: Optional[DoublyLinkedList]
+
+        def __init__(self, value: T, owner: Optional[DoublyLinkedList] = None):
+            self.value = value
+            self.prev = None
+            self.next = None
+            self.owner = owner
+
+        def __repr__(self) -> str:
+            """ Representation of Node. """
+            prev_value = self.prev.value if self.prev else None
+            next_value = self.next.value if self.next else None
+            return f'<Node value={self.value} prev={prev_value} next={next_value}>'
+
+    _head: Optional[Node]
+    _tail: Optional[Node]
+    _size: int
+
+    def __init__(self, value: Optional[Iterable[T]] = None):
+        self._head = self._tail = None
+        self._size = 0
+
+        if value is not None:
+            for val in value:
+                self.append(val)
+
+    def __str__(self) -> str:
+        """ String representation of DoublyLinkedList. """
+        return str(self.to_list())
+
+    def __repr__(self) -> str:
+        """ Representation of DoublyLinkedList. """
+        return f'DoublyLinkedList ({self.__str__()})'
+
+    def __len__(self) -> int:
+        """ Length of DoublyLinkedList. """
+        return self._size
+
+    def __iter__(self) -> SingleLinkedListIterator[T]:
+        """ Iterator for DoublyLinkedList. """
+        return SingleLinkedListIterator(self._head)
+
+    def __reversed__(self) -> Iterator[T]:
+        """ Iterator for DoublyLinkedList from tail to head. """
+        node = self._tail
+        while node is not None:
+            yield node.value
+            node = node.prev
+
+    def to_list(self) -> List[T]:
+        """ Convert linked list to python list.
+
+            Returns:
+                List[T]: Python list representation of linked list.
+        """
+        return list(self)
+
+    def append(self, value: T) -> DoublyLinkedList.Node:
+        """ Append value to end of list.
+
+            Args:
+                value (T): Value to append to end of list.
+
+            Returns:
+                DoublyLinkedList.Node: Node holding value.
+        """
+        new_node = DoublyLinkedList.Node(value=value, owner=self)
+
+        if self._tail is None:
+            self._head = new_node
+        else:
+            new_node.prev = self._tail
+            self._tail.next = new_node
+
+        self._tail = new_node
+        self._size += 1
+
+        return new_node
+
+    def insert(self, value: T) -> DoublyLinkedList.Node:
+        """ Insert value at start of list.
+
+            Args:
+                value (T): Value to insert at start of list.
+
+            Returns:
+                DoublyLinkedList.Node: Node holding value.
+        """
+        new_node = DoublyLinkedList.Node(value=value, owner=self)
+
+        if self._head is None:
+            self._tail = new_node
+        else:
+            new_node.next = self._head
+            self._head.prev = new_node
+
+        self._head = new_node
+        self._size += 1
+
+        return new_node
+
+    def insert_after(self, node: DoublyLinkedList.Node, value: T) -> DoublyLinkedList.Node:
+        """ Insert value directly after node in O(1).
+
+            Args:
+                node (DoublyLinkedList.Node): Node of this list to insert after.
+                value (T): Value to insert.
+
+            Raises:
+                IndexError: If node is not in this list.
+
+            Returns:
+                DoublyLinkedList.Node: Node holding value.
+        """
+        self._check(node)
+
+        new_node = DoublyLinkedList.Node(value=value, owner=self)
+        new_node.prev = node
+        new_node.next = node.next
+
+        if node.next is None:
+            self._tail = new_node
+        else:
+            node.next.prev = new_node
+
+        node.next = new_node
+        self._size += 1
+
+        return new_node
+
+    def _check(self, node: DoublyLinkedList.Node) -> None:
+        """ Check in O(1) that node is in this list, and not a handle from another list or one already removed.
+
+            Args:
+                node (DoublyLinkedList.Node): Node to check.
+
+            Raises:
+                IndexError: If node is not in this list.
+        """
+        if node.owner is not self:
+            raise IndexError('Node is not in list')
+
+    def remove_node(self, node: DoublyLinkedList.Node) -> T:
+        """ Remove node from list in O(1).
+
+            Removing a node twice raises instead of corrupting the list:
+
+            >>> d = DoublyLinkedList([1, 2, 3])
+            >>> node = d.append(4)
+            >>> d.remove_node(node)
+            4
+            >>> d.remove_node(node)
+            Traceback (most recent call last):
+                ...
+            IndexError: Node is not in list
+            >>> d.to_list(), len(d)
+            ([1, 2, 3], 3)
+
+            Args:
+                node (DoublyLinkedList.Node): Node of this list to remove.
+
+            Raises:
+                IndexError: If node is not in this list.
+
+            Returns:
+                T: Value of removed node.
+        """
+        self._check(node)
+
+        if node.prev is None:
+            self._head = node.next
+        else:
+            node.prev.next = node.next
+
+        if node.next is None:
+            self._tail = node.prev
+        else:
+            node.next.prev = node.prev
+
+        node.prev = node.next = node.owner = None
+        self._size -= 1
+
+        return node.value
+
+    def pop(self) -> Optional[T]:
+        """ Remove and return last element in list in O(1).
+
+            Returns:
+                T: Value of last element in list, or None if list is empty.
+        """
+        if self._tail is None:
+            return None
+
+        return self.remove_node(self._tail)
+
+    def popleft(self) -> Optional[T]:
+        """ Remove and return first element in list in O(1).
+
+            Returns:
+                T: Value of first element in list, or None if list is empty.
+        """
+        if self._head is None:
+            return None
+
+        return self.remove_node(self._head)
+
+    def remove(self, value: T) -> T:
+        """ Remove first occurence of value in list
+
+            Args:
+                value (T): Value to remove
+
+            Raises:
+                IndexError: If value is not in list
+
+            Returns:
+                T: Value removed
+        """
+        node = self._head
+        while node is not None:
+            if node.value == value:
+                return self.remove_node(node)
+
+            node = node.next
+
+        raise IndexError(f'No element of value {value}')
+
+    def get(self, index: int) -> T:
+        """ Get value at index, walking from whichever end is closer
+
+            Args:
+                index (int): Index of value to get
+
+            Raises:
+                IndexError: If index is out of bounds
+
+            Returns:
+                T: Value at index
+        """
+        if not 0 <= index < self._size:
+            raise IndexError(f'Index not accessible')
+
+        if index < self._size // 2:
+            node = self._head
+            for _ in range(index):
+                node = node.next
+        else:
+            node = self._tail
+            for _ in range(self._size - 1 - index):
+                node = node.prev
+
+        return node.value
+
+    def count(self, value: T) -> int:
+        """ Count number of times value appears in list
+
+            Args:
+                value (T): Value to count
+
+            Returns:
+                int: Number of times value appears in list
+        """
+        return sum(1 for val in self if val == value)
+
+
+class UnrolledLinkedList(Generic[T], Iterable):
+    """ Unrolled linked list implementation, a drop in replacement for SinglyLinkedList.
+
+        Every node holds a block of up to `block_size` values, so walking the list follows one link
+        per block instead of one per value. Indexed access is O(n / block_size) and iteration mostly
+        runs over contiguous python lists.
+
+        Attributes:
+            _head (Optional[UnrolledLinkedList.Node]): Starting node of list.
+            _tail (Optional[UnrolledLinkedList.Node]): Ending node of list.
+            _size (int): Size of list.
+            _block_size (int): Maximum number of values held by a node.
+    """
+
+    class Node:
+        """ Node class for UnrolledLinkedList.
+
+            Attributes:
+                values (List[T]): Values of node, never empty while the node is linked.
+                next (Optional[UnrolledLinkedList.Node]): Next node in list.
+        """
+        __slots__ = ('values', 'next')
+
+        values: List[T]
+        next: Optional[UnrolledLinkedList.Node]
+
+        def __init__(self, values: List[T]):
+            self.values = values
+            self.next = None
+
+        def __repr__(self) -> str:
+            """ Representation of Node. """
+            return f'<Node values={self.values} next={self.next.values if self.next else None}>'
+
+    _head: Optional[Node]
+    _tail: Optional[Node]
+    _size: int
+    _block_size: int
+
+    def __init__(self, value: Optional[Iterable[T]] = None, block_size: int = 64):
+        """ Initializes the linked list.
+
+            Args:
+                value (Optional[Iterable[T]]): Values to fill the list with.
+                block_size (int): Maximum number of values held by a node.
+
+            Raises:
+                ValueError: If block_size is less than 1.
+        """
+        if block_size < 1:
+            raise ValueError('Block size must be at least 1.')
+
+        self._head = self._tail = None
+        self._size = 0
+        self._block_size = block_size
+
+        if value is not None:
+            self.extend(value)
+
+    def __str__(self) -> str:
+        """ String representation of UnrolledLinkedList. """
+        return str(self.to_list())
+
+    def __repr__(self) -> str:
+        """ Representation of UnrolledLinkedList. """
+        return f'UnrolledLinkedList ({self.__str__()})'
+
+    def __len__(self) -> int:
+        """ Length of UnrolledLinkedList. """
+        return self._size
+
+    def __iter__(self) -> Iterator[T]:
+        """ Iterator for UnrolledLinkedList. """
+        node = self._head
+        while node is not None:
+            yield from node.values
+            node = node.next
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, UnrolledLinkedList[T]]:
+        """ Get value at index, or a new list holding the values of a slice.
+
+            Args:
+                index (Union[int, slice]): Index of value, negative indices count from the end.
+
+            Raises:
+                IndexError: If index is out of bounds.
+
+            Returns:
+                Union[T, UnrolledLinkedList[T]]: Value at index, or list of sliced values.
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._size)
+            if step == 1:
+                values = self._slice(start, stop)
+            else:
+                values = self.to_list()[index]
+
+            return UnrolledLinkedList(values, block_size=self._block_size)
+
+        if index < 0:
+            index += self._size
+
+        return self.get(index)
+
+    def _locate(self, index: int) -> Tuple[UnrolledLinkedList.Node, int]:
+        """ Find the node holding index.
+
+            Args:
+                index (int): Index in bounds of the list.
+
+            Returns:
+                Tuple[UnrolledLinkedList.Node, int]: Node holding index and the position of index within the node.
+        """
+        node = self._head
+        while index >= len(node.values):
+            index -= len(node.values)
+            node = node.next
+
+        return node, index
+
+    def _slice(self, start: int, stop: int) -> List[T]:
+        """ Values from start up to, but not including, stop, copying whole blocks at a time.
+
+            Args:
+                start (int): Index of first value, clamped to the list.
+                stop (int): Index after last value, clamped to the list.
+        """
+        ret: List[T] = []
+        if start >= stop or start >= self._size:
+            return ret
+
+        node, offset = self._locate(start)
+        remaining = stop - start
+        while node is not None and remaining > 0:
+            chunk = node.values[offset:offset + remaining]
+            ret.extend(chunk)
+            remaining -= len(chunk)
+            offset = 0
+            node = node.next
+
+        return ret
+
+    def to_list(self) -> List[T]:
+        """ Convert linked list to python list.
+
+            Returns:
+                List[T]: Python list representation of linked list.
+        """
+        ret: List[T] = []
+
+        node = self._head
+        while node is not None:
+            ret.extend(node.values)
+            node = node.next
+
+        return ret
+
+    def _link_node(self, node: UnrolledLinkedList.Node) -> None:
+        """ Link node to end of list.
+
+            Args:
+                node (UnrolledLinkedList.Node): Node to link.
+        """
+        if self._tail is None:
+            self._head = node
+        else:
+            self._tail.next = node
+
+        self._tail = node
+
+    def append(self, value: T) -> None:
+        """ Append value to end of list.
+
+            Args:
+                value (T): Value to append to end of list.
+        """
+        if self._tail is None or len(self._tail.values) >= self._block_size:
+            self._link_node(UnrolledLinkedList.Node([value]))
+        else:
+            self._tail.values.append(value)
+
+        self._size += 1
+
+    def extend(self, values: Iterable[T]) -> None:
+        """ Append values to end of list, filling whole blocks at a time.
+
+            Args:
+                values (Iterable[T]): Values to append to end of list.
+        """
+        values = list(values)
+        start = 0
+
+        if self._tail is not None:
+            start = self._block_size - len(self._tail.values)
+            self._tail.values.extend(values[:start])
+
+        for block_start in range(start, len(values), self._block_size):
+            self._link_node(UnrolledLinkedList.Node(values[block_start:block_start + self._block_size]))
+
+        self._size += len(values)
+
+    def insert(self, value: T) -> None:
+        """ Insert value at start of list.
+
+            Args:
+                value (T): Value to insert at start of list.
+        """
+        if self._head is None or len(self._head.values) >= self._block_size:
+            new_node = UnrolledLinkedList.Node([value])
+            new_node.next = self._head
+            self._head = new_node
+
+            if self._tail is None:
+                self._tail = new_node
+        else:
+            self._head.values.insert(0, value)
+
+        self._size += 1
+
+    def _unlink_node(self, node: UnrolledLinkedList.Node, prev_node: Optional[UnrolledLinkedList.Node]) -> None:
+        """ Unlink an empty node from list.
+
+            Args:
+                node (UnrolledLinkedList.Node): Node to unlink.
+                prev_node (Optional[UnrolledLinkedList.Node]): Node before node, or None if node is the head.
+        """
+        if prev_node is None:
+            self._head = node.next
+        else:
+            prev_node.next = node.next
+
+        if node is self._tail:
+            self._tail = prev_node
+
+    def pop(self) -> Optional[T]:
+        """ Remove and return last element in list.
+
+            Only walks the list when the last node is emptied.
+
+            Returns:
+                T: Value of last element in list, or None if list is empty.
+        """
+        if self._tail is None:
+            return None
+
+        ret = self._tail.values.pop()
+        self._size -= 1
+
+        if not self._tail.values:
+            prev_node: Optional[UnrolledLinkedList.Node] = None
+            node = self._head
+            while node is not self._tail:
+                prev_node = node
+                node = node.next
+
+            self._unlink_node(self._tail, prev_node)
+
+        return ret
+
+    def remove(self, value: T) -> T:
+        """ Remove first occurence of value in list
+
+            Args:
+                value (T): Value to remove
+
+            Raises:
+                IndexError: If value is not in list
+
+            Returns:
+                T: Value removed
+        """
+        prev_node: Optional[UnrolledLinkedList.Node] = None
+        node = self._head
+        while node is not None:
+            try:
+                index = node.values.index(value)
+            except ValueError:
+                prev_node = node
+                node = node.next
+                continue
+
+            removed = node.values.pop(index)
+            self._size -= 1
+
+            if not node.values:
+                self._unlink_node(node, prev_node)
+            # Merge with the next node when both fit in one block, so blocks do not stay sparse
+            elif node.next is not None and len(node.values) + len(node.next.values) <= self._block_size:
+                node.values.extend(node.next.values)
+                self._unlink_node(node.next, node)
+
+            return removed
+
+        raise IndexError(f'No element of value {value}')
+
+    def get(self, index: int) -> T:
+        """ Get value at index
+
+            Args:
+                index (int): Index of value to get
+
+            Raises:
+                IndexError: If index is out of bounds
+
+            Returns:
+                T: Value at index
+        """
+        if not 0 <= index < self._size:
+            raise IndexError(f'Index not accessible')
+
+        node, offset = self._locate(index)
+
+        return node.values[offset]
+
+    def count(self, value: T) -> int:
+        """ Count number of times value appears in list
+
+            Args:
+                value (T): Value to count
+
+            Returns:
+                int: Number of times value appears in list
+        """
+        count: int = 0
+
+        node = self._head
+        while node is not None:
+            count += node.values.count(value)
+            node = node.next
+
+        return count
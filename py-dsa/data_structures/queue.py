@@ -2,11 +2,23 @@
 
 from __future__ import annotations
 
-from typing import Generic, TypeVar
+import asyncio
+import threading
+from array import array
+from collections import deque
+from itertools import chain
+from typing import Callable, Deque, Generic, Iterable, Iterator, List, MutableSequence, Optional, Tuple, TypeVar
+
+from .stack import MinMaxStack
 
 
 __all__ = [
+    'AsyncFrontMiddleBackQueue',
+    'ConcurrentFrontMiddleBackQueue',
     'FrontMiddleBackQueue',
+    'MinMaxQueue',
+    'RingBufferQueue',
+    'sliding_window_extrema',
 ]
 
 
@@ -16,12 +28,16 @@ T = TypeVar('T')
 class FrontMiddleBackQueue(Generic[T]):
     """ A queue that supports adding and removing elements from the front, middle, and back of the queue.
 
+        The queue is split into two deques holding its front and back halves, where the back half holds
+        either as many elements as the front half or one more. The middle is always at the boundary of
+        the halves, so every operation is amortized O(1).
+
         Attributes:
             size (int): The size of the queue.
 
         Private Attributes:
-            _queue (List[T]): The queue.
-            _middle_index (int): The middle index of the queue.
+            _front (Deque[T]): The front half of the queue.
+            _back (Deque[T]): The back half of the queue.
         
         Methods:
             is_empty: Returns whether the queue is empty.
@@ -34,17 +50,24 @@ class FrontMiddleBackQueue(Generic[T]):
     """
 
     def __init__(self):
-        self._queue = []
+        self._front: Deque[T] = deque()
+        self._back: Deque[T] = deque()
 
     @property
     def size(self) -> int:
         """ Returns the size of the queue. """
-        return len(self._queue)
+        return len(self._front) + len(self._back)
 
-    @property
-    def _middle_index(self) -> int:
-        """ Returns the middle index of the queue. """
-        return int(self.size // 2)
+    def _rebalance(self) -> None:
+        """ Moves an element across the halves to restore their balance.
+
+            A single push or pop changes the difference in size of the halves by at most one, so one move
+            is always enough.
+        """
+        if len(self._front) > len(self._back):
+            self._back.appendleft(self._front.pop())
+        elif len(self._back) > len(self._front) + 1:
+            self._front.append(self._back.popleft())
 
     def is_empty(self) -> bool:
         """ Returns whether the queue is empty.
@@ -60,7 +83,8 @@ class FrontMiddleBackQueue(Generic[T]):
             Args:
                 val (T): The value to add to the front of the queue.
         """
-        self._queue.insert(0, val)
+        self._front.appendleft(val)
+        self._rebalance()
 
     def push_middle(self, val: T) -> None:
         """ Adds a value to the middle of the queue.
@@ -68,7 +92,9 @@ class FrontMiddleBackQueue(Generic[T]):
             Args:
                 val (T): The value to add to the middle of the queue.
         """
-        self._queue.insert(self._middle_index, val)
+        # The middle index is size // 2, which is the end of the front half
+        self._front.append(val)
+        self._rebalance()
 
     def push_back(self, val: T) -> None:
         """ Adds a value to the back of the queue.
@@ -76,7 +102,8 @@ class FrontMiddleBackQueue(Generic[T]):
             Args:
                 val (T): The value to add to the back of the queue.
         """
-        self._queue.append(val)
+        self._back.append(val)
+        self._rebalance()
 
     def pop_front(self) -> T:
         """ Removes and returns the first element of the queue.
@@ -90,7 +117,11 @@ class FrontMiddleBackQueue(Generic[T]):
         if self.is_empty():
             raise IndexError('Queue is empty.')
 
-        return self._queue.pop(0)
+        # A queue of one element keeps it in the back half
+        val = self._front.popleft() if self._front else self._back.popleft()
+        self._rebalance()
+
+        return val
 
     def pop_middle(self) -> T:
         """ Removes and returns the middle element of the queue.
@@ -104,10 +135,14 @@ class FrontMiddleBackQueue(Generic[T]):
         if self.is_empty():
             raise IndexError('Queue is empty.')
 
-        if self.size % 2 == 0:
-            return self._queue.pop(self._middle_index - 1)
+        # With an even size the middle is the end of the front half, otherwise the start of the back half
+        if len(self._front) == len(self._back):
+            val = self._front.pop()
+        else:
+            val = self._back.popleft()
+        self._rebalance()
 
-        return self._queue.pop(self._middle_index)
+        return val
 
     def pop_back(self) -> T:
         """ Removes and returns the last element of the queue.
@@ -121,13 +156,891 @@ class FrontMiddleBackQueue(Generic[T]):
         if self.is_empty():
             raise IndexError('Queue is empty.')
 
-        return self._queue.pop(-1)
+        val = self._back.pop()
+        self._rebalance()
+
+        return val
+
+    def __iter__(self) -> Iterator[T]:
+        return chain(self._front, self._back)
 
     def __str__(self) -> str:
-        return str(self._queue)
+        return str(list(self))
 
     def __repr__(self) -> str:
-        return f'FrontMiddleBackQueue({self._queue})'
+        return f'FrontMiddleBackQueue({list(self)})'
     
     def __len__(self) -> int:
         return self.size
+
+
+class ConcurrentFrontMiddleBackQueue(FrontMiddleBackQueue[T]):
+    """ A thread-safe FrontMiddleBackQueue whose pops block until an element is available.
+
+        Every operation is O(1), so a single lock held for the duration of an operation is cheaper than
+        separate locks per half, which the middle operations and rebalancing would have to take together
+        anyway. Waiting threads do not hold the lock; consumers wait on `_not_empty` and, when the queue
+        is bounded, producers wait on `_not_full`. Reading the size and iterating take the lock too, and
+        iterating walks a snapshot, so other threads can keep pushing meanwhile.
+
+        Private Attributes:
+            _maxsize (int): The maximum size of the queue, 0 for unbounded.
+            _lock (threading.RLock): The lock guarding the queue, reentrant since the pops of the base queue
+                read the size while it is held.
+            _not_empty (threading.Condition): Notified when an element is pushed.
+            _not_full (threading.Condition): Notified when an element is popped.
+    """
+
+    def __init__(self, maxsize: int = 0):
+        """ Initializes the queue.
+
+            Args:
+                maxsize (int): The maximum size of the queue, where pushes block while it is full. 0 for unbounded.
+        """
+        super().__init__()
+        self._maxsize = maxsize
+        self._lock = threading.RLock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    @property
+    def size(self) -> int:
+        """ Returns the size of the queue. """
+        with self._lock:
+            return len(self._front) + len(self._back)
+
+    def _push(self,
+              push: Callable[[FrontMiddleBackQueue[T], T], None],
+              val: T,
+              block: bool,
+              timeout: Optional[float]) -> None:
+        """ Pushes a value once there is room in the queue.
+
+            Args:
+                push (Callable[[FrontMiddleBackQueue[T], T], None]): The unsynchronized push to run.
+                val (T): The value to push.
+                block (bool): Whether to wait for room in the queue.
+                timeout (Optional[float]): The maximum number of seconds to wait, None to wait forever.
+
+            Raises:
+                IndexError: If the queue is still full once done waiting.
+        """
+        with self._not_full:
+            if self._maxsize > 0 and not self._not_full.wait_for(
+                    lambda: self.size < self._maxsize, timeout if block else 0):
+                raise IndexError('Queue is full.')
+
+            push(self, val)
+            self._not_empty.notify()
+
+    def _pop(self, pop: Callable[[FrontMiddleBackQueue[T]], T], block: bool, timeout: Optional[float]) -> T:
+        """ Pops a value once the queue is not empty.
+
+            Args:
+                pop (Callable[[FrontMiddleBackQueue[T]], T]): The unsynchronized pop to run.
+                block (bool): Whether to wait for an element.
+                timeout (Optional[float]): The maximum number of seconds to wait, None to wait forever.
+
+            Raises:
+                IndexError: If the queue is still empty once done waiting.
+
+            Returns:
+                (T) The popped value.
+        """
+        with self._not_empty:
+            if not self._not_empty.wait_for(lambda: self.size > 0, timeout if block else 0):
+                raise IndexError('Queue is empty.')
+
+            val = pop(self)
+            self._not_full.notify()
+
+            return val
+
+    def push_front(self, val: T, block: bool = True, timeout: Optional[float] = None) -> None:
+        """ Adds a value to the front of the queue, waiting for room if the queue is bounded.
+
+            Args:
+                val (T): The value to add to the front of the queue.
+                block (bool): Whether to wait for room in the queue.
+                timeout (Optional[float]): The maximum number of seconds to wait, None to wait forever.
+
+            Raises:
+                IndexError: If the queue is full.
+        """
+        self._push(FrontMiddleBackQueue.push_front, val, block, timeout)
+
+    def push_middle(self, val: T, block: bool = True, timeout: Optional[float] = None) -> None:
+        """ Adds a value to the middle of the queue, waiting for room if the queue is bounded.
+
+            Args:
+                val (T): The value to add to the middle of the queue.
+                block (bool): Whether to wait for room in the queue.
+                timeout (Optional[float]): The maximum number of seconds to wait, None to wait forever.
+
+            Raises:
+                IndexError: If the queue is full.
+        """
+        self._push(FrontMiddleBackQueue.push_middle, val, block, timeout)
+
+    def push_back(self, val: T, block: bool = True, timeout: Optional[float] = None) -> None:
+        """ Adds a value to the back of the queue, waiting for room if the queue is bounded.
+
+            Args:
+                val (T): The value to add to the back of the queue.
+                block (bool): Whether to wait for room in the queue.
+                timeout (Optional[float]): The maximum number of seconds to wait, None to wait forever.
+
+            Raises:
+                IndexError: If the queue is full.
+        """
+        self._push(FrontMiddleBackQueue.push_back, val, block, timeout)
+
+    def pop_front(self, block: bool = True, timeout: Optional[float] = None) -> T:
+        """ Removes and returns the first element of the queue, waiting for one if the queue is empty.
+
+            Args:
+                block (bool): Whether to wait for an element.
+                timeout (Optional[float]): The maximum number of seconds to wait, None to wait forever.
+
+            Raises:
+                IndexError: If the queue is empty.
+
+            Returns:
+                (T) The first element of the queue.
+        """
+        return self._pop(FrontMiddleBackQueue.pop_front, block, timeout)
+
+    def pop_middle(self, block: bool = True, timeout: Optional[float] = None) -> T:
+        """ Removes and returns the middle element of the queue, waiting for one if the queue is empty.
+
+            Args:
+                block (bool): Whether to wait for an element.
+                timeout (Optional[float]): The maximum number of seconds to wait, None to wait forever.
+
+            Raises:
+                IndexError: If the queue is empty.
+
+            Returns:
+                (T) The middle element of the queue.
+        """
+        return self._pop(FrontMiddleBackQueue.pop_middle, block, timeout)
+
+    def pop_back(self, block: bool = True, timeout: Optional[float] = None) -> T:
+        """ Removes and returns the last element of the queue, waiting for one if the queue is empty.
+
+            Args:
+                block (bool): Whether to wait for an element.
+                timeout (Optional[float]): The maximum number of seconds to wait, None to wait forever.
+
+            Raises:
+                IndexError: If the queue is empty.
+
+            Returns:
+                (T) The last element of the queue.
+        """
+        return self._pop(FrontMiddleBackQueue.pop_back, block, timeout)
+
+    def __iter__(self) -> Iterator[T]:
+        with self._lock:
+            return iter(list(super().__iter__()))
+
+    def __str__(self) -> str:
+        with self._lock:
+            return super().__str__()
+
+    def __repr__(self) -> str:
+        with self._lock:
+            return f'ConcurrentFrontMiddleBackQueue({list(super().__iter__())})'
+
+
+class AsyncFrontMiddleBackQueue(Generic[T]):
+    """ A FrontMiddleBackQueue for asyncio, with awaitable pops and pushes that wait while the queue is full.
+
+        The queue must only be used from the event loop it was first awaited in. Producers running in
+        other threads can hand values over with `asyncio.run_coroutine_threadsafe(queue.push_back(val), loop)`.
+
+        Attributes:
+            size (int): The size of the queue.
+
+        Private Attributes:
+            _queue (FrontMiddleBackQueue[T]): The underlying queue.
+            _maxsize (int): The maximum size of the queue, 0 for unbounded.
+            _not_empty (asyncio.Condition): Notified when an element is pushed.
+            _not_full (asyncio.Condition): Notified when an element is popped.
+    """
+
+    def __init__(self, maxsize: int = 0):
+        """ Initializes the queue.
+
+            Args:
+                maxsize (int): The maximum size of the queue, where pushes wait while it is full. 0 for unbounded.
+        """
+        self._queue: FrontMiddleBackQueue[T] = FrontMiddleBackQueue()
+        self._maxsize = maxsize
+        lock = asyncio.Lock()
+        self._not_empty = asyncio.Condition(lock)
+        self._not_full = asyncio.Condition(lock)
+
+    @property
+    def size(self) -> int:
+        """ Returns the size of the queue. """
+        return self._queue.size
+
+    def is_empty(self) -> bool:
+        """ Returns whether the queue is empty.
+
+            Returns:
+                (bool) Whether the queue is empty.
+        """
+        return self._queue.is_empty()
+
+    async def _push(self, push: Callable[[T], None], val: T, timeout: Optional[float]) -> None:
+        """ Pushes a value once there is room in the queue.
+
+            Args:
+                push (Callable[[T], None]): The push of the underlying queue to run.
+                val (T): The value to push.
+                timeout (Optional[float]): The maximum number of seconds to wait, None to wait forever.
+
+            Raises:
+                IndexError: If the queue is still full once done waiting.
+        """
+        async with self._not_full:
+            # Only wait when there is no room, since wait_for cancels the wait before it runs when timeout is 0
+            if self._maxsize > 0 and self.size >= self._maxsize:
+                try:
+                    await asyncio.wait_for(self._not_full.wait_for(lambda: self.size < self._maxsize), timeout)
+                except asyncio.TimeoutError:
+                    raise IndexError('Queue is full.') from None
+
+            push(val)
+            self._not_empty.notify()
+
+    async def _pop(self, pop: Callable[[], T], timeout: Optional[float]) -> T:
+        """ Pops a value once the queue is not empty.
+
+            Args:
+                pop (Callable[[], T]): The pop of the underlying queue to run.
+                timeout (Optional[float]): The maximum number of seconds to wait, None to wait forever.
+
+            Raises:
+                IndexError: If the queue is still empty once done waiting.
+
+            Returns:
+                (T) The popped value.
+        """
+        async with self._not_empty:
+            # Only wait when the queue is empty, since wait_for cancels the wait before it runs when timeout is 0
+            if self.size == 0:
+                try:
+                    await asyncio.wait_for(self._not_empty.wait_for(lambda: self.size > 0), timeout)
+                except asyncio.TimeoutError:
+                    raise IndexError('Queue is empty.') from None
+
+            val = pop()
+            self._not_full.notify()
+
+            return val
+
+    async def push_front(self, val: T, timeout: Optional[float] = None) -> None:
+        """ Adds a value to the front of the queue, waiting for room if the queue is bounded.
+
+            Args:
+                val (T): The value to add to the front of the queue.
+                timeout (Optional[float]): The maximum number of seconds to wait, None to wait forever.
+
+            Raises:
+                IndexError: If the queue is full.
+        """
+        await self._push(self._queue.push_front, val, timeout)
+
+    async def push_middle(self, val: T, timeout: Optional[float] = None) -> None:
+        """ Adds a value to the middle of the queue, waiting for room if the queue is bounded.
+
+            Args:
+                val (T): The value to add to the middle of the queue.
+                timeout (Optional[float]): The maximum number of seconds to wait, None to wait forever.
+
+            Raises:
+                IndexError: If the queue is full.
+        """
+        await self._push(self._queue.push_middle, val, timeout)
+
+    async def push_back(self, val: T, timeout: Optional[float] = None) -> None:
+        """ Adds a value to the back of the queue, waiting for room if the queue is bounded.
+
+            Args:
+                val (T): The value to add to the back of the queue.
+                timeout (Optional[float]): The maximum number of seconds to wait, None to wait forever.
+
+            Raises:
+                IndexError: If the queue is full.
+        """
+        await self._push(self._queue.push_back, val, timeout)
+
+    async def pop_front(self, timeout: Optional[float] = None) -> T:
+        """ Removes and returns the first element of the queue, waiting for one if the queue is empty.
+
+            Args:
+                timeout (Optional[float]): The maximum number of seconds to wait, None to wait forever.
+
+            Raises:
+                IndexError: If the queue is empty.
+
+            Returns:
+                (T) The first element of the queue.
+        """
+        return await self._pop(self._queue.pop_front, timeout)
+
+    async def pop_middle(self, timeout: Optional[float] = None) -> T:
+        """ Removes and returns the middle element of the queue, waiting for one if the queue is empty.
+
+            Args:
+                timeout (Optional[float]): The maximum number of seconds to wait, None to wait forever.
+
+            Raises:
+                IndexError: If the queue is empty.
+
+            Returns:
+                (T) The middle element of the queue.
+        """
+        return await self._pop(self._queue.pop_middle, timeout)
+
+    async def pop_back(self, timeout: Optional[float] = None) -> T:
+        """ Removes and returns the last element of the queue, waiting for one if the queue is empty.
+
+            Args:
+                timeout (Optional[float]): The maximum number of seconds to wait, None to wait forever.
+
+            Raises:
+                IndexError: If the queue is empty.
+
+            Returns:
+                (T) The last element of the queue.
+        """
+        return await self._pop(self._queue.pop_back, timeout)
+
+    def __str__(self) -> str:
+        return str(self._queue)
+
+    def __repr__(self) -> str:
+        return f'AsyncFrontMiddleBackQueue({list(self._queue)})'
+
+    def __len__(self) -> int:
+        return self.size
+
+
+class RingBufferQueue(Generic[T]):
+    """ A fixed capacity FIFO queue stored in a preallocated circular buffer.
+
+        The buffer never grows, so pushing and popping only move the head and tail indices and
+        memory stays constant. Passing a `typecode` stores the values unboxed in an `array`.
+
+        What happens when pushing to a full queue is set by `overflow`:
+            reject: raise IndexError.
+            overwrite: drop the oldest element to make room, keeping a window of the newest elements.
+            block: wait until a consumer thread pops an element. Every operation then takes a lock.
+
+        Attributes:
+            size (int): The size of the queue.
+            capacity (int): The maximum size of the queue.
+
+        Private Attributes:
+            _buffer (MutableSequence[T]): The circular buffer.
+            _head (int): The index of the first element in the buffer.
+            _size (int): The size of the queue.
+            _overflow (str): The overflow policy.
+            _not_full (Optional[threading.Condition]): Notified when an element is popped, only with the block policy.
+
+        Methods:
+            is_empty: Returns whether the queue is empty.
+            is_full: Returns whether the queue is full.
+            peek: Returns the first element of the queue.
+            push: Adds a value to the back of the queue.
+            push_many: Adds values to the back of the queue.
+            pop: Removes and returns the first element of the queue.
+            pop_many: Removes and returns the first elements of the queue.
+    """
+
+    OVERFLOW_POLICIES = ('reject', 'overwrite', 'block')
+
+    def __init__(self, capacity: int, overflow: str = 'reject', typecode: Optional[str] = None):
+        """ Initializes the queue.
+
+            Args:
+                capacity (int): The maximum size of the queue.
+                overflow (str): What to do when pushing to a full queue, one of 'reject', 'overwrite' or 'block'.
+                typecode (Optional[str]): `array` typecode of the values, None to store any python object.
+
+            Raises:
+                ValueError: If capacity is less than 1 or overflow is not a known policy.
+        """
+        if capacity < 1:
+            raise ValueError('Capacity must be at least 1.')
+        if overflow not in self.OVERFLOW_POLICIES:
+            raise ValueError(f'Overflow policy must be one of {self.OVERFLOW_POLICIES}.')
+
+        self._typecode = typecode
+        self._buffer: MutableSequence[T] = array(typecode, [0]) * capacity if typecode else [None] * capacity
+        self._head = 0
+        self._size = 0
+        self._overflow = overflow
+        self._not_full = threading.Condition() if overflow == 'block' else None
+
+    @property
+    def size(self) -> int:
+        """ Returns the size of the queue. """
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        """ Returns the maximum size of the queue. """
+        return len(self._buffer)
+
+    def is_empty(self) -> bool:
+        """ Returns whether the queue is empty.
+
+            Returns:
+                (bool) Whether the queue is empty.
+        """
+        return self._size == 0
+
+    def is_full(self) -> bool:
+        """ Returns whether the queue is full.
+
+            Returns:
+                (bool) Whether the queue is full.
+        """
+        return self._size == len(self._buffer)
+
+    def peek(self) -> T:
+        """ Returns the first element of the queue without removing it.
+
+            Raises:
+                IndexError: If the queue is empty.
+
+            Returns:
+                (T) The first element of the queue.
+        """
+        if self.is_empty():
+            raise IndexError('Queue is empty.')
+
+        return self._buffer[self._head]
+
+    def _push(self, val: T) -> None:
+        """ Adds a value to the back of the queue, applying the reject or overwrite policy when full.
+
+            Args:
+                val (T): The value to add to the back of the queue.
+        """
+        capacity = len(self._buffer)
+        if self._size == capacity:
+            if self._overflow == 'reject':
+                raise IndexError('Queue is full.')
+
+            # Overwrite the oldest element, which is where the new tail is
+            self._buffer[self._head] = val
+            self._head = (self._head + 1) % capacity
+            return
+
+        self._buffer[(self._head + self._size) % capacity] = val
+        self._size += 1
+
+    def push(self, val: T, timeout: Optional[float] = None) -> None:
+        """ Adds a value to the back of the queue.
+
+            Args:
+                val (T): The value to add to the back of the queue.
+                timeout (Optional[float]): With the block policy, the maximum number of seconds to wait for room.
+
+            Raises:
+                IndexError: If the queue is full and the policy is reject, or the block policy timed out.
+        """
+        if self._not_full is None:
+            self._push(val)
+            return
+
+        with self._not_full:
+            if not self._not_full.wait_for(lambda: self._size < len(self._buffer), timeout):
+                raise IndexError('Queue is full.')
+
+            self._push(val)
+
+    def _write(self, start: int, values: List[T]) -> None:
+        """ Copies values into the buffer from start, wrapping around its end.
+
+            Args:
+                start (int): The buffer index to copy the first value to.
+                values (List[T]): The values to copy, no more than the capacity.
+        """
+        capacity = len(self._buffer)
+        first = min(len(values), capacity - start)
+        self._buffer[start:start + first] = self._as_buffer(values[:first])
+        self._buffer[:len(values) - first] = self._as_buffer(values[first:])
+
+    def _as_buffer(self, values: List[T]) -> MutableSequence[T]:
+        """ Converts values to the type of the buffer so they can be slice assigned into it.
+
+            Args:
+                values (List[T]): The values to convert.
+        """
+        return array(self._typecode, values) if self._typecode else values
+
+    def push_many(self, values: Iterable[T], timeout: Optional[float] = None) -> None:
+        """ Adds values to the back of the queue, copying them into the buffer in at most two blocks.
+
+            With the reject policy nothing is pushed unless every value fits. With the overwrite policy
+            only the newest values are kept. With the block policy values are pushed as room frees up.
+
+            Args:
+                values (Iterable[T]): The values to add to the back of the queue.
+                timeout (Optional[float]): With the block policy, the maximum number of seconds to wait for room
+                    for each value.
+
+            Raises:
+                IndexError: If the values do not fit and the policy is reject, or the block policy timed out.
+        """
+        values = list(values)
+
+        if self._not_full is not None:
+            for val in values:
+                self.push(val, timeout=timeout)
+            return
+
+        capacity = len(self._buffer)
+        free = capacity - self._size
+        if len(values) > free:
+            if self._overflow == 'reject':
+                raise IndexError('Queue is full.')
+
+            # Drop the oldest elements, both queued and pushed, so that only the newest elements fit
+            values = values[-capacity:]
+            dropped = len(values) - free
+            self._head = (self._head + dropped) % capacity
+            self._size -= dropped
+
+        self._write((self._head + self._size) % capacity, values)
+        self._size += len(values)
+
+    def _pop(self) -> T:
+        """ Removes and returns the first element of the queue.
+
+            Raises:
+                IndexError: If the queue is empty.
+
+            Returns:
+                (T) The first element of the queue.
+        """
+        if self.is_empty():
+            raise IndexError('Queue is empty.')
+
+        val = self._buffer[self._head]
+        if self._typecode is None:
+            # Drop the reference so the value can be garbage collected
+            self._buffer[self._head] = None
+
+        self._head = (self._head + 1) % len(self._buffer)
+        self._size -= 1
+
+        return val
+
+    def pop(self) -> T:
+        """ Removes and returns the first element of the queue.
+
+            Raises:
+                IndexError: If the queue is empty.
+
+            Returns:
+                (T) The first element of the queue.
+        """
+        if self._not_full is None:
+            return self._pop()
+
+        with self._not_full:
+            val = self._pop()
+            self._not_full.notify()
+
+            return val
+
+    def _pop_many(self, count: int) -> List[T]:
+        """ Removes and returns up to count elements from the front of the queue.
+
+            Args:
+                count (int): The maximum number of elements to remove.
+
+            Returns:
+                (List[T]) The removed elements, first element first.
+        """
+        count = min(count, self._size)
+        capacity = len(self._buffer)
+
+        first = min(count, capacity - self._head)
+        ret = list(self._buffer[self._head:self._head + first])
+        ret.extend(self._buffer[:count - first])
+
+        if self._typecode is None:
+            self._buffer[self._head:self._head + first] = [None] * first
+            self._buffer[:count - first] = [None] * (count - first)
+
+        self._head = (self._head + count) % capacity
+        self._size -= count
+
+        return ret
+
+    def pop_many(self, count: int) -> List[T]:
+        """ Removes and returns up to count elements from the front of the queue.
+
+            Example:
+                >>> queue = RingBufferQueue(4)
+                >>> queue.push_many([1, 2, 3])
+                >>> queue.pop_many(2)
+                [1, 2]
+                >>> queue.pop_many(-1)
+                Traceback (most recent call last):
+                    ...
+                ValueError: Count must not be negative.
+                >>> queue.pop_many(5), len(queue)
+                ([3], 0)
+
+            Args:
+                count (int): The maximum number of elements to remove.
+
+            Raises:
+                ValueError: If count is negative.
+
+            Returns:
+                (List[T]) The removed elements, first element first. Shorter than count if the queue ran out.
+        """
+        if count < 0:
+            raise ValueError('Count must not be negative.')
+
+        if self._not_full is None:
+            return self._pop_many(count)
+
+        with self._not_full:
+            ret = self._pop_many(count)
+            self._not_full.notify(len(ret))
+
+            return ret
+
+    def __iter__(self) -> Iterator[T]:
+        capacity = len(self._buffer)
+        for i in range(self._size):
+            yield self._buffer[(self._head + i) % capacity]
+
+    def __str__(self) -> str:
+        return str(list(self))
+
+    def __repr__(self) -> str:
+        return f'RingBufferQueue({list(self)}, capacity={self.capacity})'
+
+    def __len__(self) -> int:
+        return self.size
+
+
+class MinMaxQueue(Generic[T]):
+    """ A queue that supports getting the minimum and maximum value in O(1) time.
+
+        Values are pushed onto an inbox stack and popped from an outbox stack. When the outbox runs out,
+        the inbox is moved over in one pass, reversing it into queue order, so every value is moved once
+        and every operation is amortized O(1). Both stacks are MinMaxStacks, so the extremes of the queue
+        are the extremes of the two stacks.
+
+        Private Attributes:
+            _in (MinMaxStack): The inbox, with the back of the queue on top.
+            _out (MinMaxStack): The outbox, with the front of the queue on top.
+
+        Methods:
+            is_empty: Returns whether the queue is empty.
+            peek: Returns the first element of the queue.
+            push: Adds a value to the back of the queue.
+            pop: Removes and returns the first element of the queue.
+            get_min: Gets the minimum value in the queue.
+            get_max: Gets the maximum value in the queue.
+    """
+
+    def __init__(self, values: Optional[Iterable[T]] = None):
+        """ Initializes the queue.
+
+            Args:
+                values (Optional[Iterable[T]]): Values to fill the queue with, front first.
+        """
+        self._in: MinMaxStack = MinMaxStack()
+        self._out: MinMaxStack = MinMaxStack()
+
+        if values is not None:
+            self._in.push_many(values)
+
+    @property
+    def size(self) -> int:
+        """ Returns the size of the queue. """
+        return len(self._in) + len(self._out)
+
+    def _transfer(self) -> None:
+        """ Moves the inbox onto the outbox once the outbox is empty. """
+        if len(self._out) or not len(self._in):
+            return
+
+        self._out.push_many(self._in.pop_many(len(self._in)))
+
+    def is_empty(self) -> bool:
+        """ Returns whether the queue is empty.
+
+            Returns:
+                (bool) Whether the queue is empty.
+        """
+        return self.size == 0
+
+    def peek(self) -> T:
+        """ Returns the first element of the queue without removing it.
+
+            Raises:
+                IndexError: If the queue is empty.
+
+            Returns:
+                (T) The first element of the queue.
+        """
+        if self.is_empty():
+            raise IndexError('Queue is empty.')
+
+        self._transfer()
+
+        return self._out.top()
+
+    def push(self, val: T) -> None:
+        """ Adds a value to the back of the queue.
+
+            Args:
+                val (T): The value to add.
+        """
+        self._in.push(val)
+
+    def pop(self) -> T:
+        """ Removes and returns the first element of the queue.
+
+            Raises:
+                IndexError: If the queue is empty.
+
+            Returns:
+                (T) The first element of the queue.
+        """
+        if self.is_empty():
+            raise IndexError('Queue is empty.')
+
+        self._transfer()
+
+        val = self._out.top()
+        self._out.pop()
+
+        return val
+
+    def get_min(self) -> T:
+        """ Gets the minimum value in the queue.
+
+            Raises:
+                IndexError: If the queue is empty.
+
+            Returns:
+                (T) The minimum value in the queue.
+        """
+        if not len(self._out):
+            if not len(self._in):
+                raise IndexError('Queue is empty.')
+            return self._in.get_min()
+        if not len(self._in):
+            return self._out.get_min()
+
+        return min(self._out.get_min(), self._in.get_min())
+
+    def get_max(self) -> T:
+        """ Gets the maximum value in the queue.
+
+            Raises:
+                IndexError: If the queue is empty.
+
+            Returns:
+                (T) The maximum value in the queue.
+        """
+        if not len(self._out):
+            if not len(self._in):
+                raise IndexError('Queue is empty.')
+            return self._in.get_max()
+        if not len(self._in):
+            return self._out.get_max()
+
+        return max(self._out.get_max(), self._in.get_max())
+
+    def __iter__(self) -> Iterator[T]:
+        return chain(reversed(self._out), self._in)
+
+    def __str__(self) -> str:
+        return str(list(self))
+
+    def __repr__(self) -> str:
+        return f'MinMaxQueue({list(self)})'
+
+    def __len__(self) -> int:
+        return self.size
+
+
+def sliding_window_extrema(values: Iterable[T], window: int) -> Iterator[Tuple[T, T]]:
+    """ Lazily yields the minimum and maximum of every run of `window` consecutive values.
+
+        Rather than popping from a MinMaxQueue, the window is tracked with two monotonic deques of
+        (index, value) pairs, increasing for the minimum and decreasing for the maximum. A new value drops
+        every value it beats from the back of each deque, and values that slid out of the window are
+        dropped from the front, so the extremes are always at the front. Any iterable, including an
+        endless stream, is handled in O(window) memory and amortized O(1) time per value.
+
+        Example:
+            >>> list(sliding_window_extrema([4, 2, 12, 3, 8], 3))
+            [(2, 12), (2, 12), (3, 12)]
+
+        Args:
+            values (Iterable[T]): The values to slide the window over.
+            window (int): The number of values in every window.
+
+        Raises:
+            ValueError: If window is less than 1.
+
+        Yields:
+            (Tuple[T, T]) The minimum and maximum of each full window, in order.
+    """
+    if window < 1:
+        raise ValueError('Window must be at least 1.')
+
+    return _sliding_window_extrema(values, window)
+
+
+def _sliding_window_extrema(values: Iterable[T], window: int) -> Iterator[Tuple[T, T]]:
+    """ Generator behind sliding_window_extrema, split out so an invalid window raises at the call.
+
+        Args:
+            values (Iterable[T]): The values to slide the window over.
+            window (int): The number of values in every window, at least 1.
+
+        Yields:
+            (Tuple[T, T]) The minimum and maximum of each full window, in order.
+    """
+    minimums: Deque[Tuple[int, T]] = deque()
+    maximums: Deque[Tuple[int, T]] = deque()
+
+    for index, val in enumerate(values):
+        while minimums and val < minimums[-1][1]:
+            minimums.pop()
+        minimums.append((index, val))
+
+        while maximums and maximums[-1][1] < val:
+            maximums.pop()
+        maximums.append((index, val))
+
+        start = index - window + 1
+        if start < 0:
+            continue
+
+        if minimums[0][0] < start:
+            minimums.popleft()
+        if maximums[0][0] < start:
+            maximums.popleft()
+
+        yield minimums[0][1], maximums[0][1]
@@ -0,0 +1,257 @@
+# coding: utf-8
+
+from __future__ import annotations
+
+import random
+from typing import Generic, Iterable, Iterator, List, Optional, TypeVar
+
+
+__all__ = [
+    'SkipList',
+]
+
+
+T = TypeVar('T')
+
+
+class SkipList(Generic[T], Iterable):
+    """ Skip list implementation of an ordered set.
+
+        The bottom level is a sorted singly linked list, and every node is also linked into each of
+        the levels above it with probability 1/2 per level. Searches start on the sparsest level and
+        drop down a level whenever the next node overshoots, so insert, remove and lookups take
+        expected O(log n) no matter the order values arrive in.
+
+        Attributes:
+            _head (SkipList.Node): Sentinel node linking to the first node of every level.
+            _level (int): Number of levels currently in use.
+            _size (int): Number of values in list.
+            _random (random.Random): Source of node levels.
+    """
+
+    MAX_LEVEL: int = 32
+
+    class Node:
+        """ Node class for SkipList.
+
+            Attributes:
+                value (T): Value of node.
+                next (List[Optional[SkipList.Node]]): Next node in each level the node is linked into.
+        """
+        __slots__ = ('value', 'next')
+
+        value: T
+        next: List[Optional[SkipList.Node]]
+
+        def __init__(self, value: T, level: int):
+            self.value = value
+            self.next = [None] * level
+
+        def __repr__(self) -> str:
+            """ Representation of Node. """
+            return f'<Node value={self.value} next={self.next[0].value if self.next[0] else None}>'
+
+    _head: Node
+    _level: int
+    _size: int
+    _random: random.Random
+
+    def __init__(self, value: Optional[Iterable[T]] = None, seed: Optional[int] = None):
+        """ Initializes the skip list.
+
+            Args:
+                value (Optional[Iterable[T]]): Values to fill the list with.
+                seed (Optional[int]): Seed for the node levels, to make the layout reproducible.
+        """
+        self._head = SkipList.Node(None, SkipList.MAX_LEVEL)
+        self._level = 1
+        self._size = 0
+        self._random = random.Random(seed)
+
+        if value is not None:
+            for val in value:
+                self.insert(val)
+
+    def __str__(self) -> str:
+        """ String representation of SkipList. """
+        return str(self.to_list())
+
+    def __repr__(self) -> str:
+        """ Representation of SkipList. """
+        return f'SkipList ({self.__str__()})'
+
+    def __len__(self) -> int:
+        """ Length of SkipList. """
+        return self._size
+
+    def __iter__(self) -> Iterator[T]:
+        """ Iterator for SkipList in sorted order. """
+        node = self._head.next[0]
+        while node is not None:
+            yield node.value
+            node = node.next[0]
+
+    def __contains__(self, value: T) -> bool:
+        """ Whether or not value is in SkipList. """
+        return self.search(value)
+
+    def to_list(self) -> List[T]:
+        """ Convert skip list to python list.
+
+            Returns:
+                List[T]: Sorted python list of values.
+        """
+        return list(self)
+
+    def _random_level(self) -> int:
+        """ Number of levels for a new node, where each extra level has probability 1/2. """
+        level = 1
+        bits = self._random.getrandbits(SkipList.MAX_LEVEL - 1)
+        while bits & 1:
+            level += 1
+            bits >>= 1
+
+        return level
+
+    def _predecessors(self, value: T) -> List[Node]:
+        """ Last node before value on every level in use.
+
+            Args:
+                value (T): Value to search for.
+
+            Returns:
+                List[SkipList.Node]: Predecessor of value per level, starting at the bottom level.
+        """
+        predecessors: List[SkipList.Node] = [self._head] * self._level
+
+        node = self._head
+        for level in range(self._level - 1, -1, -1):
+            while node.next[level] is not None and node.next[level].value < value:
+                node = node.next[level]
+            predecessors[level] = node
+
+        return predecessors
+
+    def _last_before(self, value: T, inclusive: bool) -> Node:
+        """ Last node with a value less than value, or less than or equal to value if inclusive.
+
+            Args:
+                value (T): Value to search for.
+                inclusive (bool): Whether or not a node equal to value counts as before it.
+
+            Returns:
+                SkipList.Node: Found node, or the head sentinel if there is none.
+        """
+        node = self._head
+        for level in range(self._level - 1, -1, -1):
+            while node.next[level] is not None and (
+                    node.next[level].value < value or (inclusive and node.next[level].value == value)):
+                node = node.next[level]
+
+        return node
+
+    def insert(self, value: T) -> None:
+        """ Insert value into list, in expected O(log n). Values already in the list are ignored.
+
+            Args:
+                value (T): Value to insert.
+        """
+        predecessors = self._predecessors(value)
+        successor = predecessors[0].next[0]
+        if successor is not None and successor.value == value:
+            return
+
+        level = self._random_level()
+        if level > self._level:
+            predecessors.extend([self._head] * (level - self._level))
+            self._level = level
+
+        new_node = SkipList.Node(value, level)
+        for i in range(level):
+            new_node.next[i] = predecessors[i].next[i]
+            predecessors[i].next[i] = new_node
+
+        self._size += 1
+
+    def remove(self, value: T) -> T:
+        """ Remove value from list, in expected O(log n).
+
+            Args:
+                value (T): Value to remove.
+
+            Raises:
+                IndexError: If value is not in list.
+
+            Returns:
+                T: Value removed.
+        """
+        predecessors = self._predecessors(value)
+        node = predecessors[0].next[0]
+        if node is None or node.value != value:
+            raise IndexError(f'No element of value {value}')
+
+        for i in range(len(node.next)):
+            predecessors[i].next[i] = node.next[i]
+
+        while self._level > 1 and self._head.next[self._level - 1] is None:
+            self._level -= 1
+
+        self._size -= 1
+
+        return node.value
+
+    def search(self, value: T) -> bool:
+        """ Search for value in list, in expected O(log n).
+
+            Args:
+                value (T): Value to search for.
+
+            Returns:
+                bool: Whether or not value is in list.
+        """
+        node = self._last_before(value, inclusive=False).next[0]
+
+        return node is not None and node.value == value
+
+    def floor(self, value: T) -> Optional[T]:
+        """ Largest value in list less than or equal to value.
+
+            Args:
+                value (T): Value to find the floor of.
+
+            Returns:
+                Optional[T]: Floor of value, or None if every value in list is larger.
+        """
+        node = self._last_before(value, inclusive=True)
+
+        return node.value if node is not self._head else None
+
+    def ceiling(self, value: T) -> Optional[T]:
+        """ Smallest value in list greater than or equal to value.
+
+            Args:
+                value (T): Value to find the ceiling of.
+
+            Returns:
+                Optional[T]: Ceiling of value, or None if every value in list is smaller.
+        """
+        node = self._last_before(value, inclusive=False).next[0]
+
+        return node.value if node is not None else None
+
+    def range(self, low: T, high: T) -> Iterator[T]:
+        """ Lazily iterate in order over values between low and high inclusive.
+
+            Finding low takes expected O(log n), after which values are read off the bottom level.
+
+            Args:
+                low (T): Lower bound of range.
+                high (T): Upper bound of range.
+
+            Yields:
+                T: Values in range in sorted order.
+        """
+        node = self._last_before(low, inclusive=False).next[0]
+        while node is not None and node.value <= high:
+            yield node.value
+            node = node.next[0]
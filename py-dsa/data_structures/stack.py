@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TypeVar, List
+from typing import Dict, Iterable, Iterator, List, TypeVar
 
 
 __all__ = [
-    'MinStack',
     'MaxStack',
+    'MinMaxStack',
+    'MinStack',
 ]
 
 T = TypeVar('T')
@@ -19,7 +20,9 @@ class _StackBase(ABC):
 
         Methods:
             push: Pushes a value to the stack.
+            push_many: Pushes values to the stack.
             pop: Pops the top value from the stack.
+            pop_many: Pops and returns the top values from the stack.
             top: Gets the top value in the stack.
     """
 
@@ -47,17 +50,56 @@ class _StackBase(ABC):
         """
         pass
 
+    @abstractmethod
+    def __len__(self) -> int:
+        """ Length of the stack. """
+        pass
+
+    def push_many(self, values: Iterable[T]) -> None:
+        """ Pushes values to the stack, in order.
+
+            Args:
+                values (Iterable[T]): The values to push to the stack.
+        """
+        for val in values:
+            self.push(val)
+
+    def pop_many(self, count: int) -> List[T]:
+        """ Pops and returns up to count values from the top of the stack.
+
+            Args:
+                count (int): The maximum number of values to pop.
+
+            Returns:
+                (List[T]) The popped values, top value first. Shorter than count if the stack ran out.
+        """
+        ret: List[T] = []
+        for _ in range(min(count, len(self))):
+            ret.append(self.top())
+            self.pop()
+
+        return ret
+
 
 class MinStack(_StackBase):
     """ A stack that supports getting the minimum value in O(1) time.
 
+        The minimums are run-length encoded: a new entry is only added for a value smaller than the
+        current minimum, and pushing a value equal to it increments its count instead. Counts are only
+        stored for minimums that repeat, so a run of equal values costs one entry rather than one per
+        value, and a descending run costs no more than one entry per value.
+
         Private Attributes:
             _stack (List[T]): The stack.
             _min_stack (List[T]): The stack of minimum values.
+            _min_counts (Dict[int, int]): How many values in the stack equal each minimum value that more
+                than one value equals, keyed by its index in _min_stack.
         
         Methods:
             push: Pushes a value to the stack.
+            push_many: Pushes values to the stack.
             pop: Pops the top value from the stack.
+            pop_many: Pops and returns the top values from the stack.
             top: Gets the top value in the stack.
             get_min: Gets the minimum value in the stack.
     """
@@ -65,6 +107,7 @@ class MinStack(_StackBase):
     def __init__(self):
         self._stack: List[T] = []
         self._min_stack: List[T] = []
+        self._min_counts: Dict[int, int] = {}
     
     def push(self, val: T) -> None:
         """ Pushes a value to the stack.
@@ -73,15 +116,22 @@ class MinStack(_StackBase):
                 val (T): The value to push to the stack.
         """
         self._stack.append(val)
-        if len(self._min_stack) == 0 or val <= self._min_stack[-1]:
+        if len(self._min_stack) == 0 or val < self._min_stack[-1]:
             self._min_stack.append(val)
+        elif val == self._min_stack[-1]:
+            last = len(self._min_stack) - 1
+            self._min_counts[last] = self._min_counts.get(last, 1) + 1
     
     def pop(self) -> None:
         """ Pops the top value from the stack.
         """
-        if self._stack[-1] == self._min_stack[-1]:
-            self._min_stack.pop()
-        self._stack.pop()
+        if self._stack.pop() == self._min_stack[-1]:
+            last = len(self._min_stack) - 1
+            count = self._min_counts.pop(last, 1)
+            if count > 1:
+                self._min_counts[last] = count - 1
+            else:
+                self._min_stack.pop()
     
     def top(self) -> T:
         """ Gets the top value in the stack.
@@ -103,24 +153,36 @@ class MinStack(_StackBase):
         """ Representation of MinStack. """
         return f"MinStack: {self._stack}"
 
+    def __len__(self) -> int:
+        """ Length of MinStack. """
+        return len(self._stack)
+
 
 class MaxStack(_StackBase):
     """ A stack that supports getting the maximum value in O(1) time.
+
+        The maximums are run-length encoded: a new entry is only added for a value larger than the
+        current maximum, and pushing a value equal to it increments its count instead.
     
         Private Attributes:
             _stack (List[T]): The stack.
             _max_stack (List[T]): The stack of maximum values.
+            _max_counts (Dict[int, int]): How many values in the stack equal each maximum value that more
+                than one value equals, keyed by its index in _max_stack.
         
         Methods:
             push: Pushes a value to the stack.
+            push_many: Pushes values to the stack.
             pop: Pops the top value from the stack.
+            pop_many: Pops and returns the top values from the stack.
             top: Gets the top value in the stack.
             get_max: Gets the maximum value in the stack.
     """
 
     def __init__(self) -> None:
-        self._stack = []
-        self._max_stack = []
+        self._stack: List[T] = []
+        self._max_stack: List[T] = []
+        self._max_counts: Dict[int, int] = {}
     
     def push(self, val: T) -> None:
         """ Pushes a value to the stack.
@@ -129,15 +191,22 @@ class MaxStack(_StackBase):
                 val (T): The value to push to the stack.
         """
         self._stack.append(val)
-        if len(self._max_stack) == 0 or val >= self._max_stack[-1]:
+        if len(self._max_stack) == 0 or val > self._max_stack[-1]:
             self._max_stack.append(val)
+        elif val == self._max_stack[-1]:
+            last = len(self._max_stack) - 1
+            self._max_counts[last] = self._max_counts.get(last, 1) + 1
     
     def pop(self) -> None:
         """ Pops the top value from the stack.
         """
-        if self._stack[-1] == self._max_stack[-1]:
-            self._max_stack.pop()
-        self._stack.pop()
+        if self._stack.pop() == self._max_stack[-1]:
+            last = len(self._max_stack) - 1
+            count = self._max_counts.pop(last, 1)
+            if count > 1:
+                self._max_counts[last] = count - 1
+            else:
+                self._max_stack.pop()
     
     def top(self) -> T:
         """ Gets the top value in the stack.
@@ -158,3 +227,125 @@ class MaxStack(_StackBase):
     def __repr__(self) -> str:
         """ Representation of MaxStack. """
         return f"MaxStack: {self._stack}"
+
+    def __len__(self) -> int:
+        """ Length of MaxStack. """
+        return len(self._stack)
+
+
+class MinMaxStack(_StackBase):
+    """ A stack that supports getting both the minimum and maximum value in O(1) time.
+
+        Holds every value once and updates both run-length encoded extremes as it is pushed, instead of
+        pairing a MinStack with a MaxStack that each hold every value.
+
+        Private Attributes:
+            _stack (List[T]): The stack.
+            _min_stack (List[T]): The stack of minimum values.
+            _min_counts (Dict[int, int]): How many values in the stack equal each minimum value that more
+                than one value equals, keyed by its index in _min_stack.
+            _max_stack (List[T]): The stack of maximum values.
+            _max_counts (Dict[int, int]): How many values in the stack equal each maximum value that more
+                than one value equals, keyed by its index in _max_stack.
+
+        Methods:
+            push: Pushes a value to the stack.
+            push_many: Pushes values to the stack.
+            pop: Pops the top value from the stack.
+            pop_many: Pops and returns the top values from the stack.
+            top: Gets the top value in the stack.
+            get_min: Gets the minimum value in the stack.
+            get_max: Gets the maximum value in the stack.
+    """
+
+    def __init__(self) -> None:
+        self._stack: List[T] = []
+        self._min_stack: List[T] = []
+        self._min_counts: Dict[int, int] = {}
+        self._max_stack: List[T] = []
+        self._max_counts: Dict[int, int] = {}
+
+    def push(self, val: T) -> None:
+        """ Pushes a value to the stack.
+
+            Args:
+                val (T): The value to push to the stack.
+        """
+        if len(self._stack) == 0:
+            self._min_stack.append(val)
+            self._max_stack.append(val)
+        else:
+            if val < self._min_stack[-1]:
+                self._min_stack.append(val)
+            elif val == self._min_stack[-1]:
+                last = len(self._min_stack) - 1
+                self._min_counts[last] = self._min_counts.get(last, 1) + 1
+
+            if val > self._max_stack[-1]:
+                self._max_stack.append(val)
+            elif val == self._max_stack[-1]:
+                last = len(self._max_stack) - 1
+                self._max_counts[last] = self._max_counts.get(last, 1) + 1
+
+        self._stack.append(val)
+
+    def pop(self) -> None:
+        """ Pops the top value from the stack.
+        """
+        val = self._stack.pop()
+
+        if val == self._min_stack[-1]:
+            last = len(self._min_stack) - 1
+            count = self._min_counts.pop(last, 1)
+            if count > 1:
+                self._min_counts[last] = count - 1
+            else:
+                self._min_stack.pop()
+
+        if val == self._max_stack[-1]:
+            last = len(self._max_stack) - 1
+            count = self._max_counts.pop(last, 1)
+            if count > 1:
+                self._max_counts[last] = count - 1
+            else:
+                self._max_stack.pop()
+
+    def top(self) -> T:
+        """ Gets the top value in the stack.
+
+            Returns:
+                (T) The top value in the stack.
+        """
+        return self._stack[-1]
+
+    def get_min(self) -> T:
+        """ Gets the minimum value in the stack.
+
+            Returns:
+                (T) The minimum value in the stack.
+        """
+        return self._min_stack[-1]
+
+    def get_max(self) -> T:
+        """ Gets the maximum value in the stack.
+
+            Returns:
+                (T) The maximum value in the stack.
+        """
+        return self._max_stack[-1]
+
+    def __iter__(self) -> Iterator[T]:
+        """ Iterator over MinMaxStack from bottom to top. """
+        return iter(self._stack)
+
+    def __reversed__(self) -> Iterator[T]:
+        """ Iterator over MinMaxStack from top to bottom. """
+        return reversed(self._stack)
+
+    def __repr__(self) -> str:
+        """ Representation of MinMaxStack. """
+        return f"MinMaxStack: {self._stack}"
+
+    def __len__(self) -> int:
+        """ Length of MinMaxStack. """
+        return len(self._stack)
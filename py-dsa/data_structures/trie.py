@@ -2,86 +2,573 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
+import heapq
+from collections import defaultdict, deque
+from typing import Deque, Iterable, Iterator, List, Optional, Tuple
 
+from .compact_trie import FrozenTrie
 
-__all__ = ['Trie']
+
+__all__ = ['AhoCorasick', 'Trie']
 
 
 class _TrieNode(defaultdict):
-    """ A node in a trie.
+    """ A node in a trie. Missing children are created as nodes of the same class, so subclasses of the
+        node extend every node of a trie.
 
         Attributes:
-            is_word (bool): Whether or not the node represents a word.
+            count (int): How many times the word the node represents was inserted, 0 if it is not a word.
+            best (int): The largest count of any word in the subtree of the node.
     """
-    is_word: bool
+    __slots__ = ('count', 'best')
+
+    count: int
+    best: int
 
     def __init__(self):
-        super().__init__(_TrieNode)
-        self.is_word = False
+        super().__init__(type(self))
+        self.count = 0
+        self.best = 0
+
+    @property
+    def is_word(self) -> bool:
+        """ Whether or not the node represents a word. """
+        return self.count > 0
 
 
 class Trie:
     """ A trie implementation.
 
+        Every node counts how many times its word was inserted and caches the largest count in its subtree,
+        which lets `top_k` find the most frequent completions of a prefix without visiting every word.
+
         Attributes:
             _nodes (Dict[str, dict]): The nodes in the trie.
-        
+            _size (int): The number of distinct words in the trie.
+
         Methods:
             insert: Inserts a word into the trie.
+            insert_many: Inserts words into the trie, sharing walks between words that extend each other.
+            delete: Deletes a word from the trie.
             search: Searches for a word in the trie.
+            search_many: Searches for words in the trie, sharing walks between words that extend each other.
             starts_with: Searches for a prefix in the trie.
+            count: Gets how many times a word was inserted.
+            iter_prefix: Iterates over the words starting with a prefix.
+            top_k: Gets the most frequently inserted words starting with a prefix.
+            fuzzy_search: Gets the words within an edit distance of a word.
+            freeze: Packs the trie into an immutable FrozenTrie.
     """
 
     def __init__(self):
         self._nodes: _TrieNode = _TrieNode()
+        self._size = 0
+
+    def _find(self, prefix: str) -> Optional[_TrieNode]:
+        """ Finds the node of a prefix without creating any node.
 
-    def insert(self, word: str) -> None:
+            Args:
+                prefix (str): The prefix to find.
+
+            Returns:
+                (Optional[_TrieNode]) The node of the prefix, or None if it is not in the trie.
+        """
+        current_mapping: Optional[_TrieNode] = self._nodes
+        for letter in prefix:
+            current_mapping = current_mapping.get(letter)
+            if current_mapping is None:
+                return None
+
+        return current_mapping
+
+    def _add(self, path: List[_TrieNode], count: int) -> None:
+        """ Adds count to the word at the end of path and raises the cached best counts above it.
+
+            Args:
+                path (List[_TrieNode]): The nodes from the root to the node of the word.
+                count (int): How many times to count the word.
+        """
+        node = path[-1]
+        if node.count == 0:
+            self._size += 1
+
+        node.count += count
+        for ancestor in reversed(path):
+            if ancestor.best >= node.count:
+                break
+            ancestor.best = node.count
+
+    def insert(self, word: str, count: int = 1) -> None:
         """ Inserts a word into the trie.
 
             Args:
                 word (str): The word to insert.
+                count (int): How many times to count the word.
+
+            Raises:
+                ValueError: If count is less than 1.
         """
+        if count < 1:
+            raise ValueError('Count must be at least 1.')
+
         current_mapping: _TrieNode = self._nodes
+        path = [current_mapping]
         for letter in word:
             current_mapping = current_mapping[letter]
+            path.append(current_mapping)
+
+        self._add(path, count)
 
-        current_mapping.is_word = True
+    def insert_many(self, words: Iterable[str]) -> None:
+        """ Inserts words into the trie, once per occurrence.
+
+            A word that extends the word before it, like the next of a run of growing prefixes, only walks
+            down its new letters.
+
+            Args:
+                words (Iterable[str]): The words to insert.
+        """
+        path = [self._nodes]
+        previous = ''
+
+        for word in words:
+            if word.startswith(previous):
+                rest = word[len(previous):]
+            else:
+                del path[1:]
+                rest = word
+
+            current_mapping = path[-1]
+            for letter in rest:
+                current_mapping = current_mapping[letter]
+                path.append(current_mapping)
+
+            self._add(path, 1)
+            previous = word
+
+    def delete(self, word: str) -> None:
+        """ Deletes a word from the trie, whatever its count, along with the nodes only it used.
+
+            Args:
+                word (str): The word to delete.
+
+            Raises:
+                IndexError: If the word is not in the trie.
+        """
+        current_mapping: Optional[_TrieNode] = self._nodes
+        path = [current_mapping]
+        for letter in word:
+            current_mapping = current_mapping.get(letter)
+            if current_mapping is None:
+                raise IndexError(f'No element of value {word}')
+            path.append(current_mapping)
+
+        if not current_mapping.is_word:
+            raise IndexError(f'No element of value {word}')
+
+        current_mapping.count = 0
+        self._size -= 1
+
+        for depth in range(len(path) - 1, -1, -1):
+            node = path[depth]
+            if depth > 0 and not node and node.count == 0:
+                del path[depth - 1][word[depth - 1]]
+                continue
+
+            best = max([node.count] + [child.best for child in node.values()])
+            if best == node.best:
+                break
+            node.best = best
 
     def search(self, word: str) -> bool:
         """ Searches for a word in the trie.
-        
+
             Args:
                 word (str): The word to search for.
-        
+
             Returns:
                 (bool) Whether or not the word is in the trie.
         """
-        current_mapping: _TrieNode = self._nodes
+        current_mapping = self._find(word)
 
-        for letter in word:
-            if letter not in current_mapping:
-                return False
-            
-            current_mapping = current_mapping[letter]
+        return current_mapping is not None and current_mapping.is_word
+
+    def search_many(self, words: Iterable[str]) -> List[bool]:
+        """ Searches for words in the trie.
+
+            A word that extends the word before it, like the prefixes a user types one letter at a time, only
+            walks down its new letters, and is known to be missing without any walk if the word before it
+            was not even a prefix in the trie.
+
+            Args:
+                words (Iterable[str]): The words to search for.
+
+            Returns:
+                (List[bool]) Whether or not each word is in the trie, in the order of words.
+        """
+        found: List[bool] = []
+
+        current_mapping: Optional[_TrieNode] = self._nodes
+        previous = ''
+
+        for word in words:
+            if word.startswith(previous):
+                if current_mapping is None:
+                    found.append(False)
+                    previous = word
+                    continue
+                rest = word[len(previous):]
+            else:
+                current_mapping = self._nodes
+                rest = word
+
+            for letter in rest:
+                current_mapping = current_mapping.get(letter)
+                if current_mapping is None:
+                    break
 
-        return current_mapping.is_word
+            found.append(current_mapping is not None and current_mapping.is_word)
+            previous = word
+
+        return found
 
     def starts_with(self, prefix: str) -> bool:
         """ Searches for a prefix in the trie.
-        
+
             Args:
                 prefix (str): The prefix to search for.
-            
+
             Returns:
                 (bool) Whether or not the prefix is in the trie.
         """
-        current_mapping: _TrieNode = self._nodes
+        return self._find(prefix) is not None
 
-        for letter in prefix:
-            if letter not in current_mapping:
-                return False
-            
-            current_mapping = current_mapping[letter]
+    def count(self, word: str) -> int:
+        """ Gets how many times a word was inserted.
+
+            Args:
+                word (str): The word to count.
+
+            Returns:
+                (int) How many times the word was inserted, 0 if it is not in the trie.
+        """
+        current_mapping = self._find(word)
+
+        return current_mapping.count if current_mapping is not None else 0
+
+    def iter_prefix(self, prefix: str = '') -> Iterator[str]:
+        """ Lazily iterates over the words starting with a prefix, in sorted order.
+
+            Args:
+                prefix (str): The prefix of the words.
+
+            Yields:
+                (str) The words starting with prefix.
+        """
+        current_mapping = self._find(prefix)
+        if current_mapping is None:
+            return
+
+        stack: List[Tuple[str, _TrieNode]] = [(prefix, current_mapping)]
+        while stack:
+            word, node = stack.pop()
+            if node.is_word:
+                yield word
+
+            for letter in sorted(node, reverse=True):
+                stack.append((word + letter, node[letter]))
+
+    def top_k(self, prefix: str, k: int) -> List[str]:
+        """ Gets the k most frequently inserted words starting with a prefix, most frequent first and ties in
+            sorted order.
+
+            Searches best first, expanding nodes in order of the best count cached in their subtree, so only
+            the branches that can hold one of the top words are visited.
+
+            Args:
+                prefix (str): The prefix of the words.
+                k (int): The maximum number of words to get.
+
+            Returns:
+                (List[str]) The most frequent words starting with prefix.
+        """
+        current_mapping = self._find(prefix)
+        if current_mapping is None or k <= 0:
+            return []
+
+        ret: List[str] = []
+        heap: List[Tuple[int, str, int, Optional[_TrieNode]]] = [(-current_mapping.best, prefix, 1, current_mapping)]
+        while heap and len(ret) < k:
+            _, word, is_node, node = heapq.heappop(heap)
+            if not is_node:
+                ret.append(word)
+                continue
+
+            if node.is_word:
+                heapq.heappush(heap, (-node.count, word, 0, None))
+            for letter, child in node.items():
+                heapq.heappush(heap, (-child.best, word + letter, 1, child))
+
+        return ret
+
+    def fuzzy_search(self, word: str, max_distance: int) -> List[Tuple[str, int]]:
+        """ Gets the words within a Levenshtein distance of a word.
 
-        return True
+            Walks the trie carrying one row of the edit distance table per node, holding the distances
+            between the prefix of the node and every prefix of word. A row only depends on the row of the
+            parent, so the table is shared by every word below the node, and a subtree is skipped as soon as
+            every distance in its row exceeds max_distance, since extending the prefix can not lower them.
+
+            Args:
+                word (str): The word to compare with.
+                max_distance (int): The largest number of insertions, deletions and substitutions allowed.
+
+            Raises:
+                ValueError: If max_distance is negative.
+
+            Returns:
+                (List[Tuple[str, int]]) The matching words and their distances, closest first and ties in
+                    sorted order.
+        """
+        if max_distance < 0:
+            raise ValueError('Max distance must not be negative.')
+
+        columns = range(1, len(word) + 1)
+        first_row = list(range(len(word) + 1))
+
+        matches: List[Tuple[str, int]] = []
+        if self._nodes.is_word and first_row[-1] <= max_distance:
+            matches.append(('', first_row[-1]))
+
+        stack: List[Tuple[str, _TrieNode, List[int]]] = [
+            (letter, child, first_row) for letter, child in self._nodes.items()
+        ]
+        while stack:
+            prefix, node, previous_row = stack.pop()
+            letter = prefix[-1]
+
+            row = [previous_row[0] + 1]
+            for column in columns:
+                row.append(min(row[column - 1] + 1,
+                               previous_row[column] + 1,
+                               previous_row[column - 1] + (word[column - 1] != letter)))
+
+            if node.is_word and row[-1] <= max_distance:
+                matches.append((prefix, row[-1]))
+
+            if min(row) <= max_distance:
+                for next_letter, child in node.items():
+                    stack.append((prefix + next_letter, child, row))
+
+        matches.sort(key=lambda match: (match[1], match[0]))
+
+        return matches
+
+    def freeze(self) -> FrozenTrie:
+        """ Packs the words of the trie into an immutable FrozenTrie, which can be saved to a file and
+            memory-mapped by other processes. Word counts are not kept.
+
+            Returns:
+                (FrozenTrie) The packed trie.
+        """
+        return FrozenTrie(self)
+
+    def __iter__(self) -> Iterator[str]:
+        """ Iterator over the words of the trie in sorted order. """
+        return self.iter_prefix()
+
+    def __contains__(self, word: str) -> bool:
+        """ Whether or not word is in Trie. """
+        return self.search(word)
+
+    def __len__(self) -> int:
+        """ Number of distinct words in Trie. """
+        return self._size
+
+
+class _AhoCorasickNode(_TrieNode):
+    """ A node in an Aho-Corasick automaton.
+
+        Attributes:
+            fail (Optional[_AhoCorasickNode]): The node of the longest proper suffix of the path of the node that
+                is also a path in the trie, None for the root.
+            link (Optional[_AhoCorasickNode]): The nearest node along the failure links that is a pattern, None if
+                there is none.
+            pattern (Optional[str]): The pattern the node represents, None if it is not a pattern.
+    """
+    __slots__ = ('fail', 'link', 'pattern')
+
+    fail: Optional[_AhoCorasickNode]
+    link: Optional[_AhoCorasickNode]
+    pattern: Optional[str]
+
+    def __init__(self):
+        super().__init__()
+        self.fail = None
+        self.link = None
+        self.pattern = None
+
+
+class AhoCorasick(Trie):
+    """ An Aho-Corasick automaton, a trie of patterns that finds every occurrence of every pattern in a text
+        in one pass.
+
+        Every node links to the node of the longest proper suffix of its path that is also in the trie. When
+        the next letter of the text has no child, the match falls back along these failure links instead of
+        restarting, so each letter is handled in amortized O(1) plus O(1) per reported match. The links are
+        built lazily on the first search after the patterns change. The empty pattern is never reported.
+
+        Example:
+            >>> automaton = AhoCorasick(['he', 'she', 'hers'])
+            >>> automaton.find_all('ushers')
+            [(1, 'she'), (2, 'he'), (2, 'hers')]
+
+        Private Attributes:
+            _built (bool): Whether or not the failure links match the patterns.
+
+        Methods:
+            find_all: Finds every occurrence of every pattern in a text.
+            stream: Starts matching a text given in chunks.
+    """
+
+    class Stream:
+        """ Matches the patterns of an automaton against a text given in chunks, including occurrences that
+            span chunks.
+
+            Private Attributes:
+                _automaton (AhoCorasick): The automaton to match with.
+                _node (_AhoCorasickNode): The node of the longest suffix of the text so far that is in the trie.
+                _position (int): The number of letters fed so far.
+
+            Methods:
+                feed: Matches the next chunk of the text.
+                reset: Starts matching a new text.
+        """
+
+        def __init__(self, automaton: AhoCorasick):
+            self._automaton = automaton
+            self._node = automaton._nodes
+            self._position = 0
+
+        def feed(self, chunk: str) -> List[Tuple[int, str]]:
+            """ Matches the next chunk of the text.
+
+                Args:
+                    chunk (str): The next letters of the text.
+
+                Returns:
+                    (List[Tuple[int, str]]) The position in the whole text where each occurrence ending in
+                        chunk starts, and its pattern, in the order the occurrences end.
+            """
+            self._automaton._build()
+            root = self._automaton._nodes
+
+            matches: List[Tuple[int, str]] = []
+            node = self._node
+            position = self._position
+
+            for letter in chunk:
+                position += 1
+                while letter not in node and node is not root:
+                    node = node.fail
+                node = node.get(letter, root)
+
+                output = node if node.pattern is not None else node.link
+                while output is not None:
+                    matches.append((position - len(output.pattern), output.pattern))
+                    output = output.link
+
+            self._node = node
+            self._position = position
+
+            return matches
+
+        def reset(self) -> None:
+            """ Starts matching a new text, forgetting the letters fed so far.
+            """
+            self._node = self._automaton._nodes
+            self._position = 0
+
+    def __init__(self, patterns: Optional[Iterable[str]] = None):
+        """ Initializes the automaton.
+
+            Args:
+                patterns (Optional[Iterable[str]]): Patterns to fill the automaton with.
+        """
+        super().__init__()
+        self._nodes: _AhoCorasickNode = _AhoCorasickNode()
+        self._built = False
+
+        if patterns is not None:
+            self.insert_many(patterns)
+
+    def _add(self, path: List[_TrieNode], count: int) -> None:
+        """ Adds count to the pattern at the end of path, invalidating the failure links.
+
+            Args:
+                path (List[_TrieNode]): The nodes from the root to the node of the pattern.
+                count (int): How many times to count the pattern.
+        """
+        super()._add(path, count)
+        self._built = False
+
+    def delete(self, word: str) -> None:
+        """ Deletes a pattern from the automaton, invalidating the failure links.
+
+            Args:
+                word (str): The pattern to delete.
+
+            Raises:
+                IndexError: If the pattern is not in the automaton.
+        """
+        super().delete(word)
+        self._built = False
+
+    def _build(self) -> None:
+        """ Sets the failure links, pattern links and patterns of every node, breadth first so the links of
+            every shorter suffix are set before they are needed.
+        """
+        if self._built:
+            return
+
+        root = self._nodes
+        queue: Deque[Tuple[_AhoCorasickNode, str]] = deque()
+        for letter, child in root.items():
+            child.fail = root
+            child.link = None
+            queue.append((child, letter))
+
+        while queue:
+            node, path = queue.popleft()
+            node.pattern = path if node.is_word else None
+
+            for letter, child in node.items():
+                fail = node.fail
+                while letter not in fail and fail is not root:
+                    fail = fail.fail
+
+                child.fail = fail.get(letter, root)
+                child.link = child.fail if child.fail.is_word and child.fail is not root else child.fail.link
+                queue.append((child, path + letter))
+
+        self._built = True
+
+    def stream(self) -> AhoCorasick.Stream:
+        """ Starts matching a text given in chunks.
+
+            Returns:
+                (AhoCorasick.Stream) The matcher to feed the chunks to.
+        """
+        return AhoCorasick.Stream(self)
+
+    def find_all(self, text: str) -> List[Tuple[int, str]]:
+        """ Finds every occurrence of every pattern in a text.
+
+            Args:
+                text (str): The text to search.
+
+            Returns:
+                (List[Tuple[int, str]]) The position where each occurrence starts and its pattern, in the order
+                    the occurrences end.
+        """
+        return self.stream().feed(text)